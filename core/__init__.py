@@ -6,10 +6,23 @@ from core.api_client import APIClient
 from core.base_test import BaseTest
 from core.assertions import APIAssertions
 from core.logger import Logger
+from core.concurrency import ConcurrencyLimiter
+from core.rate_limiter import RateLimiter
+from core.instrument_registry import InstrumentRegistry
+from core.pagination import Paginator
+from core.pin_encryptor import PinEncryptor
+from core.streaming import StreamingResponse, ResponseTooLargeError
 
 __all__ = [
     'APIClient',
     'BaseTest',
     'APIAssertions',
-    'Logger'
+    'Logger',
+    'ConcurrencyLimiter',
+    'RateLimiter',
+    'InstrumentRegistry',
+    'Paginator',
+    'PinEncryptor',
+    'StreamingResponse',
+    'ResponseTooLargeError'
 ]
@@ -8,16 +8,56 @@ import requests
 from requests.adapters import HTTPAdapter
 from urllib3.util.retry import Retry
 from typing import Dict, Optional, Any, Union
-import json
+import logging
+import threading
+import time
+from core.concurrency import ConcurrencyLimiter
+from core.log_sampling import RequestLogSampler
 from core.logger import Logger
+from core.rate_limiter import RateLimiter
+from core.step_profiler import StepProfiler
+from core.streaming import StreamingResponse
+from core.structured_logging import LogContext
+from utils import json_codec
 from utils.config_loader import ConfigLoader
 
 
+class _LazyJSON:
+    """Pretty-prints a value only when a log record is actually formatted."""
+    
+    __slots__ = ('value',)
+    
+    def __init__(self, value: Any):
+        self.value = value
+    
+    def __str__(self) -> str:
+        return json_codec.dumps(self.value, indent=2)
+
+
+class _LazyResponseBody:
+    """Renders a response body (JSON pretty-printed, else truncated text) on demand."""
+    
+    __slots__ = ('response',)
+    
+    def __init__(self, response: requests.Response):
+        self.response = response
+    
+    def __str__(self) -> str:
+        try:
+            return json_codec.dumps(json_codec.parse_response(self.response), indent=2)
+        except json_codec.JSONDecodeError:
+            return f"(text) {self.response.text[:500]}"
+
+
 class APIClient:
     """
     Generic HTTP client for REST API automation.
     Handles GET, POST, PUT, PATCH, DELETE with automatic retry and logging.
     """
+    
+    # Connection pools shared by all clients of an environment (api.shared_pool)
+    _shared_adapters = {}
+    _shared_lock = threading.Lock()
 
     def __init__(self, config: ConfigLoader):
         """
@@ -30,7 +70,14 @@ class APIClient:
         self.logger = Logger.get_logger(__name__)
         self.base_url = config.get('api.base_url')
         self.timeout = config.get('api.timeout', 30)
+        self.shared_pool = config.get('api.shared_pool', False)
+        self.rate_limiter = RateLimiter.get_shared(config)
         self.session = self._create_session()
+        self._owner_thread = threading.get_ident()
+        self._worker_sessions = threading.local()
+        self.concurrency = ConcurrencyLimiter.get_shared(config)
+        self.log_sampler = RequestLogSampler.get_shared(config)
+        self.step_profiler = StepProfiler.get_shared(config)
         self._setup_default_headers()
         
     def _create_session(self) -> requests.Session:
@@ -46,20 +93,72 @@ class APIClient:
         retry_count = self.config.get('api.retry_count', 3)
         retry_delay = self.config.get('api.retry_delay', 2)
         
+        # With client-side rate limiting, 429s are handled in request() so the
+        # re-sent request is paced by the token buckets
+        status_forcelist = [500, 502, 503, 504] if self.rate_limiter.enabled else [429, 500, 502, 503, 504]
+        
         retry_strategy = Retry(
             total=retry_count,
             backoff_factor=retry_delay,
-            status_forcelist=[429, 500, 502, 503, 504],
+            status_forcelist=status_forcelist,
             allowed_methods=["HEAD", "GET", "OPTIONS", "POST", "PUT", "PATCH", "DELETE"]
         )
         
-        adapter = HTTPAdapter(max_retries=retry_strategy)
+        adapter = self._get_adapter(retry_strategy)
         session.mount("http://", adapter)
         session.mount("https://", adapter)
         
         self.logger.info(f"Session created with {retry_count} retries and {retry_delay}s backoff")
         return session
     
+    def _get_adapter(self, retry_strategy: Retry) -> HTTPAdapter:
+        """
+        Get the HTTP adapter (connection pool) for a new session.
+        
+        With ``api.shared_pool`` enabled all clients of an environment reuse one
+        adapter, so keep-alive connections survive from scenario to scenario.
+        
+        Args:
+            retry_strategy: Retry configuration for the adapter
+            
+        Returns:
+            HTTPAdapter instance
+        """
+        pool_maxsize = self.config.get('api.pool_maxsize', 10)
+        if not self.shared_pool:
+            return HTTPAdapter(max_retries=retry_strategy, pool_maxsize=pool_maxsize)
+        
+        key = self.config.get_environment()
+        with APIClient._shared_lock:
+            if key not in APIClient._shared_adapters:
+                APIClient._shared_adapters[key] = HTTPAdapter(
+                    max_retries=retry_strategy, pool_maxsize=pool_maxsize
+                )
+            return APIClient._shared_adapters[key]
+    
+    def _thread_session(self) -> requests.Session:
+        """
+        Get the session for the calling thread.
+        
+        requests.Session is not thread-safe, so other threads (paginator
+        prefetch workers) get a session of their own. It shares this client's
+        connection pool and takes its current headers and cookies on each call.
+        
+        Returns:
+            requests.Session object
+        """
+        if threading.get_ident() == self._owner_thread:
+            return self.session
+        session = getattr(self._worker_sessions, 'session', None)
+        if session is None:
+            session = requests.Session()
+            for prefix, adapter in self.session.adapters.items():
+                session.mount(prefix, adapter)
+            self._worker_sessions.session = session
+        session.headers = self.session.headers.copy()
+        session.cookies = self.session.cookies.copy()
+        return session
+    
     def _setup_default_headers(self) -> None:
         """Setup default headers from configuration."""
         headers = self.config.get('headers', {})
@@ -104,35 +203,52 @@ class APIClient:
         
         return f"{self.base_url}/{endpoint}"
     
-    def _log_request(self, method: str, url: str, **kwargs) -> None:
-        """Log HTTP request details."""
-        self.logger.info(f"🔵 {method} {url}")
+    def _log_request(self, method: str, url: str, log_line: bool = True, **kwargs) -> None:
+        """Log HTTP request details (the INFO line only if log_line, see logging.sampling)."""
+        if log_line:
+            self.logger.info(f"🔵 {method} {url}")
+        
+        # Skip pretty-printing entirely unless the DEBUG output is kept
+        if not self.logger.isEnabledFor(logging.DEBUG):
+            return
         
         if kwargs.get('params'):
-            self.logger.debug(f"Query Params: {json.dumps(kwargs['params'], indent=2)}")
+            self.logger.debug("Query Params: %s", _LazyJSON(kwargs['params']))
         
         if kwargs.get('json'):
-            self.logger.debug(f"Request Body: {json.dumps(kwargs['json'], indent=2)}")
+            self.logger.debug("Request Body: %s", _LazyJSON(kwargs['json']))
         elif kwargs.get('data'):
-            self.logger.debug(f"Request Data: {kwargs['data']}")
+            self.logger.debug("Request Data: %s", kwargs['data'])
         
         if kwargs.get('headers'):
             # Mask sensitive headers
             safe_headers = self._mask_sensitive_data(kwargs['headers'])
-            self.logger.debug(f"Headers: {json.dumps(safe_headers, indent=2)}")
+            self.logger.debug("Headers: %s", _LazyJSON(safe_headers))
     
-    def _log_response(self, response: requests.Response) -> None:
-        """Log HTTP response details."""
-        status_emoji = "🟢" if response.ok else "🔴"
-        self.logger.info(f"{status_emoji} Response Status: {response.status_code} {response.reason}")
-        self.logger.debug(f"Response Headers: {json.dumps(dict(response.headers), indent=2)}")
-        
-        try:
-            if response.text:
-                response_json = response.json()
-                self.logger.debug(f"Response Body: {json.dumps(response_json, indent=2)}")
-        except json.JSONDecodeError:
-            self.logger.debug(f"Response Body (text): {response.text[:500]}")
+    def _log_response(self, response: requests.Response, streamed: bool = False,
+                      log_line: bool = True, **http_fields) -> None:
+        """Log HTTP response details (the body is not read for streamed responses)."""
+        if log_line:
+            status_emoji = "🟢" if response.ok else "🔴"
+            self.logger.info(f"{status_emoji} Response Status: {response.status_code} {response.reason}",
+                             extra={'event': 'http_response', 'status': response.status_code, **http_fields})
+        if not self.logger.isEnabledFor(logging.DEBUG):
+            return
+        
+        self.logger.debug("Response Headers: %s", _LazyJSON(dict(response.headers)))
+        
+        if streamed:
+            self.logger.debug("Response Body: <streamed>")
+            return
+        
+        if response.content:
+            self.logger.debug("Response Body: %s", _LazyResponseBody(response))
+    
+    @staticmethod
+    def _error_fields(http_fields: Dict[str, Any], start: float) -> Dict[str, Any]:
+        """Structured log fields of a request that raised."""
+        return {'event': 'http_error', 'status': None,
+                'duration_ms': round((time.perf_counter() - start) * 1000, 1), **http_fields}
     
     def _mask_sensitive_data(self, data: Dict) -> Dict:
         """
@@ -162,6 +278,7 @@ class APIClient:
         json_data: Optional[Dict[str, Any]] = None,
         data: Optional[Any] = None,
         timeout: Optional[int] = None,
+        stream: bool = False,
         **path_params
     ) -> requests.Response:
         """
@@ -175,10 +292,11 @@ class APIClient:
             json_data: JSON request body
             data: Form data or raw body
             timeout: Request timeout (overrides default)
+            stream: Return a size-bounded StreamingResponse instead of buffering the body
             **path_params: Path parameters for URL formatting
             
         Returns:
-            requests.Response object
+            requests.Response object (StreamingResponse when streaming)
             
         Raises:
             requests.RequestException: On request failure
@@ -191,31 +309,134 @@ class APIClient:
             'params': params,
             'json': json_data,
             'data': data,
-            'timeout': timeout
+            'timeout': timeout,
+            'stream': stream or None
         }
         
         # Remove None values
         request_kwargs = {k: v for k, v in request_kwargs.items() if v is not None}
         
-        self._log_request(method, url, **request_kwargs)
+        LogContext.new_request_id()
+        sampled = self.log_sampler.sample(endpoint)
+        self._log_request(method, url, log_line=sampled, **request_kwargs)
+        
+        if 'json' in request_kwargs:
+            self._encode_json_body(request_kwargs)
+        
+        # Effective auth header decides which identity bucket is used
+        limit_headers = {'Authorization': (headers or {}).get('Authorization',
+                                                             self.session.headers.get('Authorization'))}
+        self.rate_limiter.acquire(url, limit_headers)
         
+        # Fields of the structured (JSON lines) log record of this request
+        http_fields = {'method': method, 'endpoint': endpoint, 'url': url}
+        start = time.perf_counter()
         try:
-            response = self.session.request(method, url, **request_kwargs)
-            self._log_response(response)
+            response = self._send(method, url, **request_kwargs)
+            
+            # Throttled: pause the request's buckets for Retry-After and re-send once paced
+            throttled = 0
+            while (response.status_code == 429 and self.rate_limiter.enabled
+                   and throttled < self.config.get('api.retry_count', 3)):
+                throttled += 1
+                response.close()
+                self.rate_limiter.wait_after_throttle(url, limit_headers, self._retry_after(response))
+                response = self._send(method, url, **request_kwargs)
+            http_fields['duration_ms'] = round((time.perf_counter() - start) * 1000, 1)
+            
+            # Sampled-out requests are still logged when they fail or are slow
+            keep = self.log_sampler.keep(endpoint, sampled, response.status_code, http_fields['duration_ms'])
+            if keep and not sampled:
+                self.logger.info(f"🔵 {method} {url}")
+            self._log_response(response, streamed=stream, log_line=keep, **http_fields)
+            
+            # A re-sent 429 was already penalized by wait_after_throttle
+            if response.status_code == 429 and not throttled:
+                self.rate_limiter.penalize(url, limit_headers, self._retry_after(response))
+            
+            if stream:
+                return StreamingResponse(
+                    response,
+                    max_bytes=self.config.get('api.streaming.max_body_bytes'),
+                    chunk_size=self.config.get('api.streaming.chunk_size', 65536)
+                )
             return response
             
         except requests.exceptions.Timeout:
-            self.logger.error(f"Request timeout after {timeout}s: {method} {url}")
+            self.logger.error(f"Request timeout after {timeout}s: {method} {url}", extra=self._error_fields(http_fields, start))
             raise
         except requests.exceptions.ConnectionError as e:
-            self.logger.error(f"Connection error: {str(e)}")
+            self.logger.error(f"Connection error: {str(e)}", extra=self._error_fields(http_fields, start))
             raise
         except requests.exceptions.RequestException as e:
-            self.logger.error(f"Request failed: {str(e)}")
+            self.logger.error(f"Request failed: {str(e)}", extra=self._error_fields(http_fields, start))
             raise
     
+    def _retry_after(self, response: requests.Response) -> float:
+        """
+        Get the pause requested by a throttled response.
+        
+        Args:
+            response: 429 response
+            
+        Returns:
+            Retry-After seconds, or api.retry_delay if the header is absent or a date
+        """
+        retry_after = response.headers.get('Retry-After', '')
+        return float(retry_after) if retry_after.isdigit() else self.config.get('api.retry_delay', 2)
+    
+    def _encode_json_body(self, request_kwargs: Dict[str, Any]) -> None:
+        """
+        Replace ``json`` with a body pre-serialized by the JSON codec.
+        
+        Mirrors requests: the JSON body is only used without ``data``, and
+        ``Content-Type: application/json`` is added when no content type
+        would otherwise be sent.
+        
+        Args:
+            request_kwargs: Keyword arguments for requests.Session.request (modified in place)
+        """
+        body = request_kwargs.pop('json')
+        if request_kwargs.get('data'):
+            return
+        request_kwargs['data'] = json_codec.dumps_bytes(body)
+        
+        headers = dict(request_kwargs.get('headers') or {})
+        overrides = [key for key in headers if key.lower() == 'content-type']
+        removed = any(headers[key] is None for key in overrides)
+        if removed or (not overrides and 'Content-Type' not in self.session.headers):
+            for key in overrides:
+                headers.pop(key)
+            headers['Content-Type'] = 'application/json'
+            request_kwargs['headers'] = headers
+    
+    def _send(self, method: str, url: str, **kwargs) -> requests.Response:
+        """
+        Send request inside a concurrency slot and report latency/errors.
+        
+        Args:
+            method: HTTP method
+            url: Complete URL
+            **kwargs: Arguments for requests.Session.request
+            
+        Returns:
+            requests.Response object
+        """
+        with self.concurrency.slot(), self.step_profiler.network_call():
+            start = time.perf_counter()
+            try:
+                response = self._thread_session().request(method, url, **kwargs)
+            except requests.exceptions.RequestException:
+                self.concurrency.record((time.perf_counter() - start) * 1000, success=False)
+                raise
+        
+        healthy = response.status_code != 429 and response.status_code < 500
+        self.concurrency.record((time.perf_counter() - start) * 1000, success=healthy)
+        return response
+    
     def get(self, endpoint: str, params: Optional[Dict] = None, 
-            headers: Optional[Dict] = None, **path_params) -> requests.Response:
+            headers: Optional[Dict] = None, stream: bool = False,
+            **path_params) -> requests.Response:
         """
         Send GET request.
         
@@ -223,12 +444,14 @@ class APIClient:
             endpoint: API endpoint
             params: Query parameters
             headers: Additional headers
+            stream: Stream the body (see request)
             **path_params: Path parameters
             
         Returns:
             requests.Response object
         """
-        return self.request('GET', endpoint, params=params, headers=headers, **path_params)
+        return self.request('GET', endpoint, params=params, headers=headers,
+                            stream=stream, **path_params)
     
     def post(self, endpoint: str, json_data: Optional[Dict] = None,
              data: Optional[Any] = None, headers: Optional[Dict] = None,
@@ -316,5 +539,9 @@ class APIClient:
     
     def close(self) -> None:
         """Close the session and cleanup resources."""
-        self.session.close()
+        if self.shared_pool:
+            # Keep the shared pool's connections alive for the next scenario
+            self.session.cookies.clear()
+        else:
+            self.session.close()
         self.logger.info("API Client session closed")
@@ -4,12 +4,11 @@ Provides comprehensive assertion methods for API response validation.
 Includes status code, headers, body, JSON schema, and custom validations.
 """
 
-import json
-import jsonschema
-from jsonschema import validate, ValidationError
-from typing import Dict, Any, List, Union, Optional
+from typing import Dict, Any, Callable, Iterator, List, Union, Optional
 import requests
 from core.logger import Logger
+from core.streaming import StreamingResponse
+from utils import json_codec
 
 
 class APIAssertions:
@@ -39,8 +38,8 @@ class APIAssertions:
         """
         if self._response_json is None:
             try:
-                self._response_json = self.response.json()
-            except json.JSONDecodeError:
+                self._response_json = json_codec.parse_response(self.response)
+            except json_codec.JSONDecodeError:
                 self.logger.error("Response body is not valid JSON")
                 raise AssertionError("Response body is not valid JSON")
         return self._response_json
@@ -296,6 +295,93 @@ class APIAssertions:
         self.logger.info(f"✅ JSON list not empty assertion passed: {key}")
         return self
     
+    def _iter_json_list(self, key_path: str, separator: str) -> Iterator[Any]:
+        """Iterate a JSON list; KeyError if the path is missing, TypeError if it is not a list."""
+        if isinstance(self.response, StreamingResponse):
+            yield from self.response.iter_items(key_path.replace(separator, '.'))
+            return
+        
+        current = self.response_json
+        for key in [part for part in key_path.split(separator) if part]:
+            if not (isinstance(current, dict) and key in current):
+                raise KeyError(f"Key path '{key_path}' not found in response")
+            current = current[key]
+        
+        if not isinstance(current, list):
+            raise TypeError(f"Key path '{key_path}' is not a list, got {type(current).__name__}")
+        yield from current
+    
+    def iter_json_items(self, key_path: str = 'content', separator: str = '.') -> Iterator[Any]:
+        """
+        Iterate a JSON list item by item.
+        
+        Streamed responses are decoded incrementally from the body; buffered
+        responses walk the cached JSON without copying the list.
+        
+        Args:
+            key_path: Path to the list (e.g., 'data.items'), '' for a top-level list
+            separator: Path separator
+            
+        Yields:
+            List items
+        """
+        try:
+            yield from self._iter_json_list(key_path, separator)
+        except (KeyError, TypeError) as e:
+            raise AssertionError(e.args[0]) from None
+    
+    def assert_json_items_at_most(self, key_path: str, max_count: int,
+                                  required: bool = True) -> 'APIAssertions':
+        """
+        Assert a JSON list has at most max_count items, counting item by item.
+        
+        Args:
+            key_path: Path to the list
+            max_count: Maximum number of items
+            required: Fail if the list is missing (otherwise only log a warning)
+            
+        Returns:
+            Self for method chaining
+        """
+        count = 0
+        try:
+            for _ in self._iter_json_list(key_path, '.'):
+                count += 1
+                assert count <= max_count, \
+                    f"List '{key_path}' expected at most {max_count} items, but has more"
+        except KeyError as e:
+            if required:
+                raise AssertionError(e.args[0]) from None
+            self.logger.warning(f"⚠️ {e.args[0]}, list size not checked")
+            return self
+        except TypeError as e:
+            raise AssertionError(e.args[0]) from None
+        
+        self.logger.info(f"✅ JSON list size assertion passed: {key_path} has {count} items (max: {max_count})")
+        return self
+    
+    def assert_each_json_item(self, key_path: str, check: Callable[[Any], bool],
+                              description: str = 'check') -> 'APIAssertions':
+        """
+        Assert a condition for every item of a JSON list, one item at a time.
+        
+        Args:
+            key_path: Path to the list
+            check: Predicate applied to each item
+            description: Condition description for messages
+            
+        Returns:
+            Self for method chaining
+        """
+        count = 0
+        for index, item in enumerate(self.iter_json_items(key_path)):
+            assert check(item), \
+                f"Item {index} of '{key_path}' failed {description}: {str(item)[:200]}"
+            count += 1
+        
+        self.logger.info(f"✅ All {count} items of '{key_path}' passed {description}")
+        return self
+    
     def assert_json_schema(self, schema: Dict) -> 'APIAssertions':
         """
         Validate response against JSON schema.
@@ -306,6 +392,9 @@ class APIAssertions:
         Returns:
             Self for method chaining
         """
+        # jsonschema is slow to import and only needed by schema checks
+        from jsonschema import validate, ValidationError
+        
         try:
             validate(instance=self.response_json, schema=schema)
             self.logger.info("✅ JSON schema validation passed")
@@ -0,0 +1,169 @@
+"""
+Concurrency Module
+Provides an adaptive (AIMD) concurrency limiter for parallel and load runs.
+The limit grows while the API is healthy and shrinks as soon as latency or
+error signals reported by APIClient show the environment is degrading.
+"""
+
+import threading
+import time
+from contextlib import contextmanager
+from typing import Dict, Iterator, Optional
+
+from core.logger import Logger
+
+
+class ConcurrencyLimiter:
+    """
+    Adaptive concurrency limiter using additive-increase/multiplicative-decrease.
+
+    Every successful request below the latency target adds ``increase / limit``
+    to the limit (about +increase per full window of requests). An error, a
+    throttled response or a request slower than the target multiplies the
+    limit by ``backoff``, at most once per observed round-trip time so a single
+    burst of slow responses only counts as one congestion signal.
+    """
+
+    _shared = {}
+    _shared_lock = threading.Lock()
+
+    def __init__(self, settings: Optional[Dict] = None):
+        """
+        Initialize limiter from the ``api.concurrency`` config block.
+
+        Args:
+            settings: Concurrency settings dictionary
+        """
+        settings = settings or {}
+        self.logger = Logger.get_logger(__name__)
+        self.enabled = bool(settings.get('enabled', False))
+        self.min_limit = max(int(settings.get('min_limit', 1)), 1)
+        self.max_limit = max(int(settings.get('max_limit', 32)), self.min_limit)
+        self.latency_target_ms = float(settings.get('latency_target_ms', 2000))
+        self.increase = float(settings.get('increase', 1))
+        self.backoff = float(settings.get('backoff', 0.7))
+
+        initial = float(settings.get('initial_limit', self.min_limit))
+        self._limit = min(max(initial, self.min_limit), self.max_limit)
+        self._in_flight = 0
+        self._last_decrease = 0.0
+        self._avg_latency_ms = 0.0
+        self._stats = {'requests': 0, 'errors': 0, 'increases': 0, 'decreases': 0}
+        self._cond = threading.Condition()
+
+    @classmethod
+    def get_shared(cls, config) -> 'ConcurrencyLimiter':
+        """
+        Get the process-wide concurrency limiter for a configuration.
+
+        Args:
+            config: ConfigLoader instance
+
+        Returns:
+            ConcurrencyLimiter shared by all clients of that environment
+        """
+        key = config.get_environment()
+        with cls._shared_lock:
+            if key not in cls._shared:
+                cls._shared[key] = cls(config.get('api.concurrency', {}))
+            return cls._shared[key]
+
+    @property
+    def limit(self) -> int:
+        """Current number of requests allowed in flight."""
+        return int(self._limit)
+
+    @property
+    def in_flight(self) -> int:
+        """Number of requests currently holding a slot."""
+        return self._in_flight
+
+    def acquire(self, timeout: Optional[float] = None) -> bool:
+        """
+        Wait for a free slot.
+
+        Args:
+            timeout: Maximum time to wait in seconds (None waits forever)
+
+        Returns:
+            True if a slot was acquired
+        """
+        if not self.enabled:
+            return True
+        with self._cond:
+            acquired = self._cond.wait_for(lambda: self._in_flight < self.limit, timeout)
+            if acquired:
+                self._in_flight += 1
+            return acquired
+
+    def release(self) -> None:
+        """Give a slot back and wake up one waiter."""
+        if not self.enabled:
+            return
+        with self._cond:
+            self._in_flight = max(self._in_flight - 1, 0)
+            self._cond.notify()
+
+    @contextmanager
+    def slot(self) -> Iterator[None]:
+        """Context manager holding a slot for the duration of a request."""
+        self.acquire()
+        try:
+            yield
+        finally:
+            self.release()
+
+    def record(self, latency_ms: float, success: bool) -> None:
+        """
+        Feed a request outcome into the controller.
+
+        Args:
+            latency_ms: Request latency in milliseconds
+            success: False for transport errors, 429 and 5xx responses
+        """
+        if not self.enabled:
+            return
+        with self._cond:
+            self._stats['requests'] += 1
+            self._avg_latency_ms = latency_ms if not self._avg_latency_ms else \
+                0.8 * self._avg_latency_ms + 0.2 * latency_ms
+
+            if success and latency_ms <= self.latency_target_ms:
+                new_limit = min(self._limit + self.increase / self._limit, self.max_limit)
+                if int(new_limit) > int(self._limit):
+                    self._stats['increases'] += 1
+                    self._cond.notify_all()
+                self._limit = new_limit
+                return
+
+            if not success:
+                self._stats['errors'] += 1
+
+            now = time.monotonic()
+            if (now - self._last_decrease) * 1000 < max(self._avg_latency_ms, latency_ms):
+                return
+            self._last_decrease = now
+            new_limit = max(self._limit * self.backoff, self.min_limit)
+            if int(new_limit) < int(self._limit):
+                self._stats['decreases'] += 1
+                reason = 'error' if not success else f'latency {latency_ms:.0f}ms'
+                self.logger.info(f"Concurrency limit lowered to {int(new_limit)} ({reason})")
+            self._limit = new_limit
+
+    def snapshot(self) -> Dict:
+        """
+        Get current controller metrics.
+
+        Returns:
+            Dictionary with limit, in-flight count and counters
+        """
+        with self._cond:
+            return {
+                'enabled': self.enabled,
+                'limit': self.limit,
+                'in_flight': self._in_flight,
+                'min_limit': self.min_limit,
+                'max_limit': self.max_limit,
+                'avg_latency_ms': round(self._avg_latency_ms, 2),
+                **self._stats
+            }
@@ -0,0 +1,205 @@
+"""
+CPU Profiler Module
+Opt-in CPU profiling of the framework itself (logging, JSON encoding, header
+building, reporting), per scenario or for the whole run. Enabled with
+``behave -D profile=cprofile`` (deterministic, writes ``.pstats``) or
+``-D profile=sampling`` (statistical, writes collapsed stacks for flame graphs).
+"""
+
+import cProfile
+import os
+import re
+import sys
+import threading
+import time
+from collections import Counter
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from core.logger import Logger
+
+MODES = ('cprofile', 'sampling')
+SCOPES = ('scenario', 'run')
+
+
+class StackSampler:
+    """
+    Statistical profiler: samples one thread's call stack at a fixed interval.
+
+    The result is written in the collapsed ("folded") stack format read by
+    flamegraph.pl, speedscope and inferno: one ``frame;frame;frame count``
+    line per distinct stack, outermost frame first.
+    """
+
+    def __init__(self, interval_ms: float = 5):
+        """
+        Initialize sampler.
+
+        Args:
+            interval_ms: Time between samples in milliseconds
+        """
+        self.interval = max(interval_ms, 0.5) / 1000
+        self.stacks: Counter = Counter()
+        self._thread_id: Optional[int] = None
+        self._stop = threading.Event()
+        self._sampler: Optional[threading.Thread] = None
+
+    def start(self) -> None:
+        """Start sampling the calling thread."""
+        self._thread_id = threading.get_ident()
+        self._stop.clear()
+        self._sampler = threading.Thread(target=self._run, name='stack-sampler', daemon=True)
+        self._sampler.start()
+
+    def stop(self) -> None:
+        """Stop sampling."""
+        self._stop.set()
+        if self._sampler:
+            self._sampler.join()
+            self._sampler = None
+
+    @staticmethod
+    def _label(frame) -> str:
+        """Flame graph label of a frame: ``function (file:line)``."""
+        code = frame.f_code
+        name = getattr(code, 'co_qualname', code.co_name)
+        return f"{name} ({os.path.basename(code.co_filename)}:{code.co_firstlineno})".replace(';', ',')
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval):
+            frame = sys._current_frames().get(self._thread_id)
+            stack = []
+            while frame is not None:
+                stack.append(self._label(frame))
+                frame = frame.f_back
+            if stack:
+                self.stacks[';'.join(reversed(stack))] += 1
+
+    def write_collapsed(self, path: Path) -> None:
+        """
+        Write the samples in collapsed stack format.
+
+        Args:
+            path: Output file
+        """
+        lines = [f'{stack} {count}' for stack, count in self.stacks.most_common()]
+        path.write_text('\n'.join(lines) + '\n', encoding='utf-8')
+
+
+class CPUProfiler:
+    """
+    Scenario- or run-scoped CPU profiler driven by the environment hooks.
+
+    Example config (options can be overridden with dotted -D keys, e.g.
+    ``-D profiling.cpu.scope=run``):
+        profiling:
+          cpu:
+            scope: scenario
+            min_duration_ms: 0
+            sample_interval_ms: 5
+            report_dir: reports/profiles
+    """
+
+    def __init__(self, mode: Optional[str], settings: Optional[Dict] = None):
+        """
+        Initialize profiler.
+
+        Args:
+            mode: 'cprofile', 'sampling', or None to disable profiling
+            settings: ``profiling.cpu`` settings dictionary
+
+        Raises:
+            ValueError: If mode or scope is unknown
+        """
+        settings = settings or {}
+        if mode and mode not in MODES:
+            raise ValueError(f"Unknown profile mode '{mode}'. Available: {list(MODES)}")
+        self.mode = mode or None
+        self.scope = settings.get('scope', 'scenario')
+        if self.scope not in SCOPES:
+            raise ValueError(f"Unknown profiling scope '{self.scope}'. Available: {list(SCOPES)}")
+        self.min_duration_ms = float(settings.get('min_duration_ms', 0))
+        self.sample_interval_ms = float(settings.get('sample_interval_ms', 5))
+        self.report_dir = Path(settings.get('report_dir', 'reports/profiles'))
+        self.logger = Logger.get_logger(__name__)
+        self.written: List[Path] = []
+        self._profiler = None
+        self._started: Optional[float] = None
+
+    @property
+    def enabled(self) -> bool:
+        """Whether a profile mode was selected."""
+        return self.mode is not None
+
+    def _start(self) -> None:
+        if self.mode == 'cprofile':
+            self._profiler = cProfile.Profile()
+            self._profiler.enable()
+        else:
+            self._profiler = StackSampler(self.sample_interval_ms)
+            self._profiler.start()
+        self._started = time.perf_counter()
+
+    def _stop(self, name: str, keep: bool = True) -> Optional[Path]:
+        """Stop the active profile and write it (unless discarded)."""
+        if self._profiler is None:
+            return None
+        duration_ms = (time.perf_counter() - self._started) * 1000
+        if self.mode == 'cprofile':
+            self._profiler.disable()
+        else:
+            self._profiler.stop()
+        profiler, self._profiler = self._profiler, None
+        if not keep or duration_ms < self.min_duration_ms:
+            return None
+
+        self.report_dir.mkdir(parents=True, exist_ok=True)
+        slug = re.sub(r'[^A-Za-z0-9]+', '_', name).strip('_')[:80] or 'run'
+        # Sequence number keeps same-second profiles of similarly named scenarios apart
+        base = self.report_dir / f"{datetime.now().strftime('%Y%m%d_%H%M%S')}_{len(self.written) + 1:04d}_{slug}"
+        if self.mode == 'cprofile':
+            path = base.with_suffix('.pstats')
+            profiler.dump_stats(str(path))
+        else:
+            path = base.with_suffix('.collapsed')
+            profiler.write_collapsed(path)
+        self.written.append(path)
+        self.logger.info(f"🔬 CPU profile ({self.mode}, {duration_ms:.0f} ms): {path}")
+        return path
+
+    def start_run(self) -> None:
+        """Start the run-wide profile (called from before_all)."""
+        if self.enabled and self.scope == 'run':
+            self._start()
+
+    def stop_run(self) -> Optional[Path]:
+        """
+        Stop and write the run-wide profile (called from after_all).
+
+        Returns:
+            Path of the written profile, if any
+        """
+        if self.enabled and self.scope == 'run':
+            return self._stop('run')
+        return None
+
+    def start_scenario(self) -> None:
+        """Start a scenario profile (called from before_scenario)."""
+        if self.enabled and self.scope == 'scenario':
+            self._start()
+
+    def stop_scenario(self, scenario) -> Optional[Path]:
+        """
+        Stop a scenario profile and write it if the scenario was slow enough.
+
+        Args:
+            scenario: behave Scenario
+
+        Returns:
+            Path of the written profile, if any
+        """
+        if self.enabled and self.scope == 'scenario':
+            # Skipped scenarios have no runtime worth a profile
+            return self._stop(scenario.name, keep=scenario.status != 'skipped')
+        return None
@@ -0,0 +1,101 @@
+"""
+Debug Buffer Module
+Keeps the DEBUG records of the running scenario in a bounded in-memory ring
+buffer. Records are stored unformatted and are only rendered when a scenario
+fails, so green runs pay for a deque append instead of log I/O.
+"""
+
+import logging
+import re
+from collections import deque
+from datetime import datetime
+from pathlib import Path
+from typing import Optional
+
+
+class DebugRingBuffer(logging.Handler):
+    """
+    Logging handler holding the last ``capacity`` records of a scenario.
+
+    Example config:
+        logging:
+          debug_buffer:
+            enabled: true
+            capacity: 5000
+            dump_dir: logs/debug
+            attach_to_allure: true
+    """
+
+    def __init__(self, capacity: int = 5000, dump_dir: str = 'logs/debug'):
+        """
+        Initialize ring buffer.
+
+        Args:
+            capacity: Maximum number of records kept per scenario
+            dump_dir: Directory failed-scenario dumps are written to
+        """
+        super().__init__(level=logging.DEBUG)
+        self.capacity = capacity
+        self.dump_dir = Path(dump_dir)
+        self._records = deque(maxlen=capacity)
+        self._dropped = 0
+        self.setFormatter(logging.Formatter(
+            '%(asctime)s.%(msecs)03d - %(threadName)s - %(name)s - %(levelname)s - %(message)s',
+            datefmt='%Y-%m-%d %H:%M:%S'
+        ))
+
+    def handle(self, record: logging.LogRecord) -> bool:
+        """Store the record as-is - deque.append is atomic, so no lock and no formatting."""
+        if len(self._records) == self.capacity:
+            self._dropped += 1
+        self._records.append(record)
+        return True
+
+    def emit(self, record: logging.LogRecord) -> None:
+        """Store a record (see :meth:`handle`)."""
+        self._records.append(record)
+
+    def clear(self) -> None:
+        """Forget the records of the previous scenario."""
+        self._records.clear()
+        self._dropped = 0
+
+    def __len__(self) -> int:
+        return len(self._records)
+
+    def render(self) -> str:
+        """
+        Format the buffered records.
+
+        Returns:
+            Log text of the buffered records, oldest first
+        """
+        lines = []
+        if self._dropped:
+            lines.append(f"... {self._dropped} earlier record(s) dropped (capacity {self.capacity}) ...")
+        for record in list(self._records):
+            try:
+                lines.append(self.format(record))
+            except Exception as e:
+                lines.append(f"<unformattable record {record.name}:{record.lineno}: {e}>")
+        return '\n'.join(lines) + '\n'
+
+    def dump(self, name: str, text: Optional[str] = None) -> Optional[str]:
+        """
+        Write the buffered records to ``dump_dir``.
+
+        Args:
+            name: Scenario name (used in the file name)
+            text: Already rendered records (rendered here if omitted)
+
+        Returns:
+            Path of the written file, or None if the buffer is empty
+        """
+        if not self._records:
+            return None
+        self.dump_dir.mkdir(parents=True, exist_ok=True)
+        slug = re.sub(r'[^A-Za-z0-9]+', '_', name).strip('_')[:80] or 'scenario'
+        timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+        path = self.dump_dir / f'{timestamp}_{slug}.log'
+        path.write_text(text or self.render(), encoding='utf-8')
+        return str(path)
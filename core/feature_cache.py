@@ -0,0 +1,108 @@
+"""
+Feature Cache Module
+Caches parsed feature files, so behave (and every parallel worker) loads
+pickled model objects instead of re-parsing ~7,400 lines of Gherkin on each
+run. Entries are keyed by feature path and validated against the content
+hash, the language and the behave version.
+"""
+
+import copyreg
+import hashlib
+import os
+import pickle
+import threading
+from pathlib import Path
+from typing import Optional
+
+import behave
+from behave import parser
+from behave.model import Tag
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+CACHE_VERSION = 1
+
+# Tag is a str subclass whose constructor also needs the line number
+copyreg.pickle(Tag, lambda tag: (Tag, (str(tag), tag.line)))
+
+
+class FeatureCache:
+    """
+    Drop-in replacement for ``behave.parser.parse_file`` backed by a disk cache.
+
+    Installed from environment.py, which behave loads before it parses the
+    feature files. FEATURE_CACHE=0 disables it; FEATURE_CACHE_DIR moves it.
+    """
+
+    _installed = None
+    _install_lock = threading.Lock()
+
+    def __init__(self, cache_dir: Optional[Path] = None):
+        """
+        Initialize cache.
+
+        Args:
+            cache_dir: Directory for cached features (default .cache/features)
+        """
+        self.cache_dir = Path(cache_dir or os.getenv('FEATURE_CACHE_DIR', PROJECT_ROOT / '.cache' / 'features'))
+        self.hits = 0
+        self.misses = 0
+
+    @classmethod
+    def install(cls) -> Optional['FeatureCache']:
+        """
+        Route behave's feature parsing through the cache (once per process).
+
+        Returns:
+            The installed cache, or None if disabled via FEATURE_CACHE=0
+        """
+        if os.getenv('FEATURE_CACHE', '1') == '0':
+            return None
+        with cls._install_lock:
+            if cls._installed is None:
+                cls._installed = cls()
+                parser.parse_file = cls._installed.parse_file
+            return cls._installed
+
+    def _entry_path(self, filename: str) -> Path:
+        """Cache file of a feature path."""
+        key = hashlib.sha256(os.path.abspath(filename).encode('utf-8')).hexdigest()[:16]
+        return self.cache_dir / f'{Path(filename).stem}_{key}.pickle'
+
+    def parse_file(self, filename: str, language: Optional[str] = None):
+        """
+        Parse a feature file, reusing the cached model when the file is unchanged.
+
+        Args:
+            filename: Feature file path
+            language: Gherkin language (None for the default)
+
+        Returns:
+            behave Feature model
+        """
+        with open(filename, 'rb') as f:
+            data = f.read()
+        digest = hashlib.sha256(data).hexdigest()
+        key = (CACHE_VERSION, behave.__version__, filename, language, digest)
+        entry_path = self._entry_path(filename)
+
+        try:
+            with open(entry_path, 'rb') as f:
+                cached_key, feature = pickle.load(f)
+            if cached_key == key:
+                self.hits += 1
+                return feature
+        except Exception:
+            pass
+
+        self.misses += 1
+        # Same decoding as behave.parser.parse_file
+        feature = parser.parse_feature(data.decode('utf8'), language, filename)
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            partial = entry_path.with_name(f'{entry_path.name}.{os.getpid()}.tmp')
+            with open(partial, 'wb') as f:
+                pickle.dump((key, feature), f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(partial, entry_path)
+        except (OSError, pickle.PicklingError):
+            pass
+        return feature
@@ -0,0 +1,165 @@
+"""
+Header Profiles Module
+Compiles the named header sets from the ``header_profiles`` config block once
+at startup. Steps then only overlay the per-request fields (Authorization,
+requestId) instead of rebuilding large device header dictionaries.
+"""
+
+import platform
+import re
+import threading
+import uuid
+from types import MappingProxyType
+from typing import Dict, Mapping, Optional, Union
+
+from core.logger import Logger
+
+
+class HeaderProfiles:
+    """
+    Registry of immutable, precompiled header profiles.
+
+    Profile values may reference other config keys with ``${dotted.key}``
+    (``${dotted.key|default}`` supplies a fallback) and host details with
+    ``${platform.system}`` / ``${platform.version}``. All references are
+    resolved once during compilation; headers whose reference cannot be
+    resolved are left out, as requests would drop a None value.
+
+    Example config:
+        header_profiles:
+          json:
+            headers:
+              Content-Type: application/json
+          school_device:
+            extends: json
+            headers:
+              os: ${school_payment.device_os}
+    """
+
+    _REFERENCE = re.compile(r'\$\{([^}]+)\}')
+    _PLATFORM = {
+        'platform.system': platform.system,
+        'platform.version': platform.version,
+    }
+
+    _shared = {}
+    _shared_lock = threading.Lock()
+
+    def __init__(self, config):
+        """
+        Compile all profiles defined in configuration.
+
+        Args:
+            config: ConfigLoader instance
+        """
+        self.config = config
+        self.logger = Logger.get_logger(__name__)
+        self._definitions = config.get('header_profiles', {}) or {}
+        self._profiles: Dict[str, Mapping[str, str]] = {}
+
+        for name in self._definitions:
+            self._compile(name, ())
+        self.logger.debug(f"Compiled header profiles: {list(self._profiles)}")
+
+    @classmethod
+    def get_shared(cls, config) -> 'HeaderProfiles':
+        """
+        Get the compiled profiles for a configuration.
+
+        Args:
+            config: ConfigLoader instance
+
+        Returns:
+            HeaderProfiles shared by all scenarios of that environment
+        """
+        key = config.get_environment()
+        with cls._shared_lock:
+            if key not in cls._shared:
+                cls._shared[key] = cls(config)
+            return cls._shared[key]
+
+    def _resolve(self, value) -> Optional[str]:
+        """Resolve ``${...}`` references in a single header value."""
+        if not isinstance(value, str):
+            return None if value is None else str(value)
+
+        missing = False
+
+        def lookup(match):
+            nonlocal missing
+            key, _, default = match.group(1).partition('|')
+            resolved = self._PLATFORM[key]() if key in self._PLATFORM else self.config.get(key)
+            if resolved is None and default:
+                resolved = default
+            if resolved is None:
+                missing = True
+                return ''
+            return str(resolved)
+
+        resolved = self._REFERENCE.sub(lookup, value)
+        return None if missing else resolved
+
+    def _compile(self, name: str, chain: tuple) -> Mapping[str, str]:
+        """Compile a profile, following ``extends`` to its parent first."""
+        if name in self._profiles:
+            return self._profiles[name]
+        if name not in self._definitions:
+            raise KeyError(f"Unknown header profile: {name}")
+        if name in chain:
+            raise ValueError(f"Circular header profile inheritance: {' -> '.join(chain + (name,))}")
+
+        definition = self._definitions[name] or {}
+        headers = {}
+        parent = definition.get('extends')
+        if parent:
+            headers.update(self._compile(parent, chain + (name,)))
+
+        for header, value in (definition.get('headers') or {}).items():
+            resolved = self._resolve(value)
+            if resolved is None:
+                headers.pop(header, None)
+            else:
+                headers[header] = resolved
+
+        self._profiles[name] = MappingProxyType(headers)
+        return self._profiles[name]
+
+    def get(self, name: str) -> Mapping[str, str]:
+        """
+        Get a compiled profile.
+
+        Args:
+            name: Profile name
+
+        Returns:
+            Read-only mapping of header names to values
+        """
+        try:
+            return self._profiles[name]
+        except KeyError:
+            raise KeyError(f"Unknown header profile: {name}. "
+                           f"Available profiles: {list(self._profiles)}") from None
+
+    def build(self, name: str, token: Optional[str] = None,
+              request_id: Union[bool, str, None] = None,
+              overlay: Optional[Dict[str, str]] = None) -> Dict[str, str]:
+        """
+        Build request headers from a profile plus per-request fields.
+
+        Args:
+            name: Profile name
+            token: Bearer token for the Authorization header (omitted if None)
+            request_id: True to generate a requestId, or an explicit value
+            overlay: Extra headers applied last
+
+        Returns:
+            New, mutable header dictionary
+        """
+        headers = dict(self.get(name))
+        if token is not None:
+            headers['Authorization'] = f'Bearer {token}'
+        if request_id:
+            headers['requestId'] = str(uuid.uuid4()) if request_id is True else request_id
+        if overlay:
+            headers.update(overlay)
+        return headers
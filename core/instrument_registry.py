@@ -0,0 +1,137 @@
+"""
+Instrument Registry Module
+Caches payment-instrument details (encrypted PIN, instrument token) per user
+token and instrument ID, so payment scenarios of the P2P, school, church and
+utility flows don't each repeat the instrument lookup round-trip.
+"""
+
+import hashlib
+import threading
+import time
+from typing import Dict, Optional, Tuple
+
+from core.logger import Logger
+from utils import json_codec
+
+
+class InstrumentRegistry:
+    """
+    TTL cache of ``GET /bff/v1/payment/instruments/{id}`` responses.
+
+    Entries are keyed by (token identity, instrument id); the identity is a
+    hash of the bearer token, so details fetched for one login are never
+    served to another. Entries of a token are dropped when it is replaced
+    (see :meth:`invalidate`) or rejected with 401/403.
+    """
+
+    _shared = {}
+    _shared_lock = threading.Lock()
+
+    def __init__(self, config):
+        """
+        Initialize registry from the ``payment_options`` config block.
+
+        Args:
+            config: ConfigLoader instance
+        """
+        self.logger = Logger.get_logger(__name__)
+        self.endpoint = config.get('payment_options.instrument_endpoint',
+                                   '/bff/v1/payment/instruments/{instrument_id}')
+        self.ttl = config.get_float('payment_options.instrument_cache_ttl', 300.0)
+        self._entries: Dict[Tuple[str, str], Tuple[float, Dict]] = {}
+        self._lock = threading.Lock()
+        self._stats = {'hits': 0, 'misses': 0, 'invalidations': 0}
+
+    @classmethod
+    def get_shared(cls, config) -> 'InstrumentRegistry':
+        """
+        Get the process-wide registry for a configuration.
+
+        Args:
+            config: ConfigLoader instance
+
+        Returns:
+            InstrumentRegistry shared by all scenarios of that environment
+        """
+        key = config.get_environment()
+        with cls._shared_lock:
+            if key not in cls._shared:
+                cls._shared[key] = cls(config)
+            return cls._shared[key]
+
+    @staticmethod
+    def identity(token: Optional[str]) -> str:
+        """Stable, non-reversible identity for a bearer token."""
+        if not token:
+            return 'anonymous'
+        return hashlib.sha256(token.encode('utf-8')).hexdigest()[:16]
+
+    def get(self, api_client, instrument_id: str, token: Optional[str] = None,
+            headers: Optional[Dict[str, str]] = None) -> Optional[Dict]:
+        """
+        Get instrument details, fetching them only on a cache miss.
+
+        Args:
+            api_client: APIClient used for the lookup
+            instrument_id: Payment instrument ID
+            token: User token the details belong to
+            headers: Request headers for the lookup
+
+        Returns:
+            Instrument details (a copy), or None if the lookup failed
+        """
+        key = (self.identity(token), instrument_id)
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry and entry[0] > now:
+                self._stats['hits'] += 1
+                self.logger.info(f"💾 Payment instrument {instrument_id} served from cache")
+                return dict(entry[1])
+            self._entries.pop(key, None)
+            self._stats['misses'] += 1
+
+        response = api_client.get(self.endpoint, headers=headers, instrument_id=instrument_id)
+        if response.status_code in (401, 403):
+            self.invalidate(token)
+        if response.status_code != 200:
+            self.logger.warning(f"⚠️  Failed to fetch payment instrument: Status {response.status_code}")
+            self.logger.warning(f"Response: {response.text}")
+            return None
+
+        details = json_codec.parse_response(response)
+        if self.ttl > 0:
+            with self._lock:
+                self._entries[key] = (time.monotonic() + self.ttl, details)
+        return dict(details)
+
+    def invalidate(self, token: Optional[str] = None) -> None:
+        """
+        Drop cached details of a token (all entries if token is None).
+
+        Args:
+            token: Replaced or rejected user token
+        """
+        with self._lock:
+            if token is None:
+                dropped = len(self._entries)
+                self._entries.clear()
+            else:
+                identity = self.identity(token)
+                stale = [key for key in self._entries if key[0] == identity]
+                for key in stale:
+                    del self._entries[key]
+                dropped = len(stale)
+            if dropped:
+                self._stats['invalidations'] += dropped
+                self.logger.debug(f"Invalidated {dropped} cached payment instrument(s)")
+
+    def snapshot(self) -> Dict:
+        """
+        Get cache metrics.
+
+        Returns:
+            Dictionary with entry count and hit/miss counters
+        """
+        with self._lock:
+            return {'entries': len(self._entries), **self._stats}
@@ -0,0 +1,173 @@
+"""
+Log Index Module
+Records the byte range each scenario occupies in a log file, in a small
+``<log file>.idx`` JSON-lines index written next to it. Reporters read a
+failed scenario's lines with a single seek instead of rescanning the log.
+Rotated segments (``<log file>.<n>``, optionally ``.gz``/``.xz``) are read
+transparently.
+"""
+
+import gzip
+import logging
+import lzma
+from pathlib import Path
+from typing import BinaryIO, Dict, List, Optional, Union
+
+from utils import json_codec
+
+COMPRESSED_SUFFIXES = {'.gz': gzip.open, '.xz': lzma.open}
+
+
+def open_log(path: Union[str, Path]) -> BinaryIO:
+    """
+    Open a plain, gzip or lzma compressed log file for binary reading.
+
+    Args:
+        path: Log file or rotated segment
+
+    Returns:
+        Binary file object (decompressing if needed)
+    """
+    path = Path(path)
+    opener = COMPRESSED_SUFFIXES.get(path.suffix, open)
+    return opener(path, 'rb')
+
+
+class IndexedFileHandler(logging.FileHandler):
+    """
+    FileHandler that indexes scenario byte ranges.
+
+    A record logged with ``extra={'scenario_mark': 'start'}`` opens a range
+    at the current end of file; one with ``scenario_mark: 'end'`` (and
+    optionally ``scenario_status``) closes it after being written and appends
+    an index entry. Both marks are normal log lines, so the range covers the
+    scenario's banners too.
+    """
+
+    def __init__(self, filename: Union[str, Path], mode: str = 'a', encoding: str = 'utf-8'):
+        """
+        Initialize handler.
+
+        Args:
+            filename: Log file path
+            mode: File open mode
+            encoding: File encoding
+        """
+        super().__init__(filename, mode=mode, encoding=encoding)
+        self.index_path = LogIndex.index_path(self.baseFilename)
+        self.segment = 0
+        self._start = None
+
+    def emit(self, record: logging.LogRecord) -> None:
+        mark = getattr(record, 'scenario_mark', None)
+        if mark == 'start':
+            self._start = self._offset()
+        super().emit(record)
+        if mark == 'end' and self._start is not None:
+            entry = {
+                'feature': getattr(record, 'feature', None),
+                'scenario': getattr(record, 'scenario', None),
+                'status': getattr(record, 'scenario_status', None),
+                'segment': self.segment,
+                'start': self._start,
+                'end': self._offset(),
+            }
+            self._start = None
+            with open(self.index_path, 'a', encoding='utf-8') as index_file:
+                index_file.write(json_codec.dumps(entry) + '\n')
+
+    def _offset(self) -> int:
+        """Current end of the log file in bytes."""
+        if self.stream is None:
+            return 0
+        self.stream.flush()
+        return self.stream.buffer.tell()
+
+
+class LogIndex:
+    """
+    Reader for a log file and its scenario index.
+
+    Example:
+        index = LogIndex('logs/automation_20240101_120000.log')
+        for entry in index.entries(status='failed'):
+            print(index.excerpt(entry))
+    """
+
+    def __init__(self, log_path: Union[str, Path]):
+        """
+        Initialize reader.
+
+        Args:
+            log_path: Path of the indexed log file
+        """
+        self.log_path = Path(log_path)
+        self._entries = None
+
+    @staticmethod
+    def index_path(log_path: Union[str, Path]) -> Path:
+        """Index file belonging to a log file."""
+        return Path(f'{log_path}.idx')
+
+    def entries(self, scenario: Optional[str] = None, status: Optional[str] = None) -> List[Dict]:
+        """
+        Get index entries, optionally filtered.
+
+        Args:
+            scenario: Scenario name to match
+            status: Scenario status to match (e.g. 'failed')
+
+        Returns:
+            List of entries with feature, scenario, status, start and end
+        """
+        if self._entries is None:
+            path = self.index_path(self.log_path)
+            if not path.exists():
+                self._entries = []
+            else:
+                with open(path, encoding='utf-8') as index_file:
+                    self._entries = [json_codec.loads(line) for line in index_file if line.strip()]
+        return [entry for entry in self._entries
+                if (scenario is None or entry.get('scenario') == scenario)
+                and (status is None or entry.get('status') == status)]
+
+    def segment_path(self, segment: int) -> Path:
+        """
+        Find the file holding a segment of the log.
+
+        Args:
+            segment: Segment number from an index entry
+
+        Returns:
+            Rotated (possibly compressed) segment, or the active log file
+
+        Raises:
+            FileNotFoundError: If the segment was removed by log retention
+        """
+        rotated = Path(f'{self.log_path}.{segment}')
+        for candidate in [Path(f'{rotated}{suffix}') for suffix in COMPRESSED_SUFFIXES] + [rotated]:
+            if candidate.exists():
+                return candidate
+        # Only the newest segment is still being written to (not rotated yet)
+        if segment < max((entry.get('segment', 0) for entry in self.entries()), default=0):
+            raise FileNotFoundError(f"Log segment {rotated} no longer exists (retention)")
+        return self.log_path
+
+    def excerpt(self, entry: Dict, max_bytes: Optional[int] = None) -> str:
+        """
+        Read the log lines of one indexed scenario.
+
+        Args:
+            entry: Index entry
+            max_bytes: Keep only the last max_bytes of the range
+
+        Returns:
+            Log text of the scenario
+        """
+        start, end = entry['start'], entry['end']
+        if max_bytes is not None:
+            start = max(start, end - max_bytes)
+        with open_log(self.segment_path(entry.get('segment', 0))) as log_file:
+            log_file.seek(start)
+            data = log_file.read(end - start)
+        return data.decode('utf-8', errors='replace')
@@ -0,0 +1,156 @@
+"""
+Log Rotation Module
+Size- and time-based rotation of the run's log files. Rotated segments are
+compressed (gzip or lzma) on a background thread and old log files are
+removed according to a retention policy, so logs/ stays bounded on
+long-lived agents.
+"""
+
+import gzip
+import lzma
+import os
+import shutil
+import threading
+import time
+from pathlib import Path
+from typing import Dict, List, Optional, Union
+
+from core.log_index import IndexedFileHandler
+
+COMPRESSORS = {'gzip': ('.gz', gzip.open), 'lzma': ('.xz', lzma.open)}
+
+
+class RotatingLogHandler(IndexedFileHandler):
+    """
+    Indexed file handler with rotation, compression and retention.
+
+    The active file keeps its name; segment ``n`` is renamed to
+    ``<log file>.<n>`` and then compressed to ``<log file>.<n>.gz`` (or
+    ``.xz``). Rotation waits for the open scenario to end, so a scenario's
+    index range stays inside one segment (up to twice ``max_bytes``).
+
+    Example config:
+        logging:
+          rotation:
+            max_bytes: 52428800
+            interval_seconds: 3600
+            compression: gzip
+            backup_count: 20
+            retention_days: 14
+    """
+
+    def __init__(self, filename: Union[str, Path], settings: Optional[Dict] = None,
+                 mode: str = 'a', encoding: str = 'utf-8'):
+        """
+        Initialize handler from the ``logging.rotation`` config block.
+
+        Args:
+            filename: Active log file path
+            settings: Rotation settings dictionary
+            mode: File open mode
+            encoding: File encoding
+        """
+        super().__init__(filename, mode=mode, encoding=encoding)
+        settings = settings or {}
+        self.max_bytes = int(settings.get('max_bytes', 0))
+        self.interval = float(settings.get('interval_seconds', 0))
+        self.backup_count = int(settings.get('backup_count', 0))
+        self.retention_days = float(settings.get('retention_days', 0))
+        compression = settings.get('compression', 'gzip')
+        if compression and compression not in COMPRESSORS:
+            raise ValueError(f"Unknown log compression '{compression}'. Available: {list(COMPRESSORS)}")
+        self.compression = compression or None
+        self._opened_at = time.monotonic()
+        self._compressors: List[threading.Thread] = []
+        self.prune_old_logs()
+
+    def emit(self, record) -> None:
+        if self._should_rollover():
+            self.rollover()
+        super().emit(record)
+
+    def _should_rollover(self) -> bool:
+        """Check size/age limits; rotation is postponed while a scenario is open."""
+        if self.stream is None:
+            return False
+        # Records are flushed after each emit, so the buffer position is the file size
+        size = self.stream.buffer.tell() if self.max_bytes else 0
+        if self._start is not None and not (self.max_bytes and size >= 2 * self.max_bytes):
+            return False
+        if self.max_bytes and size >= self.max_bytes:
+            return True
+        return bool(self.interval) and time.monotonic() - self._opened_at >= self.interval
+
+    def rollover(self) -> None:
+        """Close the active file as segment N and start segment N+1."""
+        if self.stream:
+            self.stream.close()
+            self.stream = None
+
+        rotated = Path(f'{self.baseFilename}.{self.segment}')
+        if os.path.exists(self.baseFilename):
+            os.replace(self.baseFilename, rotated)
+        self.segment += 1
+        if self._start is not None:
+            # Scenario outgrew the hard cap: its range restarts in the new segment
+            self._start = 0
+
+        self.stream = self._open()
+        self._opened_at = time.monotonic()
+
+        if self.compression and rotated.exists():
+            thread = threading.Thread(target=self._compress, args=(rotated,),
+                                      name='log-compress', daemon=True)
+            thread.start()
+            self._compressors = [t for t in self._compressors if t.is_alive()] + [thread]
+        else:
+            self.prune_old_logs()
+
+    def _compress(self, path: Path) -> None:
+        """Compress a rotated segment, then apply retention."""
+        suffix, opener = COMPRESSORS[self.compression]
+        target = Path(f'{path}{suffix}')
+        partial = Path(f'{target}.tmp')
+        try:
+            with open(path, 'rb') as source, opener(partial, 'wb') as destination:
+                shutil.copyfileobj(source, destination, 1024 * 1024)
+            os.replace(partial, target)
+            path.unlink()
+        except OSError:
+            partial.unlink(missing_ok=True)
+            return
+        self.prune_old_logs()
+
+    def _segments(self) -> Dict[int, List[Path]]:
+        """Files of each rotated segment of the active file, by segment number."""
+        base = Path(self.baseFilename)
+        segments = {}
+        for path in base.parent.glob(f'{base.name}.*'):
+            number = path.name[len(base.name) + 1:].split('.', 1)[0]
+            if number.isdigit() and not path.name.endswith('.tmp'):
+                segments.setdefault(int(number), []).append(path)
+        return segments
+
+    def prune_old_logs(self) -> None:
+        """Apply retention: keep backup_count segments and drop log files older than retention_days."""
+        if self.backup_count:
+            segments = self._segments()
+            for number in sorted(segments)[:-self.backup_count]:
+                for path in segments[number]:
+                    path.unlink(missing_ok=True)
+
+        if self.retention_days:
+            cutoff = time.time() - self.retention_days * 86400
+            log_dir = Path(self.baseFilename).parent
+            for path in log_dir.glob('automation_*'):
+                try:
+                    if path.is_file() and path.stat().st_mtime < cutoff:
+                        path.unlink()
+                except OSError:
+                    continue
+
+    def close(self) -> None:
+        """Close the file and wait for pending compressions."""
+        super().close()
+        for thread in self._compressors:
+            thread.join()
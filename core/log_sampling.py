@@ -0,0 +1,126 @@
+"""
+Log Sampling Module
+Thins out per-request INFO logging for load and large regression runs: only
+1-in-N successful requests per endpoint are logged, while errors and slow
+requests always are. Suppressed counts are summarized periodically.
+"""
+
+import threading
+import time
+from collections import defaultdict
+from typing import Dict, Optional
+
+from core.logger import Logger
+
+
+class RequestLogSampler:
+    """
+    Per-endpoint 1-in-N sampler for request/response log lines.
+
+    Example config:
+        logging:
+          sampling:
+            enabled: true
+            every_n: 10
+            slow_ms: 2000
+            summary_interval: 60
+            endpoints:
+              /bff/v1/catalog/search-school-church-merchant: 50
+    """
+
+    _shared = {}
+    _shared_lock = threading.Lock()
+
+    def __init__(self, settings: Optional[Dict] = None):
+        """
+        Initialize sampler from the ``logging.sampling`` config block.
+
+        Args:
+            settings: Sampling settings dictionary
+        """
+        settings = settings or {}
+        self.logger = Logger.get_logger(__name__)
+        self.enabled = bool(settings.get('enabled', False))
+        self.every_n = max(int(settings.get('every_n', 10)), 1)
+        self.slow_ms = float(settings.get('slow_ms', 2000))
+        self.summary_interval = float(settings.get('summary_interval', 60))
+        self.endpoint_rates = {endpoint: max(int(rate), 1)
+                               for endpoint, rate in (settings.get('endpoints') or {}).items()}
+        self._seen = defaultdict(int)
+        self._suppressed = defaultdict(int)
+        self._lock = threading.Lock()
+        self._last_summary = time.monotonic()
+
+    @classmethod
+    def get_shared(cls, config) -> 'RequestLogSampler':
+        """
+        Get the process-wide sampler for a configuration.
+
+        Args:
+            config: ConfigLoader instance
+
+        Returns:
+            RequestLogSampler shared by all clients of that environment
+        """
+        key = config.get_environment()
+        with cls._shared_lock:
+            if key not in cls._shared:
+                cls._shared[key] = cls(config.get('logging.sampling', {}))
+            return cls._shared[key]
+
+    @staticmethod
+    def _key(endpoint: str) -> str:
+        """Group requests by endpoint path (query strings built into the endpoint are ignored)."""
+        return endpoint.split('?', 1)[0]
+
+    def sample(self, endpoint: str) -> bool:
+        """
+        Decide up front whether a request is logged in full.
+
+        Args:
+            endpoint: API endpoint (path template)
+
+        Returns:
+            True for the first and every N-th request of the endpoint
+        """
+        if not self.enabled:
+            return True
+        key = self._key(endpoint)
+        with self._lock:
+            count = self._seen[key]
+            self._seen[key] = count + 1
+        return count % self.endpoint_rates.get(key, self.every_n) == 0
+
+    def keep(self, endpoint: str, sampled: bool, status_code: Optional[int], duration_ms: float) -> bool:
+        """
+        Decide after the response whether the request is logged.
+
+        Args:
+            endpoint: API endpoint (path template)
+            sampled: Result of :meth:`sample` for this request
+            status_code: Response status (None if no response)
+            duration_ms: Request duration in milliseconds
+
+        Returns:
+            True if the request/response lines should be logged
+        """
+        if not self.enabled:
+            return True
+        keep = sampled or status_code is None or status_code >= 400 or duration_ms >= self.slow_ms
+        if not keep:
+            with self._lock:
+                self._suppressed[self._key(endpoint)] += 1
+        if self.summary_interval > 0 and time.monotonic() - self._last_summary >= self.summary_interval:
+            self.summarize()
+        return keep
+
+    def summarize(self) -> None:
+        """Log and reset the suppressed-request counts."""
+        with self._lock:
+            suppressed, self._suppressed = self._suppressed, defaultdict(int)
+            self._last_summary = time.monotonic()
+        if suppressed:
+            total = sum(suppressed.values())
+            details = ', '.join(f"{endpoint}: {count}" for endpoint, count in
+                                sorted(suppressed.items(), key=lambda item: -item[1]))
+            self.logger.info(f"📉 Log sampling suppressed {total} request log(s) - {details}")
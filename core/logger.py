@@ -2,108 +2,265 @@
 Logger Module
 Provides centralized logging configuration for the framework.
 Supports console and file logging with color-coded output.
+
+Loggers only put records on a queue; a single background listener owns the
+console and file sinks, so terminal and disk I/O never run on the test thread.
 """
 
+import atexit
 import logging
-import os
+import queue
+import threading
 from datetime import datetime
+from logging.handlers import QueueHandler, QueueListener
 from pathlib import Path
+from typing import Dict, Optional
 import colorlog
 
+from core.debug_buffer import DebugRingBuffer
+from core.log_index import IndexedFileHandler
+from core.log_rotation import RotatingLogHandler
+from core.structured_logging import CorrelationFilter, JSONLinesFormatter
+
 
 class Logger:
     """
     Singleton Logger class for centralized logging.
     Provides colored console output and file logging.
     """
-    
+
     _loggers = {}
     _log_dir = None
-    
+    _log_file = None
+
+    # Queue pipeline shared by all loggers
+    _queue = None
+    _queue_handler = None
+    _listener = None
+    _console_handler = None
+    _file_handler = None
+    _json_handler = None
+    _timestamp = None
+    _rotation = None
+    _debug_buffer = None
+    _pipeline_lock = threading.RLock()
+
     @classmethod
-    def setup_logging(cls, log_level: str = 'INFO', 
-                     console: bool = True, 
+    def setup_logging(cls, log_level: str = 'INFO',
+                     console: bool = True,
                      file_logging: bool = True,
-                     log_file_path: str = None) -> None:
+                     log_file_path: str = None,
+                     structured: bool = False,
+                     rotation: Optional[Dict] = None) -> None:
         """
         Setup global logging configuration.
-        
+
         Args:
             log_level: Logging level (DEBUG, INFO, WARNING, ERROR, CRITICAL)
             console: Enable console logging
             file_logging: Enable file logging
             log_file_path: Custom log file path
+            structured: Also write JSON lines (automation_<ts>.jsonl) with correlation IDs
+            rotation: ``logging.rotation`` settings (size/time rotation, compression, retention)
         """
         # Create logs directory
-        if file_logging:
+        if file_logging or structured:
             cls._log_dir = Path(log_file_path).parent if log_file_path else Path('logs')
             cls._log_dir.mkdir(exist_ok=True)
-        
+
         # Set root logger level
         logging.root.setLevel(getattr(logging, log_level.upper()))
-    
+
+        with cls._pipeline_lock:
+            cls._ensure_pipeline()
+            if rotation and rotation.get('enabled', True):
+                cls._rotation = rotation
+            # Records below the configured level never reach the queue (the debug buffer may still keep them)
+            cls._queue_handler.setLevel(getattr(logging, log_level.upper()))
+            if not console:
+                cls._console_handler = None
+            if file_logging and cls._file_handler is None:
+                cls._file_handler = cls._create_file_handler()
+            if structured and cls._json_handler is None:
+                cls._json_handler = cls._create_json_handler()
+            cls._listener.handlers = cls._sinks()
+
+    @classmethod
+    def _create_console_handler(cls) -> logging.Handler:
+        """Create the colored console sink."""
+        console_handler = colorlog.StreamHandler()
+        console_formatter = colorlog.ColoredFormatter(
+            '%(log_color)s%(asctime)s - %(name)s - %(levelname)s - %(message)s%(reset)s',
+            datefmt='%Y-%m-%d %H:%M:%S',
+            log_colors={
+                'DEBUG': 'cyan',
+                'INFO': 'green',
+                'WARNING': 'yellow',
+                'ERROR': 'red',
+                'CRITICAL': 'red,bg_white',
+            }
+        )
+        console_handler.setFormatter(console_formatter)
+        return console_handler
+
+    @classmethod
+    def _create_file_handler(cls) -> logging.Handler:
+        """Create the file sink - one log file per run, with a scenario offset index."""
+        cls._log_file = cls._log_dir / f'automation_{cls._run_timestamp()}.log'
+
+        file_handler = cls._open_log_file(cls._log_file)
+        file_formatter = logging.Formatter(
+            '%(asctime)s - %(name)s - %(levelname)s - %(message)s',
+            datefmt='%Y-%m-%d %H:%M:%S'
+        )
+        file_handler.setFormatter(file_formatter)
+        return file_handler
+
+    @classmethod
+    def _create_json_handler(cls) -> logging.Handler:
+        """Create the JSON-lines sink next to the text log."""
+        json_handler = cls._open_log_file(cls._log_dir / f'automation_{cls._run_timestamp()}.jsonl')
+        json_handler.setFormatter(JSONLinesFormatter())
+        return json_handler
+
+    @classmethod
+    def _open_log_file(cls, path: Path) -> logging.Handler:
+        """Open a file sink, rotating/compressing it when rotation is configured."""
+        if cls._rotation:
+            return RotatingLogHandler(path, cls._rotation)
+        return IndexedFileHandler(path, mode='a', encoding='utf-8')
+
+    @classmethod
+    def _run_timestamp(cls) -> str:
+        """Timestamp shared by all log files of this run."""
+        if cls._timestamp is None:
+            cls._timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+        return cls._timestamp
+
+    @classmethod
+    def _sinks(cls) -> tuple:
+        """Handlers currently owned by the listener."""
+        return tuple(handler for handler in (cls._console_handler, cls._file_handler, cls._json_handler)
+                     if handler)
+
+    @classmethod
+    def _ensure_pipeline(cls) -> None:
+        """Create the queue, queue handler and listener thread on first use."""
+        if cls._listener is not None:
+            return
+
+        cls._queue = queue.SimpleQueue()
+        cls._queue_handler = QueueHandler(cls._queue)
+        cls._queue_handler.addFilter(CorrelationFilter())
+        cls._console_handler = cls._create_console_handler()
+        cls._listener = QueueListener(cls._queue, *cls._sinks(), respect_handler_level=True)
+        cls._listener.start()
+        atexit.register(cls.shutdown)
+
     @classmethod
     def get_logger(cls, name: str, log_level: str = 'INFO') -> logging.Logger:
         """
         Get or create a logger instance.
-        
+
         Args:
             name: Logger name (usually __name__)
             log_level: Logging level
-            
+
         Returns:
             Configured logger instance
         """
         if name in cls._loggers:
             return cls._loggers[name]
-        
+
+        with cls._pipeline_lock:
+            cls._ensure_pipeline()
+
         logger = logging.getLogger(name)
-        logger.setLevel(getattr(logging, log_level.upper()))
+        logger.setLevel(logging.DEBUG if cls._debug_buffer is not None else getattr(logging, log_level.upper()))
         logger.propagate = False
-        
-        # Remove existing handlers
+
+        # Only the queue handler (and the debug buffer) run on the calling thread
         logger.handlers.clear()
-        
-        # Console handler with colors
-        console_handler = colorlog.StreamHandler()
-        console_formatter = colorlog.ColoredFormatter(
-            '%(log_color)s%(asctime)s - %(name)s - %(levelname)s - %(message)s%(reset)s',
-            datefmt='%Y-%m-%d %H:%M:%S',
-            log_colors={
-                'DEBUG': 'cyan',
-                'INFO': 'green',
-                'WARNING': 'yellow',
-                'ERROR': 'red',
-                'CRITICAL': 'red,bg_white',
-            }
-        )
-        console_handler.setFormatter(console_formatter)
-        logger.addHandler(console_handler)
-        
-        # File handler
-        if cls._log_dir:
-            timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-            log_file = cls._log_dir / f'automation_{timestamp}.log'
-            
-            file_handler = logging.FileHandler(log_file, mode='a', encoding='utf-8')
-            file_formatter = logging.Formatter(
-                '%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-                datefmt='%Y-%m-%d %H:%M:%S'
-            )
-            file_handler.setFormatter(file_formatter)
-            logger.addHandler(file_handler)
-        
+        logger.addHandler(cls._queue_handler)
+        if cls._debug_buffer is not None:
+            logger.addHandler(cls._debug_buffer)
+
         cls._loggers[name] = logger
         return logger
-    
+
+    @classmethod
+    def enable_debug_buffer(cls, capacity: int = 5000, dump_dir: str = 'logs/debug') -> DebugRingBuffer:
+        """
+        Capture DEBUG records of every logger in an in-memory ring buffer.
+
+        The console/file sinks keep the configured level; DEBUG records only
+        go to the buffer, which the caller dumps for failed scenarios.
+
+        Args:
+            capacity: Maximum number of records kept per scenario
+            dump_dir: Directory failed-scenario dumps are written to
+
+        Returns:
+            The shared DebugRingBuffer
+        """
+        with cls._pipeline_lock:
+            if cls._debug_buffer is None:
+                cls._ensure_pipeline()
+                cls._debug_buffer = DebugRingBuffer(capacity, dump_dir)
+                for logger in cls._loggers.values():
+                    logger.setLevel(logging.DEBUG)
+                    logger.addHandler(cls._debug_buffer)
+
+                # Step modules log through plain logging.getLogger(), i.e. the root logger;
+                # only the buffer is attached there, so the sinks keep receiving framework records only
+                if logging.root.level > logging.DEBUG:
+                    cls._queue_handler.setLevel(logging.root.level)
+                    logging.root.setLevel(logging.DEBUG)
+                logging.root.addHandler(cls._debug_buffer)
+            return cls._debug_buffer
+
+    @classmethod
+    def flush(cls) -> None:
+        """Write out every queued record and flush the sinks (listener keeps running)."""
+        with cls._pipeline_lock:
+            if cls._listener is None:
+                return
+            # stop() drains the queue before the listener thread exits
+            cls._listener.stop()
+            for handler in cls._sinks():
+                handler.flush()
+            cls._listener.start()
+
+    @classmethod
+    def shutdown(cls) -> None:
+        """Drain the queue, stop the listener and close the sinks."""
+        with cls._pipeline_lock:
+            if cls._listener is None:
+                return
+            cls._listener.stop()
+            for handler in cls._sinks():
+                handler.flush()
+                handler.close()
+            cls._listener = None
+            cls._file_handler = None
+            cls._json_handler = None
+            for logger in cls._loggers.values():
+                logger.handlers.clear()
+            if cls._debug_buffer in logging.root.handlers:
+                logging.root.removeHandler(cls._debug_buffer)
+            cls._debug_buffer = None
+            cls._loggers.clear()
+
     @classmethod
     def get_log_file_path(cls) -> str:
         """
         Get current log file path.
-        
+
         Returns:
             Path to current log file
         """
+        if cls._log_file:
+            return str(cls._log_file)
         if cls._log_dir:
             log_files = sorted(cls._log_dir.glob('automation_*.log'))
             if log_files:
@@ -0,0 +1,160 @@
+"""
+Pagination Module
+Provides a lazy, auto-paginating iterator for page/pageSize endpoints such as
+the school/church/merchant catalog search. The next pages are prefetched
+concurrently, so walking N pages takes roughly N/K round-trips of wall-clock
+time, and iteration can stop as soon as the wanted item is found.
+"""
+
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+from core.logger import Logger
+from utils import json_codec
+
+
+class Paginator:
+    """
+    Iterate items across pages of a paginated GET endpoint.
+
+    Up to ``prefetch`` page requests are kept in flight; pages are still
+    yielded in order. Iteration ends at the last page (a short page or the
+    response's ``totalPages``), at ``max_pages``, or when the consumer stops.
+    A short page is one with fewer items than earlier pages, so a server that
+    caps ``pageSize`` below ``page_size`` is still read to the end.
+
+    Example:
+        paginator = Paginator(api_client, '/bff/v1/catalog/search-school-church-merchant',
+                              params={'type': 'SCHOOL'}, headers=headers, prefetch=4)
+        school = paginator.find(lambda item: item.get('code') == '12345')
+    """
+
+    def __init__(self, api_client, endpoint: str, params: Optional[Dict[str, Any]] = None,
+                 headers: Optional[Dict[str, str]] = None, page_size: int = 100, prefetch: int = 4,
+                 items_path: str = 'content', page_param: str = 'page',
+                 size_param: str = 'pageSize', first_page: int = 0,
+                 max_pages: Optional[int] = None):
+        """
+        Initialize paginator.
+
+        Args:
+            api_client: APIClient used for page requests
+            endpoint: API endpoint
+            params: Query parameters sent with every page
+            headers: Request headers
+            page_size: Items requested per page
+            prefetch: Number of pages requested concurrently (K)
+            items_path: Dotted path to the item list in a page body
+            page_param: Page number query parameter
+            size_param: Page size query parameter
+            first_page: Index of the first page (0 or 1 based APIs)
+            max_pages: Maximum number of pages to read (None for all)
+        """
+        self.api_client = api_client
+        self.endpoint = endpoint
+        self.params = dict(params or {})
+        self.headers = headers
+        self.page_size = page_size
+        self.prefetch = max(int(prefetch), 1)
+        self.items_path = [key for key in items_path.split('.') if key]
+        self.page_param = page_param
+        self.size_param = size_param
+        self.first_page = first_page
+        self.max_pages = max_pages
+        self.logger = Logger.get_logger(__name__)
+        self.pages_fetched = 0
+        self.requests_sent = 0
+
+    def _fetch(self, page: int) -> Tuple[List[Any], Optional[int]]:
+        """
+        Request one page.
+
+        Returns:
+            Tuple of (items, totalPages or None)
+
+        Raises:
+            requests.HTTPError: If the page request fails
+        """
+        params = {**self.params, self.page_param: page, self.size_param: self.page_size}
+        response = self.api_client.get(self.endpoint, params=params, headers=self.headers)
+        response.raise_for_status()
+
+        body = json_codec.parse_response(response)
+        items = body
+        for key in self.items_path:
+            items = items.get(key) if isinstance(items, dict) else None
+        total_pages = body.get('totalPages') if isinstance(body, dict) else None
+        return items or [], total_pages if isinstance(total_pages, int) else None
+
+    def pages(self) -> Iterator[List[Any]]:
+        """
+        Yield the item list of each page in order.
+
+        Yields:
+            List of items of one page
+        """
+        last_page = self.first_page + self.max_pages - 1 if self.max_pages else None
+        next_page = self.first_page
+        page_capacity = 0
+        pending = deque()
+        executor = ThreadPoolExecutor(max_workers=self.prefetch, thread_name_prefix='paginator')
+
+        def submit():
+            nonlocal next_page
+            while len(pending) < self.prefetch and (last_page is None or next_page <= last_page):
+                pending.append((next_page, executor.submit(self._fetch, next_page)))
+                self.requests_sent += 1
+                next_page += 1
+
+        try:
+            submit()
+            while pending:
+                page, future = pending.popleft()
+                items, total_pages = future.result()
+                self.pages_fetched += 1
+
+                if total_pages is not None:
+                    final_page = self.first_page + total_pages - 1
+                    last_page = final_page if last_page is None else min(last_page, final_page)
+                    while pending and pending[-1][0] > last_page:
+                        pending.pop()[1].cancel()
+
+                yield items
+                # A page shorter than earlier ones is the last; the first page only sets the
+                # size, as the server may cap pageSize below the requested page_size
+                if not items or len(items) < page_capacity:
+                    break
+                page_capacity = max(page_capacity, len(items))
+                submit()
+        finally:
+            # Early stop: drop prefetched pages that are no longer needed
+            for _, future in pending:
+                future.cancel()
+            executor.shutdown(wait=False, cancel_futures=True)
+            self.logger.debug(f"Paginator read {self.pages_fetched} pages "
+                              f"({self.requests_sent} requests) from {self.endpoint}")
+
+    def __iter__(self) -> Iterator[Any]:
+        """Yield items across all pages."""
+        for items in self.pages():
+            yield from items
+
+    def find(self, predicate: Callable[[Any], bool]) -> Optional[Any]:
+        """
+        Return the first item matching a predicate, stopping pagination there.
+
+        Args:
+            predicate: Function called with each item
+
+        Returns:
+            First matching item, or None if no page contains one
+        """
+        items = iter(self)
+        try:
+            for item in items:
+                if predicate(item):
+                    return item
+            return None
+        finally:
+            items.close()
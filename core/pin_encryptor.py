@@ -0,0 +1,188 @@
+"""
+PIN Encryptor Module
+Encrypts payment PINs locally with the ``payment-links`` RSA public key, so
+payment scenarios don't depend on static ciphertexts copied from Postman.
+A background thread can keep a pool of fresh ciphertexts ready, so load runs
+never wait for encryption.
+"""
+
+import base64
+import os
+import queue
+import threading
+from pathlib import Path
+from typing import Dict, Optional
+
+from core.logger import Logger
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+
+
+class PinEncryptor:
+    """
+    RSA PIN encryptor with an optional pre-encrypted PIN pool.
+
+    When ``pin_encryption.enabled`` is false (or no key/PIN is configured)
+    :meth:`next_pin` simply returns the caller's static fallback, so steps can
+    call it unconditionally.
+
+    Example config:
+        pin_encryption:
+          enabled: true
+          public_key_alias: payment-links
+          public_key_file: config/keys/payment-links.pem
+          padding: pkcs1v15
+          pin_env: PAYMENT_PIN
+          pool_size: 32
+    """
+
+    PADDINGS = ('pkcs1v15', 'oaep-sha1', 'oaep-sha256')
+
+    _shared = {}
+    _shared_lock = threading.Lock()
+
+    def __init__(self, settings: Optional[Dict] = None):
+        """
+        Initialize encryptor from the ``pin_encryption`` config block.
+
+        Args:
+            settings: PIN encryption settings dictionary
+        """
+        settings = settings or {}
+        self.logger = Logger.get_logger(__name__)
+        self.alias = settings.get('public_key_alias', 'payment-links')
+        self.padding_name = settings.get('padding', 'pkcs1v15')
+        self.pool_size = int(settings.get('pool_size', 0))
+        self.pin = os.getenv(settings.get('pin_env', 'PAYMENT_PIN')) or settings.get('pin')
+        self._pools: Dict[str, queue.Queue] = {}
+        self._stop = threading.Event()
+        self._public_key = None
+        self._padding = None
+
+        if self.padding_name not in self.PADDINGS:
+            raise ValueError(f"Unknown PIN padding '{self.padding_name}'. Available: {self.PADDINGS}")
+
+        key_data = self._read_key(settings)
+        self.enabled = bool(settings.get('enabled', False)) and key_data is not None
+        if settings.get('enabled') and key_data is None:
+            self.logger.warning("PIN encryption enabled but no public key configured - using static PINs")
+        if self.enabled:
+            self._load_key(key_data)
+            if self.pin and self.pool_size > 0:
+                self.start_pool(self.pin)
+
+    @classmethod
+    def get_shared(cls, config) -> 'PinEncryptor':
+        """
+        Get the process-wide encryptor for a configuration.
+
+        Args:
+            config: ConfigLoader instance
+
+        Returns:
+            PinEncryptor shared by all scenarios of that environment
+        """
+        key = config.get_environment()
+        with cls._shared_lock:
+            if key not in cls._shared:
+                cls._shared[key] = cls(config.get('pin_encryption', {}))
+            return cls._shared[key]
+
+    @staticmethod
+    def _read_key(settings: Dict) -> Optional[bytes]:
+        """Read the public key from config (inline or file), None if not set."""
+        inline = settings.get('public_key')
+        if inline:
+            return inline.encode('utf-8') if isinstance(inline, str) else inline
+
+        key_file = settings.get('public_key_file')
+        if key_file:
+            path = Path(key_file)
+            path = path if path.is_absolute() else PROJECT_ROOT / path
+            return path.read_bytes()
+        return None
+
+    def _load_key(self, key_data: bytes) -> None:
+        """Parse a PEM or bare base64 X.509 (SubjectPublicKeyInfo) public key once."""
+        from cryptography.hazmat.primitives import hashes, serialization
+        from cryptography.hazmat.primitives.asymmetric import padding
+
+        key_data = key_data.strip()
+        if key_data.startswith(b'-----BEGIN'):
+            self._public_key = serialization.load_pem_public_key(key_data)
+        else:
+            self._public_key = serialization.load_der_public_key(base64.b64decode(key_data))
+
+        if self.padding_name == 'pkcs1v15':
+            self._padding = padding.PKCS1v15()
+        else:
+            algorithm = hashes.SHA1() if self.padding_name == 'oaep-sha1' else hashes.SHA256()
+            self._padding = padding.OAEP(mgf=padding.MGF1(algorithm=algorithm), algorithm=algorithm, label=None)
+
+        self.logger.info(f"🔐 Loaded '{self.alias}' public key ({self._public_key.key_size} bit, {self.padding_name})")
+
+    def encrypt(self, pin: str) -> str:
+        """
+        Encrypt a PIN.
+
+        Args:
+            pin: Clear-text PIN
+
+        Returns:
+            Base64 encoded ciphertext (different on every call)
+        """
+        if self._public_key is None:
+            raise RuntimeError("PIN encryption is not configured (pin_encryption.public_key)")
+        return base64.b64encode(self._public_key.encrypt(pin.encode('utf-8'), self._padding)).decode('ascii')
+
+    def start_pool(self, pin: str, size: Optional[int] = None) -> None:
+        """
+        Keep a pool of pre-encrypted ciphertexts for a PIN, refilled in the background.
+
+        Args:
+            pin: Clear-text PIN
+            size: Number of ciphertexts kept ready (defaults to pool_size)
+        """
+        if pin in self._pools:
+            return
+        pool = queue.Queue(maxsize=size or self.pool_size or 1)
+        self._pools[pin] = pool
+
+        def refill():
+            while not self._stop.is_set():
+                ciphertext = self.encrypt(pin)
+                while not self._stop.is_set():
+                    try:
+                        pool.put(ciphertext, timeout=0.5)
+                        break
+                    except queue.Full:
+                        continue
+
+        threading.Thread(target=refill, name='pin-pool', daemon=True).start()
+
+    def next_pin(self, fallback: Optional[str] = None, pin: Optional[str] = None) -> Optional[str]:
+        """
+        Get a fresh encrypted PIN without blocking on a pooled one.
+
+        Args:
+            fallback: Static ciphertext returned when encryption is disabled
+            pin: Clear-text PIN (defaults to the configured PIN)
+
+        Returns:
+            Base64 ciphertext, or fallback
+        """
+        pin = pin or self.pin
+        if not self.enabled or not pin:
+            return fallback
+
+        pool = self._pools.get(pin)
+        if pool is not None:
+            try:
+                return pool.get_nowait()
+            except queue.Empty:
+                pass
+        return self.encrypt(pin)
+
+    def stop(self) -> None:
+        """Stop background pool threads."""
+        self._stop.set()
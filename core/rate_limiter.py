@@ -0,0 +1,286 @@
+"""
+Rate Limiter Module
+Provides client-side token-bucket rate limiting for API requests.
+Buckets are kept per endpoint template and per test identity, and are
+shared by every APIClient, thread and asyncio task in the process.
+"""
+
+import asyncio
+import hashlib
+import re
+import threading
+import time
+from typing import Dict, List, Optional, Pattern, Tuple
+from urllib.parse import urlsplit
+
+from core.logger import Logger
+
+
+class TokenBucket:
+    """
+    Thread-safe token bucket.
+
+    Callers reserve tokens up front and sleep for the returned delay, so
+    concurrent callers are queued behind each other and requests leave at
+    a smooth, steady rate instead of in bursts.
+    """
+
+    def __init__(self, rate: float, burst: float):
+        """
+        Initialize token bucket.
+
+        Args:
+            rate: Tokens added per second (sustained requests per second)
+            burst: Maximum number of tokens the bucket can hold
+        """
+        self.rate = float(rate)
+        self.burst = max(float(burst), 1.0)
+        self._tokens = self.burst
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _refill(self, now: float) -> None:
+        """Add tokens accumulated since last update (caller holds lock)."""
+        elapsed = now - self._updated
+        if elapsed > 0:
+            self._tokens = min(self.burst, self._tokens + elapsed * self.rate)
+            self._updated = now
+
+    def reserve(self, tokens: float = 1.0) -> float:
+        """
+        Reserve tokens and return how long the caller must wait.
+
+        Args:
+            tokens: Number of tokens to take
+
+        Returns:
+            Delay in seconds before the reserved request may be sent
+        """
+        with self._lock:
+            self._refill(time.monotonic())
+            self._tokens -= tokens
+            if self._tokens >= 0:
+                return 0.0
+            return -self._tokens / self.rate
+
+    def penalize(self, seconds: float) -> None:
+        """
+        Block the bucket for the given time (e.g. from a Retry-After header).
+
+        Args:
+            seconds: Time during which no tokens should be handed out
+        """
+        with self._lock:
+            self._refill(time.monotonic())
+            self._tokens = min(self._tokens, -seconds * self.rate)
+
+    @property
+    def available(self) -> float:
+        """Current number of tokens (negative while requests are queued)."""
+        with self._lock:
+            self._refill(time.monotonic())
+            return self._tokens
+
+
+class RateLimiter:
+    """
+    Client-side rate limiter for APIClient.
+
+    Each request takes one token from the bucket of the endpoint template it
+    matches and one from the bucket of the identity (bearer token) sending
+    it. Endpoints without a configured limit use the default bucket.
+    """
+
+    _shared = {}
+    _shared_lock = threading.Lock()
+
+    def __init__(self, settings: Optional[Dict] = None):
+        """
+        Initialize rate limiter from the ``api.rate_limit`` config block.
+
+        Args:
+            settings: Rate limit settings dictionary
+        """
+        settings = settings or {}
+        self.logger = Logger.get_logger(__name__)
+        self.enabled = bool(settings.get('enabled', False))
+        self._default = self._parse_limit(settings.get('default'))
+        self._identity = self._parse_limit(settings.get('per_identity'))
+        self._templates: List[Tuple[str, Pattern, Tuple[float, float]]] = []
+        self._buckets: Dict[Tuple[str, str], TokenBucket] = {}
+        self._lock = threading.Lock()
+
+        for template, limit in (settings.get('endpoints') or {}).items():
+            parsed = self._parse_limit(limit)
+            if parsed:
+                self._templates.append((template, self._compile_template(template), parsed))
+
+    @classmethod
+    def get_shared(cls, config) -> 'RateLimiter':
+        """
+        Get the process-wide rate limiter for a configuration.
+
+        Args:
+            config: ConfigLoader instance
+
+        Returns:
+            RateLimiter shared by all clients of that environment
+        """
+        key = config.get_environment()
+        with cls._shared_lock:
+            if key not in cls._shared:
+                cls._shared[key] = cls(config.get('api.rate_limit', {}))
+            return cls._shared[key]
+
+    @staticmethod
+    def _parse_limit(limit: Optional[Dict]) -> Optional[Tuple[float, float]]:
+        """Convert a ``{rate, burst}`` block to a tuple, or None if unlimited."""
+        if not limit:
+            return None
+        rate = float(limit.get('rate', 0) or 0)
+        if rate <= 0:
+            return None
+        return rate, float(limit.get('burst', rate))
+
+    @staticmethod
+    def _compile_template(template: str) -> Pattern:
+        """
+        Compile an endpoint template into a path regex.
+
+        Example:
+            /bff/v1/payment/instruments/{instrument_id}
+            -> ^/bff/v1/payment/instruments/[^/]+$
+        """
+        parts = re.split(r'(\{[^}]+\})', '/' + template.strip('/'))
+        regex = ''.join('[^/]+' if p.startswith('{') else re.escape(p) for p in parts)
+        return re.compile(f'^{regex}/?$')
+
+    @staticmethod
+    def identity_key(headers: Optional[Dict[str, str]]) -> Optional[str]:
+        """
+        Derive a stable, non-reversible identity key from request headers.
+
+        Args:
+            headers: Effective request headers
+
+        Returns:
+            Short hash of the Authorization header, or None if absent
+        """
+        if not headers:
+            return None
+        auth = headers.get('Authorization') or headers.get('authorization')
+        if not auth:
+            return None
+        return hashlib.sha256(auth.encode('utf-8')).hexdigest()[:16]
+
+    def _bucket(self, kind: str, key: str, limit: Tuple[float, float]) -> TokenBucket:
+        """Get or create the bucket for a (kind, key) pair."""
+        bucket = self._buckets.get((kind, key))
+        if bucket is None:
+            with self._lock:
+                bucket = self._buckets.setdefault((kind, key), TokenBucket(*limit))
+        return bucket
+
+    def _match_endpoint(self, url: str) -> Tuple[str, Optional[Tuple[float, float]]]:
+        """Find the endpoint template and limit that apply to a URL."""
+        path = urlsplit(url).path or '/'
+        for template, pattern, limit in self._templates:
+            if pattern.match(path):
+                return template, limit
+        return '*', self._default
+
+    def buckets_for(self, url: str, headers: Optional[Dict[str, str]] = None) -> List[TokenBucket]:
+        """
+        Get the buckets a request has to take tokens from.
+
+        Args:
+            url: Request URL or path
+            headers: Effective request headers
+
+        Returns:
+            List of buckets (empty when limiting is disabled)
+        """
+        if not self.enabled:
+            return []
+
+        buckets = []
+        template, limit = self._match_endpoint(url)
+        if limit:
+            buckets.append(self._bucket('endpoint', template, limit))
+
+        identity = self.identity_key(headers)
+        if identity and self._identity:
+            buckets.append(self._bucket('identity', identity, self._identity))
+
+        return buckets
+
+    def _reserve(self, url: str, headers: Optional[Dict[str, str]]) -> float:
+        """Reserve one token from every applicable bucket and return the delay."""
+        return max((b.reserve() for b in self.buckets_for(url, headers)), default=0.0)
+
+    def acquire(self, url: str, headers: Optional[Dict[str, str]] = None) -> float:
+        """
+        Block the calling thread until the request may be sent.
+
+        Args:
+            url: Request URL or path
+            headers: Effective request headers
+
+        Returns:
+            Time waited in seconds
+        """
+        delay = self._reserve(url, headers)
+        if delay > 0:
+            self.logger.debug(f"Rate limit: pacing {url} by {delay * 1000:.0f}ms")
+            time.sleep(delay)
+        return delay
+
+    async def acquire_async(self, url: str, headers: Optional[Dict[str, str]] = None) -> float:
+        """
+        Wait without blocking the event loop until the request may be sent.
+
+        Args:
+            url: Request URL or path
+            headers: Effective request headers
+
+        Returns:
+            Time waited in seconds
+        """
+        delay = self._reserve(url, headers)
+        if delay > 0:
+            self.logger.debug(f"Rate limit: pacing {url} by {delay * 1000:.0f}ms")
+            await asyncio.sleep(delay)
+        return delay
+
+    def penalize(self, url: str, headers: Optional[Dict[str, str]], seconds: float) -> None:
+        """
+        Pause the buckets of a request after the server throttled it.
+
+        Args:
+            url: Request URL or path
+            headers: Effective request headers
+            seconds: Pause duration (Retry-After)
+        """
+        for bucket in self.buckets_for(url, headers):
+            bucket.penalize(seconds)
+        if self.enabled:
+            self.logger.warning(f"Rate limit: server throttled {url}, pausing for {seconds:.1f}s")
+
+    def wait_after_throttle(self, url: str, headers: Optional[Dict[str, str]], seconds: float) -> float:
+        """
+        Pause the buckets of a throttled request, then wait until it may be re-sent.
+
+        Args:
+            url: Request URL or path
+            headers: Effective request headers
+            seconds: Pause duration (Retry-After)
+
+        Returns:
+            Time waited in seconds
+        """
+        self.penalize(url, headers, seconds)
+        if not self.buckets_for(url, headers):
+            # No bucket applies to this request: honor Retry-After directly
+            time.sleep(seconds)
+            return seconds
+        return self.acquire(url, headers)
@@ -0,0 +1,298 @@
+"""
+Step Index Module
+Faster step-definition matching for behave's step registry. Step patterns are
+indexed in a trie by their literal prefix (the text before the first
+``{field}``), so a step is only tried against the definitions whose prefix it
+starts with, and the matching definition of each step text is cached across
+scenarios (outline rows repeat the same step text many times).
+"""
+
+import threading
+import time
+from typing import Dict, List, Optional, Tuple
+
+from behave.matchers import Match, ParseMatcher, get_matcher
+# behave's main() replaces step_registry.registry (reset_runtime) after this
+# import; the runner and the step decorators keep using this original registry
+from behave.runner import the_step_registry as behave_registry
+from behave.step_registry import AmbiguousStep
+from behave.textutil import text as _text
+
+from core.logger import Logger
+
+# Order of the candidate lists behave tries: the step's own type, then generic @step
+TYPE_SPECIFIC, GENERIC = 0, 1
+
+
+class _TrieNode:
+    """Trie node: child nodes by character and the definitions whose prefix ends here."""
+
+    __slots__ = ('children', 'definitions')
+
+    def __init__(self):
+        self.children: Dict[str, '_TrieNode'] = {}
+        self.definitions: List[Tuple[int, object]] = []
+
+
+class StepIndex:
+    """
+    Prefix-trie index and match cache over a behave ``StepRegistry``.
+
+    Matching semantics are unchanged: candidates are tried in behave's order
+    (registration order, type-specific definitions before generic ``@step``
+    ones) and the first definition that matches wins. Parse patterns match
+    case-insensitively and in full, so a definition can only match step text
+    that starts with its (lower-cased) literal prefix.
+
+    Installed from environment.py, before behave loads the step modules.
+    """
+
+    _installed = None
+    _install_lock = threading.Lock()
+
+    def __init__(self, registry=None):
+        """
+        Initialize index.
+
+        Args:
+            registry: behave StepRegistry to index (default: the registry behave's runner uses)
+        """
+        self.registry = registry or behave_registry
+        self._tries: Dict[str, _TrieNode] = {}
+        self._cache: Dict[Tuple[str, str], object] = {}
+        self._lock = threading.Lock()
+        self.lookups = 0
+        self.cache_hits = 0
+        self.candidates_tried = 0
+        self.match_seconds = 0.0
+        self.reindex()
+
+    @classmethod
+    def install(cls) -> 'StepIndex':
+        """
+        Route the registry's step lookups through the index (once per process).
+
+        Returns:
+            The installed index
+        """
+        with cls._install_lock:
+            if cls._installed is None:
+                cls._installed = index = cls()
+                registry = index.registry
+                registry.add_step_definition = index.add_step_definition
+                registry.find_match = index.find_match
+                registry.find_step_definition = index.find_step_definition
+            return cls._installed
+
+    @classmethod
+    def installed(cls) -> Optional['StepIndex']:
+        """
+        Get the installed index.
+
+        Returns:
+            The index routing the registry's lookups, or None if not installed
+        """
+        return cls._installed
+
+    @staticmethod
+    def literal_prefix(step_definition) -> str:
+        """
+        Get the lower-cased literal text a step definition's pattern starts with.
+
+        Args:
+            step_definition: behave Matcher
+
+        Returns:
+            Literal prefix ('' for regex matchers, which are always tried)
+        """
+        if not isinstance(step_definition, ParseMatcher):
+            return ''
+        prefix = []
+        for char in step_definition.pattern:
+            # Stop at the first field, and keep the prefix ASCII so lower() agrees with re.IGNORECASE
+            if char in '{}' or not char.isascii():
+                break
+            prefix.append(char)
+        return ''.join(prefix).lower()
+
+    def add_step_definition(self, keyword: str, step_text: str, func) -> None:
+        """
+        Drop-in for ``StepRegistry.add_step_definition``.
+
+        Same duplicate and ambiguity checks as behave, but only against the
+        definitions whose prefix the new pattern starts with.
+
+        Args:
+            keyword: Step decorator keyword
+            step_text: Step pattern
+            func: Step implementation
+
+        Raises:
+            AmbiguousStep: If an existing definition already matches the pattern
+        """
+        step_location = Match.make_location(func)
+        step_type = keyword.lower()
+        step_text = _text(step_text)
+        for _, existing in sorted(self._candidates(step_type, step_text.lower(), TYPE_SPECIFIC),
+                                  key=lambda candidate: candidate[0]):
+            if self.registry.same_step_definition(existing, step_text, step_location):
+                # Same step function registered again (a step module importing another one)
+                return
+            if existing.match(step_text):
+                existing.step_type = step_type
+                raise AmbiguousStep(
+                    f"@{step_type}('{step_text}') has already been defined in\n"
+                    f"  existing step {existing.describe()} at {existing.location}"
+                )
+        step_definitions = self.registry.steps[step_type]
+        step_definitions.append(get_matcher(func, step_text))
+        self.add(step_type, len(step_definitions) - 1, step_definitions[-1])
+
+    def add(self, step_type: str, position: int, step_definition) -> None:
+        """
+        Index a step definition and clear the match cache.
+
+        Args:
+            step_type: Step type the definition is registered for
+            position: Position of the definition in the registry's list
+            step_definition: behave Matcher
+        """
+        with self._lock:
+            node = self._tries.setdefault(step_type, _TrieNode())
+            for char in self.literal_prefix(step_definition):
+                node = node.children.setdefault(char, _TrieNode())
+            node.definitions.append((position, step_definition))
+            self._cache.clear()
+
+    def reindex(self) -> None:
+        """Rebuild the tries from the registry."""
+        self._tries = {}
+        for step_type, step_definitions in self.registry.steps.items():
+            for position, step_definition in enumerate(step_definitions):
+                self.add(step_type, position, step_definition)
+        self._cache.clear()
+
+    def _candidates(self, step_type: str, text: str, group: int) -> List[Tuple[Tuple[int, int], object]]:
+        """Definitions of a step type whose literal prefix the text starts with."""
+        node = self._tries.get(step_type)
+        candidates = []
+        for char in text:
+            if node is None:
+                break
+            candidates.extend(((group, position), d) for position, d in node.definitions)
+            node = node.children.get(char)
+        else:
+            if node is not None:
+                candidates.extend(((group, position), d) for position, d in node.definitions)
+        return candidates
+
+    def lookup(self, step_type: str, text: str):
+        """
+        Find the step definition matching a step, using the cache.
+
+        Args:
+            step_type: Step type ('given', 'when', 'then' or 'step')
+            text: Step text (without keyword)
+
+        Returns:
+            Matching behave Matcher, or None if the step is undefined
+        """
+        start = time.perf_counter()
+        key = (step_type, text)
+        self.lookups += 1
+        if key in self._cache:
+            self.cache_hits += 1
+            step_definition = self._cache[key]
+        else:
+            step_definition, tried = self._resolve(step_type, text)
+            self.candidates_tried += tried
+            self._cache[key] = step_definition
+        self.match_seconds += time.perf_counter() - start
+        return step_definition
+
+    def peek(self, step_type: str, text: str):
+        """
+        Find the step definition matching a step without counting a lookup.
+
+        For reporting code (e.g. the step profiler) that resolves steps
+        behave has already matched, so the matching statistics stay accurate.
+
+        Args:
+            step_type: Step type ('given', 'when', 'then' or 'step')
+            text: Step text (without keyword)
+
+        Returns:
+            Matching behave Matcher, or None if the step is undefined
+        """
+        key = (step_type, text)
+        if key in self._cache:
+            return self._cache[key]
+        return self._resolve(step_type, text)[0]
+
+    def _resolve(self, step_type: str, text: str) -> Tuple[object, int]:
+        """Try the candidate definitions in behave's order; returns (definition or None, candidates tried)."""
+        lowered = text.lower()
+        candidates = self._candidates(step_type, lowered, TYPE_SPECIFIC)
+        if step_type != 'step':
+            candidates += self._candidates('step', lowered, GENERIC)
+        candidates.sort(key=lambda candidate: candidate[0])
+
+        for tried, (_, candidate) in enumerate(candidates, 1):
+            if candidate.match(text):
+                return candidate, tried
+        return None, len(candidates)
+
+    def find_step_definition(self, step):
+        """
+        Drop-in for ``StepRegistry.find_step_definition``.
+
+        Args:
+            step: behave Step
+
+        Returns:
+            Matching behave Matcher, or None
+        """
+        return self.lookup(step.step_type, step.name)
+
+    def find_match(self, step):
+        """
+        Drop-in for ``StepRegistry.find_match``.
+
+        Args:
+            step: behave Step
+
+        Returns:
+            behave Match with the step's arguments, or None
+        """
+        step_definition = self.lookup(step.step_type, step.name)
+        # Arguments are extracted per step, so no Match object is shared between steps
+        return step_definition.match(step.name) if step_definition else None
+
+    def stats(self) -> Dict:
+        """
+        Get matching statistics.
+
+        Returns:
+            Dictionary with definitions, lookups, cache hits, candidates tried and time
+        """
+        return {
+            'definitions': sum(len(d) for d in self.registry.steps.values()),
+            'lookups': self.lookups,
+            'cache_hits': self.cache_hits,
+            'candidates_tried': self.candidates_tried,
+            'match_ms': round(self.match_seconds * 1000, 1)
+        }
+
+    def report(self) -> None:
+        """Log the matching cost of the run."""
+        stats = self.stats()
+        if not stats['lookups']:
+            return
+        logger = Logger.get_logger(__name__)
+        misses = stats['lookups'] - stats['cache_hits']
+        per_miss = stats['candidates_tried'] / misses if misses else 0
+        logger.info(
+            f"🔎 Step matching: {stats['lookups']} lookups over {stats['definitions']} definitions, "
+            f"{stats['cache_hits']} cached, {per_miss:.1f} candidates per uncached lookup, "
+            f"{stats['match_ms']} ms"
+        )
@@ -0,0 +1,219 @@
+"""
+Step Profiler Module
+Records the wall time of every step invocation, split into network time
+(spent in APIClient HTTP calls) and local time, aggregates it per step
+definition across the run and writes a ranked report.
+"""
+
+import math
+import threading
+import time
+from contextlib import contextmanager
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional
+
+from behave.runner import the_step_registry as step_registry
+
+from core.logger import Logger
+from core.step_index import StepIndex
+from utils import json_codec
+
+
+class StepProfiler:
+    """
+    Per-step-definition duration profile of a run.
+
+    Example config:
+        profiling:
+          steps:
+            enabled: true
+            report_dir: reports/profiles
+
+    The report (``step_profile_<ts>.txt`` and ``.json``) ranks step
+    definitions by total time, with share of the run, call count, mean, p95
+    and the network part of their time.
+    """
+
+    _shared = {}
+    _shared_lock = threading.Lock()
+
+    def __init__(self, settings: Optional[Dict] = None):
+        """
+        Initialize profiler from the ``profiling.steps`` config block.
+
+        Args:
+            settings: Step profiling settings dictionary
+        """
+        settings = settings or {}
+        self.logger = Logger.get_logger(__name__)
+        self.enabled = bool(settings.get('enabled', False))
+        self.report_dir = Path(settings.get('report_dir', 'reports/profiles'))
+        self._durations: Dict[str, List[float]] = {}
+        self._network: Dict[str, float] = {}
+        self._patterns: Dict[str, str] = {}
+        self._lock = threading.Lock()
+        self._step_start: Optional[float] = None
+        self._step_network = 0.0
+        self._in_flight = 0
+        self._busy_since = 0.0
+
+    @classmethod
+    def get_shared(cls, config) -> 'StepProfiler':
+        """
+        Get the process-wide profiler for a configuration.
+
+        Args:
+            config: ConfigLoader instance
+
+        Returns:
+            StepProfiler shared by hooks and all clients of that environment
+        """
+        key = config.get_environment()
+        with cls._shared_lock:
+            if key not in cls._shared:
+                cls._shared[key] = cls(config.get('profiling.steps', {}))
+            return cls._shared[key]
+
+    def start_step(self) -> None:
+        """Start timing a step (called from before_step)."""
+        if not self.enabled:
+            return
+        with self._lock:
+            self._step_network = 0.0
+            self._step_start = time.perf_counter()
+
+    @contextmanager
+    def network_call(self) -> Iterator[None]:
+        """
+        Attribute an HTTP call's time to the running step (used by APIClient).
+
+        Network time is the wall-clock time during which at least one call is
+        in flight, so concurrent calls (paginator prefetch) are not summed.
+        """
+        if not self.enabled:
+            yield
+            return
+        with self._lock:
+            if self._in_flight == 0:
+                self._busy_since = time.perf_counter()
+            self._in_flight += 1
+        try:
+            yield
+        finally:
+            with self._lock:
+                self._in_flight -= 1
+                if self._in_flight == 0 and self._step_start is not None:
+                    self._step_network += time.perf_counter() - max(self._busy_since, self._step_start)
+
+    def end_step(self, step) -> None:
+        """
+        Record a finished step under its step definition (called from after_step).
+
+        Args:
+            step: behave Step (undefined steps are not recorded)
+        """
+        if not self.enabled:
+            return
+        with self._lock:
+            if self._step_start is None:
+                return
+            now = time.perf_counter()
+            duration = now - self._step_start
+            network = self._step_network
+            if self._in_flight:
+                # Calls still in flight (abandoned prefetches) count up to the step's end
+                network += now - max(self._busy_since, self._step_start)
+                self._busy_since = now
+            self._step_start = None
+
+        # behave's Step keeps no reference to its match; peek() reads the step
+        # index's cache without adding to its lookup statistics
+        index = StepIndex.installed()
+        if index is not None:
+            step_definition = index.peek(step.step_type, step.name)
+        else:
+            step_definition = step_registry.find_step_definition(step)
+        if step_definition is None:
+            return
+        # Step modules are exec'd by behave, so the location identifies the function
+        key = f"{step_definition.func.__name__} ({step_definition.location})"
+        with self._lock:
+            self._durations.setdefault(key, []).append(duration)
+            self._network[key] = self._network.get(key, 0.0) + network
+            self._patterns.setdefault(key, f"{step.step_type} {step_definition.pattern}")
+
+    @staticmethod
+    def _percentile(sorted_values: List[float], percent: float) -> float:
+        """Nearest-rank percentile of sorted values."""
+        rank = max(math.ceil(percent / 100 * len(sorted_values)), 1)
+        return sorted_values[rank - 1]
+
+    def summary(self) -> List[Dict]:
+        """
+        Get the aggregated profile, ranked by total time.
+
+        Returns:
+            One row per step definition with pattern, total, share, calls, mean, p95 and network time
+        """
+        with self._lock:
+            durations = {key: sorted(values) for key, values in self._durations.items()}
+            network = dict(self._network)
+        run_total = sum(sum(values) for values in durations.values()) or 1.0
+
+        rows = []
+        for key, values in durations.items():
+            total = sum(values)
+            rows.append({
+                'step_definition': key,
+                'pattern': self._patterns[key],
+                'calls': len(values),
+                'total_s': round(total, 3),
+                'share_pct': round(total / run_total * 100, 1),
+                'mean_ms': round(total / len(values) * 1000, 1),
+                'p95_ms': round(self._percentile(values, 95) * 1000, 1),
+                'network_s': round(network[key], 3),
+                'local_s': round(total - network[key], 3)
+            })
+        rows.sort(key=lambda row: row['total_s'], reverse=True)
+        return rows
+
+    def write_report(self) -> Optional[Path]:
+        """
+        Write the ranked text report and its JSON data.
+
+        Returns:
+            Path of the text report, or None if disabled or nothing was recorded
+        """
+        rows = self.summary() if self.enabled else []
+        if not rows:
+            return None
+
+        self.report_dir.mkdir(parents=True, exist_ok=True)
+        base = self.report_dir / f"step_profile_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
+        total = sum(row['total_s'] for row in rows)
+        network = sum(row['network_s'] for row in rows)
+
+        lines = [
+            f"Step profile: {sum(row['calls'] for row in rows)} steps, {total:.1f} s "
+            f"(network {network:.1f} s, local {total - network:.1f} s)",
+            '',
+            f"{'#':>4}  {'total s':>9}  {'share':>6}  {'calls':>6}  {'mean ms':>9}  {'p95 ms':>9}  "
+            f"{'network':>7}  step definition"
+        ]
+        for rank, row in enumerate(rows, 1):
+            network_pct = row['network_s'] / row['total_s'] * 100 if row['total_s'] else 0
+            lines.append(
+                f"{rank:>4}  {row['total_s']:>9.2f}  {row['share_pct']:>5.1f}%  {row['calls']:>6}  "
+                f"{row['mean_ms']:>9.1f}  {row['p95_ms']:>9.1f}  {network_pct:>6.0f}%  {row['step_definition']}"
+            )
+            lines.append(f"{'':>60}{row['pattern']}")
+
+        report_path = base.with_suffix('.txt')
+        report_path.write_text('\n'.join(lines) + '\n', encoding='utf-8')
+        base.with_suffix('.json').write_text(json_codec.dumps(rows, indent=2), encoding='utf-8')
+
+        top = rows[0]
+        self.logger.info(f"⏱️  Step profile: {report_path} (slowest: {top['pattern']}, "
+                         f"{top['share_pct']}% of step time)")
+        return report_path
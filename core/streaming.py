@@ -0,0 +1,256 @@
+"""
+Streaming Module
+Provides a size-bounded streaming response and an incremental JSON array
+reader, so large catalog pages can be checked item by item instead of being
+buffered, parsed and copied as a whole.
+"""
+
+import codecs
+import json
+from typing import Any, Iterable, Iterator, Optional
+
+import requests
+
+from utils import json_codec
+
+_WHITESPACE = ' \t\n\r'
+# Characters that can follow a complete number or literal
+_TERMINATORS = _WHITESPACE + ',]}'
+# raw_decode is needed to decode one value at a time; fast backends have no equivalent
+_decoder = json.JSONDecoder()
+
+
+class ResponseTooLargeError(requests.exceptions.RequestException):
+    """Raised when a streamed response body exceeds its size limit."""
+
+
+class _JSONStream:
+    """Text buffer over a byte-chunk iterator, refilled on demand."""
+
+    def __init__(self, chunks: Iterable[bytes]):
+        self._chunks = iter(chunks)
+        self._decode = codecs.getincrementaldecoder('utf-8')()
+        self.buffer = ''
+        self.pos = 0
+        self.eof = False
+
+    def fill(self) -> bool:
+        """Append the next chunk, dropping consumed text. False once the stream is drained."""
+        if self.eof:
+            return False
+        chunk = next(self._chunks, None)
+        if chunk is None:
+            self.eof = True
+            text = self._decode.decode(b'', final=True)
+        else:
+            text = self._decode.decode(chunk)
+        self.buffer = self.buffer[self.pos:] + text
+        self.pos = 0
+        return True
+
+    def peek(self) -> str:
+        """Next non-whitespace character ('' at end of stream)."""
+        while True:
+            while self.pos < len(self.buffer) and self.buffer[self.pos] in _WHITESPACE:
+                self.pos += 1
+            if self.pos < len(self.buffer):
+                return self.buffer[self.pos]
+            if not self.fill():
+                return ''
+
+    def expect(self, char: str) -> None:
+        """Consume a structural character."""
+        if self.peek() != char:
+            raise json_codec.JSONDecodeError(f"Expecting '{char}'", self.buffer, self.pos)
+        self.pos += 1
+
+    def value(self) -> Any:
+        """Decode one complete JSON value, reading more chunks until it is available."""
+        self.peek()
+        while True:
+            try:
+                value, end = _decoder.raw_decode(self.buffer, self.pos)
+            except json_codec.JSONDecodeError:
+                if self.fill():
+                    continue
+                raise
+            # A number cut by a chunk boundary ('1.' + '5') decodes as its shorter
+            # prefix: only accept it once a terminator follows or the stream is drained
+            if (not isinstance(value, (dict, list, str))
+                    and (end == len(self.buffer) or self.buffer[end] not in _TERMINATORS)
+                    and self.fill()):
+                continue
+            self.pos = end
+            return value
+
+
+def iter_json_array(chunks: Iterable[bytes], path: str = '') -> Iterator[Any]:
+    """
+    Yield the items of a JSON array while the document is still being read.
+
+    Only the objects along ``path`` are scanned incrementally; each item (and
+    each skipped sibling value) is decoded on its own, so memory use is bounded
+    by the largest single item rather than the whole body. Reading stops at the
+    end of the array.
+
+    Args:
+        chunks: Body as an iterable of UTF-8 byte chunks
+        path: Dotted key path to the array ('' for a top-level array)
+
+    Yields:
+        Decoded array items
+
+    Raises:
+        KeyError: If a key along the path is missing
+        TypeError: If the value at the path is not an array
+        JSONDecodeError: If the document is not valid JSON
+    """
+    stream = _JSONStream(chunks)
+
+    for key in [part for part in path.split('.') if part]:
+        stream.expect('{')
+        while True:
+            if stream.peek() == '}':
+                raise KeyError(f"Key path '{path}' not found in response")
+            name = stream.value()
+            stream.expect(':')
+            if name == key:
+                break
+            stream.value()
+            if stream.peek() == ',':
+                stream.pos += 1
+
+    if stream.peek() != '[':
+        raise TypeError(f"Value at '{path or '<root>'}' is not a JSON array")
+    stream.pos += 1
+
+    if stream.peek() == ']':
+        return
+    while True:
+        yield stream.value()
+        char = stream.peek()
+        if char == ',':
+            stream.pos += 1
+        elif char == ']':
+            return
+        else:
+            raise json_codec.JSONDecodeError("Expecting ',' or ']'", stream.buffer, stream.pos)
+
+
+class StreamingResponse:
+    """
+    Size-bounded wrapper around a ``requests.Response`` opened with ``stream=True``.
+
+    Status, headers and other attributes are delegated to the wrapped response.
+    The body is only read on demand: :meth:`iter_items` decodes array items as
+    chunks arrive and keeps neither chunks nor items, so memory stays bounded
+    by the largest item. ``content``/``text``/``json()`` read and keep the whole
+    body (up to ``max_bytes``); read it before iterating if both are needed,
+    since the body cannot be read again once an iteration has consumed it.
+    """
+
+    streamed = True
+
+    def __init__(self, response: requests.Response, max_bytes: Optional[int] = None,
+                 chunk_size: int = 65536):
+        """
+        Wrap a streamed response.
+
+        Args:
+            response: Response returned with stream=True
+            max_bytes: Maximum (decoded) body size, None for no limit
+            chunk_size: Read size in bytes
+
+        Raises:
+            ResponseTooLargeError: If Content-Length already exceeds max_bytes
+        """
+        self.response = response
+        self.max_bytes = max_bytes
+        self.chunk_size = chunk_size
+        self._received = 0
+        self._consumed = False
+        self._content = None
+
+        length = response.headers.get('Content-Length', '')
+        if max_bytes and length.isdigit() and int(length) > max_bytes:
+            response.close()
+            raise ResponseTooLargeError(
+                f"Response body of {length} bytes exceeds limit of {max_bytes} bytes", response=response
+            )
+
+    def __getattr__(self, name):
+        return getattr(self.response, name)
+
+    def __bool__(self) -> bool:
+        return self.response.ok
+
+    def __repr__(self) -> str:
+        return f"<StreamingResponse [{self.response.status_code}]>"
+
+    def _read(self) -> Iterator[bytes]:
+        """Read the body from the network (once), enforcing the size limit."""
+        if self._consumed:
+            raise requests.exceptions.StreamConsumedError(
+                "Response body was already consumed; read content before iterating to keep it"
+            )
+        self._consumed = True
+        for chunk in self.response.iter_content(self.chunk_size):
+            self._received += len(chunk)
+            if self.max_bytes and self._received > self.max_bytes:
+                self.response.close()
+                raise ResponseTooLargeError(
+                    f"Response body exceeds limit of {self.max_bytes} bytes", response=self.response
+                )
+            yield chunk
+
+    def iter_bytes(self) -> Iterator[bytes]:
+        """
+        Iterate the body: the kept body if ``content`` was read, else straight from the stream.
+
+        Yields:
+            Body chunks
+
+        Raises:
+            requests.exceptions.StreamConsumedError: If an earlier iteration consumed the stream
+        """
+        if self._content is not None:
+            yield self._content
+        else:
+            yield from self._read()
+
+    def iter_items(self, path: str = 'content') -> Iterator[Any]:
+        """
+        Iterate a JSON array in the body item by item.
+
+        Args:
+            path: Dotted key path to the array ('' for a top-level array)
+
+        Returns:
+            Iterator over decoded items
+        """
+        return iter_json_array(self.iter_bytes(), path)
+
+    @property
+    def content(self) -> bytes:
+        """
+        Full body (read up to the size limit and kept).
+
+        Raises:
+            requests.exceptions.StreamConsumedError: If an item iteration already consumed the body
+        """
+        if self._content is None:
+            self._content = b''.join(self._read())
+        return self._content
+
+    @property
+    def text(self) -> str:
+        """Full body decoded with the response encoding (UTF-8 if unknown)."""
+        return str(self.content, self.response.encoding or 'utf-8', errors='replace')
+
+    def json(self, **kwargs) -> Any:
+        """Parse the full body with the JSON codec."""
+        return json_codec.loads(self.content)
+
+    def close(self) -> None:
+        """Release the connection."""
+        self.response.close()
@@ -0,0 +1,131 @@
+"""
+Structured Logging Module
+Correlation context (run, worker, feature, scenario, step, request) for log
+records and a JSON-lines formatter, so a run's logs can be loaded into
+analysis tools instead of being grepped.
+"""
+
+import contextvars
+import logging
+import os
+import socket
+import uuid
+from datetime import datetime, timezone
+from typing import Optional
+
+from utils import json_codec
+
+# Request IDs are per thread of execution (paginator prefetch threads send requests too)
+_request_id = contextvars.ContextVar('request_id', default=None)
+
+# Attributes LogRecord always has; anything else was passed via ``extra``
+_RECORD_ATTRS = set(vars(logging.LogRecord('', 0, '', 0, '', (), None))) | {'message', 'asctime'}
+
+# Scenario range markers read by core/log_index.py, not log content
+_MARKER_ATTRS = {'scenario_mark', 'scenario_status'}
+
+_exception_formatter = logging.Formatter()
+
+
+class LogContext:
+    """
+    Process-wide correlation fields stamped on every log record.
+
+    ``run_id`` comes from the RUN_ID environment variable (so parallel
+    workers of one run share it) or is generated; ``worker_id`` comes from
+    WORKER_ID or defaults to ``<host>-<pid>``.
+    """
+
+    FIELDS = ('run_id', 'worker_id', 'feature', 'scenario', 'step', 'request_id')
+
+    run_id = os.getenv('RUN_ID') or uuid.uuid4().hex[:12]
+    worker_id = os.getenv('WORKER_ID') or f'{socket.gethostname()}-{os.getpid()}'
+    feature = None
+    scenario = None
+    step = None
+
+    @classmethod
+    def bind(cls, **fields) -> None:
+        """
+        Set the current feature/scenario/step.
+
+        Args:
+            **fields: feature, scenario and/or step names (None clears)
+        """
+        for name, value in fields.items():
+            if name not in ('feature', 'scenario', 'step'):
+                raise ValueError(f"Unknown log context field '{name}'")
+            setattr(cls, name, value)
+
+    @staticmethod
+    def new_request_id() -> str:
+        """
+        Start a new request in the current thread.
+
+        Returns:
+            The request ID stamped on records until the next request
+        """
+        request_id = uuid.uuid4().hex[:16]
+        _request_id.set(request_id)
+        return request_id
+
+    @staticmethod
+    def request_id() -> Optional[str]:
+        """Get the ID of the current thread's request, if any."""
+        return _request_id.get()
+
+
+class CorrelationFilter(logging.Filter):
+    """
+    Stamp correlation fields on records.
+
+    Attached to the queue handler, so it runs on the logging thread where the
+    request context is known - not on the background listener. It also keeps
+    the formatted traceback as ``exception``, since the queue handler merges
+    it into the message and drops ``exc_info`` before the record is queued.
+    """
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        record.run_id = LogContext.run_id
+        record.worker_id = LogContext.worker_id
+        record.feature = LogContext.feature
+        record.scenario = LogContext.scenario
+        record.step = LogContext.step
+        record.request_id = _request_id.get()
+        if record.exc_info and not record.exc_text:
+            # Cached on the record, so the text sinks reuse it
+            record.exc_text = _exception_formatter.formatException(record.exc_info)
+        record.exception = record.exc_text or None
+        return True
+
+
+class JSONLinesFormatter(logging.Formatter):
+    """
+    Format records as one JSON object per line.
+
+    Fields passed via ``extra`` (e.g. ``method``, ``endpoint``, ``status``,
+    ``duration_ms`` from APIClient) are included as top-level keys; a
+    traceback is written as ``exception``, not as part of ``message``.
+    """
+
+    def format(self, record: logging.LogRecord) -> str:
+        entry = {
+            'ts': datetime.fromtimestamp(record.created, timezone.utc).isoformat(timespec='milliseconds'),
+            'level': record.levelname,
+            'logger': record.name,
+            'message': record.getMessage(),
+        }
+        exception = getattr(record, 'exception', None)
+        if exception and entry['message'].endswith('\n' + exception):
+            entry['message'] = entry['message'][:-len(exception) - 1]
+        for name in LogContext.FIELDS:
+            entry[name] = getattr(record, name, None)
+        for name, value in vars(record).items():
+            if name in _RECORD_ATTRS or name in _MARKER_ATTRS or name == 'exception':
+                continue
+            if name not in entry:
+                entry[name] = value
+        if exception:
+            entry['exception'] = exception
+        # Runs on the listener thread; default=str keeps odd ``extra`` values from breaking a line
+        return json_codec.dumps(entry, default=str)
@@ -0,0 +1,180 @@
+"""
+Tag Index Module
+Prebuilt index of the tags of every scenario in features/, so a tag-filtered
+run (behave --tags=@church_payment) only reads and parses the feature files
+that contain matching scenarios. The index is refreshed incrementally: only
+files whose size or modification time changed are parsed again.
+"""
+
+import json
+import os
+import threading
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+import behave
+from behave import parser
+from behave.runner import Runner
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+INDEX_VERSION = 1
+
+
+class TagIndex:
+    """
+    Tag index of feature files, stored in ``.cache/features/tag_index.json``.
+
+    Each file entry records its stat signature and, per scenario (or outline
+    example row), the scenario line and its effective tags (feature, scenario
+    and examples tags), which is what behave matches the tag expression on.
+
+    Installed from environment.py; TAG_INDEX=0 disables it.
+    """
+
+    _installed = None
+    _install_lock = threading.Lock()
+
+    def __init__(self, index_path: Optional[Path] = None):
+        """
+        Initialize index.
+
+        Args:
+            index_path: Index file (default .cache/features/tag_index.json)
+        """
+        default_dir = Path(os.getenv('FEATURE_CACHE_DIR', PROJECT_ROOT / '.cache' / 'features'))
+        self.index_path = Path(index_path or default_dir / 'tag_index.json')
+        self.files: Dict[str, Dict] = {}
+        self._dirty = False
+        self._load()
+
+    @classmethod
+    def install(cls) -> Optional['TagIndex']:
+        """
+        Filter behave's feature locations through the index (once per process).
+
+        Returns:
+            The installed index, or None if disabled via TAG_INDEX=0
+        """
+        if os.getenv('TAG_INDEX', '1') == '0':
+            return None
+        with cls._install_lock:
+            if cls._installed is None:
+                cls._installed = index = cls()
+                collect = Runner.feature_locations
+
+                def feature_locations(runner):
+                    return index.select(collect(runner), runner.config.tags)
+
+                Runner.feature_locations = feature_locations
+            return cls._installed
+
+    def _load(self) -> None:
+        """Read the stored index; a missing or outdated index starts empty."""
+        try:
+            with open(self.index_path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return
+        if data.get('version') == INDEX_VERSION and data.get('behave') == behave.__version__:
+            self.files = data.get('files', {})
+
+    def save(self) -> None:
+        """Write the index atomically if it changed."""
+        if not self._dirty:
+            return
+        try:
+            self.index_path.parent.mkdir(parents=True, exist_ok=True)
+            partial = self.index_path.with_name(f'{self.index_path.name}.{os.getpid()}.tmp')
+            with open(partial, 'w', encoding='utf-8') as f:
+                json.dump({'version': INDEX_VERSION, 'behave': behave.__version__, 'files': self.files}, f)
+            os.replace(partial, self.index_path)
+            self._dirty = False
+        except OSError:
+            pass
+
+    @staticmethod
+    def _scan(filename: str) -> List[Tuple[int, List[str]]]:
+        """Parse a feature file and return (line, effective tags) per scenario."""
+        feature = parser.parse_file(filename)
+        if feature is None:
+            return []
+        # Outlines are expanded into one scenario per examples row (with the examples' tags)
+        return [(scenario.line, [str(tag) for tag in scenario.effective_tags])
+                for scenario in feature.walk_scenarios()]
+
+    def entry(self, filename: str) -> Dict:
+        """
+        Get the index entry of a feature file, re-scanning it if it changed.
+
+        Args:
+            filename: Feature file path
+
+        Returns:
+            Entry dictionary with 'mtime', 'size' and 'scenarios'
+        """
+        key = os.path.abspath(filename)
+        stat = os.stat(key)
+        entry = self.files.get(key)
+        if entry is None or entry['mtime'] != stat.st_mtime_ns or entry['size'] != stat.st_size:
+            entry = {'mtime': stat.st_mtime_ns, 'size': stat.st_size, 'scenarios': self._scan(key)}
+            self.files[key] = entry
+            self._dirty = True
+        return entry
+
+    def matches(self, filename: str, tag_expression) -> bool:
+        """
+        Check whether a feature file has a scenario selected by the tag expression.
+
+        Args:
+            filename: Feature file path
+            tag_expression: behave TagExpression
+
+        Returns:
+            True if at least one scenario matches
+        """
+        return any(tag_expression.check(tags) for _, tags in self.entry(filename)['scenarios'])
+
+    def locations(self, tag: str) -> List[Tuple[str, int]]:
+        """
+        Get the scenarios carrying a tag, from the indexed files.
+
+        Args:
+            tag: Tag name, with or without '@'
+
+        Returns:
+            List of (file, scenario line) tuples
+        """
+        tag = tag.lstrip('@')
+        return [(filename, line)
+                for filename, entry in sorted(self.files.items())
+                for line, tags in entry['scenarios'] if tag in tags]
+
+    def select(self, locations: List, tag_expression) -> List:
+        """
+        Drop feature locations without any scenario selected by the tag expression.
+
+        Args:
+            locations: behave FileLocation objects (or file names)
+            tag_expression: behave TagExpression (empty selects everything)
+
+        Returns:
+            Filtered locations, in their original order
+        """
+        if not tag_expression or not locations:
+            return locations
+        # Prune entries of deleted files, then refresh changed ones as they are checked
+        for key in [key for key in self.files if not os.path.exists(key)]:
+            del self.files[key]
+            self._dirty = True
+
+        selected = []
+        for location in locations:
+            filename = getattr(location, 'filename', location)
+            try:
+                if self.matches(filename, tag_expression):
+                    selected.append(location)
+            except Exception:
+                # Unreadable or unparsable: let behave load it and report the error
+                selected.append(location)
+        self.save()
+        return selected
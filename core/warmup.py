@@ -0,0 +1,169 @@
+"""
+Connection Warm-up Module
+Resolves and caches the API host and pre-opens keep-alive connections at
+run start, so scenario timings measure the API instead of DNS lookups and
+TLS handshakes.
+"""
+
+import socket
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Tuple
+from urllib.parse import urlsplit
+
+import requests
+
+from core.logger import Logger
+
+
+class DNSCache:
+    """
+    Process-wide cache for ``socket.getaddrinfo`` results.
+
+    Only hosts registered with :meth:`add_host` are cached; lookups for any
+    other host go straight to the system resolver.
+    """
+
+    _cache: Dict[Tuple, Tuple[float, List]] = {}
+    _hosts = set()
+    _ttl = 300.0
+    _lock = threading.Lock()
+    _original_getaddrinfo = None
+
+    @classmethod
+    def install(cls, ttl: float = 300.0) -> None:
+        """
+        Patch ``socket.getaddrinfo`` with the caching resolver.
+
+        Args:
+            ttl: Seconds a resolved address stays valid
+        """
+        with cls._lock:
+            cls._ttl = float(ttl)
+            if cls._original_getaddrinfo is None:
+                cls._original_getaddrinfo = socket.getaddrinfo
+                socket.getaddrinfo = cls._getaddrinfo
+
+    @classmethod
+    def uninstall(cls) -> None:
+        """Restore the original resolver and clear the cache."""
+        with cls._lock:
+            if cls._original_getaddrinfo is not None:
+                socket.getaddrinfo = cls._original_getaddrinfo
+                cls._original_getaddrinfo = None
+            cls._cache.clear()
+            cls._hosts.clear()
+
+    @classmethod
+    def add_host(cls, host: str) -> None:
+        """
+        Enable caching for a host name.
+
+        Args:
+            host: Host name to cache
+        """
+        with cls._lock:
+            cls._hosts.add(host)
+
+    @classmethod
+    def _getaddrinfo(cls, host, port, *args, **kwargs):
+        """Caching replacement for socket.getaddrinfo."""
+        resolve = cls._original_getaddrinfo or socket.getaddrinfo
+        if host not in cls._hosts:
+            return resolve(host, port, *args, **kwargs)
+
+        key = (host, port) + args + tuple(sorted(kwargs.items()))
+        now = time.monotonic()
+        cached = cls._cache.get(key)
+        if cached and cached[0] > now:
+            return cached[1]
+
+        result = resolve(host, port, *args, **kwargs)
+        cls._cache[key] = (now + cls._ttl, result)
+        return result
+
+
+class ConnectionWarmer:
+    """
+    Warm-up phase for the shared APIClient connection pool.
+    """
+
+    def __init__(self, config):
+        """
+        Initialize warmer with configuration.
+
+        Args:
+            config: ConfigLoader instance
+        """
+        self.config = config
+        self.logger = Logger.get_logger(__name__)
+        self.base_url = config.get('api.base_url')
+        self.connections = config.get_int('api.warmup.connections', 4)
+        self.path = config.get('api.warmup.path', '/')
+        self.timeout = config.get('api.warmup.timeout', 10)
+        self.dns_ttl = config.get('api.warmup.dns_cache_ttl', 300)
+
+    def _resolve(self, host: str, port: int) -> float:
+        """Resolve host through the DNS cache and return elapsed ms."""
+        DNSCache.install(self.dns_ttl)
+        DNSCache.add_host(host)
+        start = time.perf_counter()
+        socket.getaddrinfo(host, port, 0, socket.SOCK_STREAM)
+        return (time.perf_counter() - start) * 1000
+
+    def _open_connection(self, session: requests.Session, url: str) -> bool:
+        """Send a lightweight HEAD request so a connection is left in the pool."""
+        try:
+            session.head(url, timeout=self.timeout, allow_redirects=False)
+            return True
+        except requests.exceptions.RequestException as e:
+            self.logger.warning(f"Warm-up connection failed: {str(e)}")
+            return False
+
+    def warm_up(self, session: requests.Session) -> Dict:
+        """
+        Resolve the API host and open keep-alive connections.
+
+        Args:
+            session: Session whose adapter holds the shared connection pool
+
+        Returns:
+            Warm-up statistics (DNS, connection and total time in ms)
+        """
+        if not self.config.get('api.shared_pool', False):
+            self.logger.warning("api.shared_pool is disabled: warmed connections won't be reused by scenarios")
+
+        start = time.perf_counter()
+        parts = urlsplit(self.base_url)
+        port = parts.port or (443 if parts.scheme == 'https' else 80)
+        url = f"{self.base_url.rstrip('/')}/{self.path.lstrip('/')}"
+
+        stats = {'host': parts.hostname, 'dns_ms': 0.0, 'connect_ms': 0.0,
+                 'connections': 0, 'total_ms': 0.0}
+
+        try:
+            stats['dns_ms'] = round(self._resolve(parts.hostname, port), 2)
+        except OSError as e:
+            self.logger.warning(f"Warm-up DNS resolution failed for {parts.hostname}: {str(e)}")
+            stats['total_ms'] = round((time.perf_counter() - start) * 1000, 2)
+            return stats
+
+        # Connections are opened concurrently so each worker gets its own socket;
+        # connections <= 0 means DNS-only warm-up
+        connect_start = time.perf_counter()
+        opened = []
+        if self.connections > 0:
+            with ThreadPoolExecutor(max_workers=self.connections) as executor:
+                opened = list(executor.map(lambda _: self._open_connection(session, url),
+                                           range(self.connections)))
+        stats['connect_ms'] = round((time.perf_counter() - connect_start) * 1000, 2)
+        stats['connections'] = sum(opened)
+        stats['total_ms'] = round((time.perf_counter() - start) * 1000, 2)
+
+        self.logger.info(
+            f"🔥 Warm-up completed in {stats['total_ms']:.0f}ms "
+            f"(DNS {stats['dns_ms']:.0f}ms, {stats['connections']}/{max(self.connections, 0)} "
+            f"connections in {stats['connect_ms']:.0f}ms)"
+        )
+        return stats
@@ -3,11 +3,31 @@ Behave Environment Configuration
 Setup and teardown hooks for test execution.
 """
 
+import importlib
 import os
+from core.api_client import APIClient
 from core.base_test import BaseTest
+from core.concurrency import ConcurrencyLimiter
+from core.cpu_profiler import CPUProfiler
+from core.feature_cache import FeatureCache
+from core.header_profiles import HeaderProfiles
+from core.instrument_registry import InstrumentRegistry
+from core.log_sampling import RequestLogSampler
 from core.logger import Logger
+from core.pin_encryptor import PinEncryptor
+from core.step_index import StepIndex
+from core.step_profiler import StepProfiler
+from core.structured_logging import LogContext
+from core.tag_index import TagIndex
+from core.warmup import ConnectionWarmer
 from utils.config_loader import ConfigLoader
-import allure
+
+# behave imports this module before it loads the step modules and parses the
+# feature files, so the step index, the parsed-feature cache and the tag index
+# must be installed at import time (FEATURE_CACHE=0 / TAG_INDEX=0 disable the latter two)
+StepIndex.install()
+FeatureCache.install()
+TagIndex.install()
 
 
 def before_all(context):
@@ -18,33 +38,85 @@ def before_all(context):
     # Get environment from command line: behave -D env=qa
     environment = context.config.userdata.get('env', 'qa')
     
-    # Load configuration
-    context.config_loader = ConfigLoader(environment)
+    # Load configuration (dotted -D keys override config values, e.g. -D api.timeout=60)
+    context.config_loader = ConfigLoader(
+        environment,
+        overrides=ConfigLoader.userdata_overrides(context.config.userdata)
+    )
     
     # Setup logging
     log_level = context.config_loader.get('logging.level', 'INFO')
     console_logging = context.config_loader.get('logging.console', True)
     file_logging = context.config_loader.get('logging.file', True)
     log_file_path = context.config_loader.get('logging.file_path', 'logs/automation.log')
+    structured_logging = context.config_loader.get('logging.structured', False)
+    log_rotation = context.config_loader.get('logging.rotation')
     
     Logger.setup_logging(
         log_level=log_level,
         console=console_logging,
         file_logging=file_logging,
-        log_file_path=log_file_path
+        log_file_path=log_file_path,
+        structured=structured_logging,
+        rotation=log_rotation
     )
     
+    # DEBUG records are kept in memory and only written out for failed scenarios
+    if context.config_loader.get('logging.debug_buffer.enabled', False):
+        context.debug_buffer = Logger.enable_debug_buffer(
+            capacity=context.config_loader.get('logging.debug_buffer.capacity', 5000),
+            dump_dir=context.config_loader.get('logging.debug_buffer.dump_dir', 'logs/debug')
+        )
+    
+    # allure is only imported when its formatter is in use (-f allure_behave.formatter:AllureFormatter)
+    context.allure = _load_allure(context)
+    
     logger = Logger.get_logger(__name__)
     logger.info("="*80)
     logger.info(f"🚀 Starting Test Execution - Environment: {environment.upper()}")
     logger.info(f"📍 Base URL: {context.config_loader.get('api.base_url')}")
     logger.info("="*80)
+    
+    # Compile named header profiles once for all scenarios
+    context.header_profiles = HeaderProfiles.get_shared(context.config_loader)
+    
+    # Payment-instrument details cached across scenarios of all payment flows
+    context.instrument_registry = InstrumentRegistry.get_shared(context.config_loader)
+    
+    # Per-step wall time, split into APIClient network time and local time
+    context.step_profiler = StepProfiler.get_shared(context.config_loader)
+    
+    # Opt-in CPU profile of the framework per scenario or run: -D profile=cprofile|sampling
+    context.cpu_profiler = CPUProfiler(context.config.userdata.get('profile'),
+                                       context.config_loader.get('profiling.cpu', {}))
+    context.cpu_profiler.start_run()
+    
+    # Local PIN encryption (pre-fills its ciphertext pool in the background)
+    context.pin_encryptor = PinEncryptor.get_shared(context.config_loader)
+    
+    # Optional connection warm-up (DNS cache + keep-alive pool)
+    if context.config_loader.get('api.warmup.enabled', False):
+        warmup_client = APIClient(context.config_loader)
+        context.warmup_stats = ConnectionWarmer(context.config_loader).warm_up(warmup_client.session)
+        warmup_client.close()
+
+
+def _load_allure(context):
+    """Import allure if an Allure formatter is configured, else None."""
+    formats = context.config.format or []
+    if not any('allure' in fmt.lower() for fmt in formats):
+        return None
+    try:
+        return importlib.import_module('allure')
+    except ImportError:
+        return None
 
 
 def before_feature(context, feature):
     """
     Executed before each feature.
     """
+    LogContext.bind(feature=feature.name, scenario=None, step=None)
     logger = Logger.get_logger(__name__)
     logger.info(f"\n{'='*80}")
     logger.info(f"📋 Feature: {feature.name}")
@@ -56,8 +128,14 @@ def before_scenario(context, scenario):
     Executed before each scenario.
     Initialize test context and API client.
     """
+    context.cpu_profiler.start_scenario()
+    LogContext.bind(scenario=scenario.name, step=None)
     logger = Logger.get_logger(__name__)
-    logger.info(f"\n{'─'*80}")
+    if hasattr(context, 'debug_buffer'):
+        context.debug_buffer.clear()
+    
+    # Marks open/close the scenario's byte range in the log index (core/log_index.py)
+    logger.info(f"\n{'─'*80}", extra={'scenario_mark': 'start'})
     logger.info(f"🧪 Scenario: {scenario.name}")
     logger.info(f"{'─'*80}")
     
@@ -65,9 +143,9 @@ def before_scenario(context, scenario):
     context.base_test = BaseTest(context.config_loader)
     
     # Add scenario tags to Allure report
-    if hasattr(scenario, 'tags'):
+    if context.allure and hasattr(scenario, 'tags'):
         for tag in scenario.tags:
-            allure.dynamic.tag(tag)
+            context.allure.dynamic.tag(tag)
 
 
 def after_scenario(context, scenario):
@@ -88,19 +166,48 @@ def after_scenario(context, scenario):
         logger.error(f"❌ Scenario FAILED: {scenario.name}")
         
         # Attach response to Allure report if available
-        if hasattr(context, 'response'):
+        if context.allure and hasattr(context, 'response'):
             try:
-                allure.attach(
+                context.allure.attach(
                     context.response.text,
                     name="Response Body",
-                    attachment_type=allure.attachment_type.JSON
+                    attachment_type=context.allure.attachment_type.JSON
                 )
             except:
                 pass
     elif scenario.status == 'skipped':
         logger.warning(f"⏭️  Scenario SKIPPED: {scenario.name}")
     
-    logger.info(f"{'─'*80}\n")
+    # A streamed response keeps its pooled connection until the body is read or closed
+    if getattr(getattr(context, 'response', None), 'streamed', False):
+        context.response.close()
+    
+    if hasattr(context, 'debug_buffer'):
+        if scenario.status == 'failed' or getattr(scenario, 'hook_failed', False):
+            _dump_debug_buffer(context, scenario, logger)
+        context.debug_buffer.clear()
+    
+    logger.info(f"{'─'*80}\n", extra={'scenario_mark': 'end',
+                                      'scenario_status': getattr(scenario.status, 'name', str(scenario.status))})
+    context.cpu_profiler.stop_scenario(scenario)
+
+
+def _dump_debug_buffer(context, scenario, logger):
+    """Write the scenario's buffered DEBUG records to disk and Allure."""
+    debug_log = context.debug_buffer.render()
+    dump_file = context.debug_buffer.dump(scenario.name, debug_log)
+    if dump_file:
+        logger.error(f"🔍 Debug log: {dump_file}")
+    
+    if context.allure and context.config_loader.get('logging.debug_buffer.attach_to_allure', True):
+        try:
+            context.allure.attach(
+                debug_log,
+                name="Debug Log",
+                attachment_type=context.allure.attachment_type.TEXT
+            )
+        except:
+            pass
 
 
 def after_feature(context, feature):
@@ -127,16 +234,37 @@ def after_all(context):
     if hasattr(context, '_runner'):
         logger.info(f"📊 Total Features: {len(context._runner.features)}")
     
+    # Ranked per-step-definition durations (network vs local time)
+    context.step_profiler.write_report()
+    
+    # Report requests whose log lines were sampled out since the last summary
+    RequestLogSampler.get_shared(context.config_loader).summarize()
+    
+    StepIndex.install().report()
+    
+    concurrency = ConcurrencyLimiter.get_shared(context.config_loader)
+    if concurrency.enabled:
+        logger.info(f"📈 Concurrency Limit: {concurrency.snapshot()}")
+    
+    if hasattr(context, 'pin_encryptor'):
+        context.pin_encryptor.stop()
+    
+    context.cpu_profiler.stop_run()
+    
     log_file = Logger.get_log_file_path()
     if log_file:
         logger.info(f"📄 Log File: {log_file}")
+    
+    # Write out everything still queued for the background log listener
+    Logger.flush()
 
 
 def before_step(context, step):
     """
     Executed before each step (optional).
     """
-    pass
+    LogContext.bind(step=f"{step.keyword} {step.name}")
+    context.step_profiler.start_step()
 
 
 def after_step(context, step):
@@ -144,6 +272,7 @@ def after_step(context, step):
     Executed after each step.
     Log step results for better debugging.
     """
+    context.step_profiler.end_step(step)
     logger = Logger.get_logger(__name__)
     
     if step.status == 'passed':
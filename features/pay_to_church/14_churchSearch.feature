@@ -417,6 +417,7 @@ Feature: Church Search by Name
             | 10       |
             | 15       |
             | 20       |
+            | 100      |
 
     @church_search @name_queries @pay_to_church @sasai
     Scenario Outline: Search churches with different name queries
@@ -59,6 +59,17 @@ Feature: Pay to School- search
         And response should contain search results
         And response should have at most 5 results
 
+    @school_search @pagination @pay_to_school @sasai
+    Scenario: Search with a large page read as a stream
+        Given I have valid user authentication
+        And I have search type "SCHOOL"
+        And I have page number 0
+        And I have page size 100
+        And I have name query "school"
+        When I send school search request to "/bff/v1/catalog/search-school-church-merchant"
+        Then response status code should be 200
+        And response should have at most 100 results
+
     @school_search @pagination @pay_to_school @sasai
     Scenario: Search with pagination - page 2
         Given I have valid user authentication
@@ -69,6 +80,22 @@ Feature: Pay to School- search
         When I send school search request to "/bff/v1/catalog/search-school-church-merchant"
         Then response status code should be 200
 
+    @school_search @pagination @pay_to_school @sasai
+    Scenario: Find a school by code across all catalog pages
+        Given I have valid user authentication
+        And I have search type "SCHOOL"
+        When I search all catalog pages for code "054329" at "/bff/v1/catalog/search-school-church-merchant"
+        Then the catalog item should be found
+
+    @school_search @pagination @pay_to_school @sasai
+    Scenario: Read all catalog pages with an oversized page size
+        Given I have valid user authentication
+        And I have search type "CHURCH"
+        And I have page size 1000
+        And I have name query "church"
+        When I read all catalog pages at "/bff/v1/catalog/search-school-church-merchant"
+        Then at least 1 catalog items should be read
+
     @school_search @positive @pay_to_school @sasai
     Scenario: Search with minimum query length
         Given I have valid user authentication
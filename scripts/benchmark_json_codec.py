@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+"""
+JSON Codec Benchmark
+Compares the installed JSON backends against stdlib json on the payment
+payloads from the payloads/ directory.
+
+Usage:
+    python scripts/benchmark_json_codec.py [iterations]
+"""
+
+import json
+import sys
+import timeit
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import core  # noqa: E402,F401 - core must be initialised before utils (they import each other)
+from utils import json_codec  # noqa: E402
+from utils.payload_templates import PAYLOAD_DIR, PayloadTemplate  # noqa: E402
+
+SAMPLE_VALUES = {
+    'amount': 2.0,
+    'fee_amount': 0,
+    'currency': 'USD',
+    'payer_amount': 1.0,
+    'payee_amount': 1.0,
+    'instrument_id': 101,
+    'instrument_token': 'b3f1c0de-9a51-4b8e-a3c4-5d7e2f90a1b2',
+    'beneficiary_instrument_token': '6c2d7e1f-0b3a-4c9d-8e5f-a1b2c3d4e5f6',
+    'payer_instrument_token': 'f0e1d2c3-b4a5-4968-8776-655443322110',
+    'customer_id': '263771234567',
+    'encrypted_pin': 'A' * 344,
+    'device_model': 'RM6877',
+    'device_os': 'android',
+    'device_os_version': '14',
+}
+
+
+def load_payloads():
+    """Render every payload template with sample values."""
+    payloads = {}
+    for payload_file in sorted(PAYLOAD_DIR.glob('*.json')):
+        template = PayloadTemplate.load(payload_file.stem)
+        payloads[payload_file.stem] = template.render(**SAMPLE_VALUES)
+
+    # A search response-sized document: many payloads in one list
+    payloads['catalog_page_1000'] = {'items': [dict(p, index=i) for i in range(500)
+                                               for p in list(payloads.values())[:2]]}
+    return payloads
+
+
+def bench(func, iterations):
+    """Best-of-3 time per call in microseconds."""
+    return min(timeit.repeat(func, number=iterations, repeat=3)) / iterations * 1e6
+
+
+def main():
+    iterations = int(sys.argv[1]) if len(sys.argv) > 1 else 20000
+    payloads = load_payloads()
+
+    available = []
+    for name in ('stdlib', 'orjson', 'msgspec'):
+        try:
+            json_codec.set_backend(name)
+            available.append(name)
+        except ImportError:
+            print(f"⚠️  {name} not installed - skipped")
+
+    print(f"\n{'payload':<24}{'backend':<10}{'dumps µs':>10}{'loads µs':>10}{'indent µs':>11}{'speedup':>9}")
+    print('-' * 74)
+    for payload_name, payload in payloads.items():
+        count = max(iterations // 500, 20) if payload_name.startswith('catalog') else iterations
+        encoded = json.dumps(payload).encode('utf-8')
+        baseline = None
+        for name in available:
+            json_codec.set_backend(name)
+            dumps = bench(lambda: json_codec.dumps_bytes(payload), count)
+            loads = bench(lambda: json_codec.loads(encoded), count)
+            indent = bench(lambda: json_codec.dumps(payload, indent=2), count)
+            total = dumps + loads
+            baseline = baseline or total
+            print(f"{payload_name:<24}{name:<10}{dumps:>10.2f}{loads:>10.2f}{indent:>11.2f}"
+                  f"{baseline / total:>8.1f}x")
+        print()
+
+    json_codec.set_backend()
+    print(f"Default backend: {json_codec.backend()}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
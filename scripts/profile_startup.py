@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+"""
+Startup Import Profiler
+Measures what the test process imports before the first scenario runs
+(environment.py plus every step module) using ``python -X importtime``, and
+fails when the total exceeds the startup budget.
+
+Usage:
+    python scripts/profile_startup.py [--budget-ms 600] [--top 20] [--tags @smoke]
+"""
+
+import argparse
+import os
+import re
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+
+# What behave imports at startup: the hooks module and all step modules
+IMPORT_SCRIPT = """
+import importlib, pathlib, sys
+sys.path.insert(0, 'steps')
+import environment
+for path in sorted(pathlib.Path('steps').glob('*.py')):
+    importlib.import_module(path.stem)
+"""
+
+LINE = re.compile(r'^import time:\s+(\d+) \|\s+(\d+) \|( *)(\S+)$')
+
+# Imports that are expected to be deferred to first use
+LAZY_MODULES = ('faker', 'jsonschema', 'allure')
+
+
+def profile_imports():
+    """Run the startup imports in a fresh interpreter and parse -X importtime output."""
+    result = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', IMPORT_SCRIPT],
+        cwd=PROJECT_ROOT, capture_output=True, text=True, env={**os.environ, 'PYTHONPATH': str(PROJECT_ROOT)}
+    )
+    if result.returncode != 0:
+        print(result.stderr[-2000:])
+        raise SystemExit(f"❌ Startup imports failed (exit {result.returncode})")
+
+    modules = []
+    for line in result.stderr.splitlines():
+        match = LINE.match(line)
+        if match:
+            self_us, cumulative_us, indent, name = match.groups()
+            modules.append((name, int(self_us), int(cumulative_us), len(indent) // 2))
+    return modules
+
+
+def time_dry_run(tags):
+    """Wall-clock time of a behave dry run for the given tags."""
+    start = time.perf_counter()
+    subprocess.run(['behave', '--dry-run', '--no-junit', '--no-summary', '-f', 'null', '-o', os.devnull,
+                    f'--tags={tags}'], cwd=PROJECT_ROOT, capture_output=True)
+    return (time.perf_counter() - start) * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Profile test-process startup imports')
+    parser.add_argument('--budget-ms', type=float, default=600, help='Maximum total import time')
+    parser.add_argument('--top', type=int, default=20, help='Number of slowest modules to show')
+    parser.add_argument('--tags', help='Also time a behave dry run with these tags (e.g. @smoke)')
+    args = parser.parse_args()
+
+    modules = profile_imports()
+    total_ms = sum(self_us for _, self_us, _, _ in modules) / 1000
+
+    # Direct imports of the startup modules and their dependencies (levels 0-1) carry the cost
+    print(f"\n{'module':<48}{'self ms':>10}{'cumulative ms':>15}")
+    print('-' * 73)
+    top_level = sorted((m for m in modules if m[3] <= 1), key=lambda m: -m[2])
+    for name, self_us, cumulative_us, _ in top_level[:args.top]:
+        print(f"{name:<48}{self_us / 1000:>10.1f}{cumulative_us / 1000:>15.1f}")
+
+    print(f"\n⏱️  Total import time: {total_ms:.1f} ms (budget {args.budget_ms:.0f} ms)")
+
+    eager = sorted({name.split('.')[0] for name, _, _, _ in modules} & set(LAZY_MODULES))
+    if eager:
+        print(f"⚠️  Imported at startup although expected to be lazy: {', '.join(eager)}")
+
+    if args.tags:
+        print(f"⏱️  behave --dry-run --tags={args.tags}: {time_dry_run(args.tags):.0f} ms")
+
+    if total_ms > args.budget_ms or eager:
+        print("❌ Startup budget exceeded")
+        return 1
+    print("✅ Startup within budget")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
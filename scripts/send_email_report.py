@@ -6,6 +6,7 @@ Generates email-friendly Markdown report and sends via SMTP
 
 import os
 import sys
+import html as html_lib
 import smtplib
 import yaml
 from email.mime.text import MIMEText
@@ -16,6 +17,9 @@ from pathlib import Path
 from datetime import datetime
 import xml.etree.ElementTree as ET
 
+sys.path.insert(0, str(Path(__file__).parent.parent))
+from core.log_index import LogIndex
+
 
 class EmailReportGenerator:
     def __init__(self, config_file='config/email_config.yaml'):
@@ -137,6 +141,27 @@ class EmailReportGenerator:
         
         return results
     
+    def attach_log_excerpts(self, results, log_dir, max_bytes=4000):
+        """Add the indexed log lines of each failed scenario (newest run log)"""
+        log_files = sorted(Path(log_dir).glob('automation_*.log'))
+        if not log_files or not results['failed_tests']:
+            return
+        
+        # JUnit names drop the outline suffix ("Name -- @1.1 Examples"), so match on the base name
+        index = LogIndex(log_files[-1])
+        failed_entries = {}
+        for entry in index.entries():
+            if entry.get('status') == 'failed' and entry.get('scenario'):
+                failed_entries.setdefault(entry['scenario'].split('--')[0].strip(), entry)
+        
+        for failed in results['failed_tests']:
+            entry = failed_entries.get(failed['scenario'])
+            if entry:
+                try:
+                    failed['log_excerpt'] = index.excerpt(entry, max_bytes=max_bytes)
+                except OSError as e:
+                    print(f"⚠️ Log excerpt unavailable for {failed['scenario']}: {e}")
+    
     def categorize_feature(self, feature_name):
         """Categorize feature by name"""
         feature_lower = feature_name.lower()
@@ -489,6 +514,14 @@ class EmailReportGenerator:
                     </tbody>
                 </table>
             """
+            
+            # Log lines of failed scenarios (sliced via the log offset index)
+            for failed in results['failed_tests']:
+                if failed.get('log_excerpt'):
+                    html += f"""
+                <h3 style="color: #495057;">📜 {html_lib.escape(failed['scenario'])}</h3>
+                <pre style="background: #f8f9fa; padding: 10px; font-size: 11px; white-space: pre-wrap;">{html_lib.escape(failed['log_excerpt'])}</pre>
+                    """
         
         # Report links
         html += f"""
@@ -631,6 +664,7 @@ def main():
     print(f"📊 Parsing test results from: {junit_dir}")
     
     generator.results = generator.parse_junit_results(junit_dir)
+    generator.attach_log_excerpts(generator.results, generator.project_root / 'logs')
     
     if generator.results['total'] == 0:
         print("⚠️ No test results found. Skipping email report.")
@@ -9,7 +9,7 @@ This file contains church-specific step definitions that delegate to school paym
 as both church and school payment options use the same API endpoint and response structure.
 """
 
-import json
+from utils import json_codec
 from behave import given, when, then
 
 
@@ -50,7 +50,7 @@ def step_send_multiple_church_payment_options_requests(context, count, endpoint)
         context.multiple_responses.append({
             'status_code': context.response.status_code,
             'response_time': context.response.elapsed.total_seconds() * 1000,
-            'body': context.response.json() if context.response.status_code == 200 else None
+            'body': json_codec.parse_response(context.response) if context.response.status_code == 200 else None
         })
     
     context.base_test.logger.info(f"✅ Completed {count} church payment options requests")
@@ -69,7 +69,7 @@ def step_send_multiple_church_payment_options_requests(context, count, endpoint)
 @then('payment instruments should not be empty')
 def step_verify_payment_instruments_not_empty(context):
     """Verify payment instruments are not empty"""
-    response_json = context.response.json()
+    response_json = json_codec.parse_response(context.response)
     
     instruments_count = 0
     
@@ -85,7 +85,7 @@ def step_verify_payment_instruments_not_empty(context):
 @then('wallet option should have balance information')
 def step_verify_wallet_balance_info(context):
     """Verify wallet option has balance information"""
-    response_json = context.response.json()
+    response_json = json_codec.parse_response(context.response)
     
     balance_found = False
     
@@ -110,7 +110,7 @@ def step_verify_wallet_balance_info(context):
 @then('I extract available payment methods from response')
 def step_extract_payment_methods(context):
     """Extract available payment methods from response"""
-    response_json = context.response.json()
+    response_json = json_codec.parse_response(context.response)
     
     context.payment_methods = []
     
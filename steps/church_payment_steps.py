@@ -7,8 +7,9 @@ Request Body: Contains payment details, biller details, payer details, device in
 subType: "pay-to-church"
 """
 
-import json
+from utils import json_codec
 from behave import given, when, then
+from utils.helpers import load_payload
 
 
 # ============================
@@ -38,45 +39,14 @@ def step_have_church_payment_details(context):
     # The real issue was using json= instead of json_data= in api_client.post()
     payer_amount = 1.0
     
-    context.payment_details = {
-        "feeAmount": int(fee_amount) if isinstance(fee_amount, float) and fee_amount.is_integer() else fee_amount,
-        "currency": "USD",
-        "billerDetails": {
-            "operatorId": "SZWOCH0001",
-            "categoryId": "SZWC10018",
-            "amount": payer_amount,
-            "currency": "USD",
-            "Q1": "156611",  # Church code
-            "Q2": "Offering"  # Transfer purpose
-        },
-        "payerAmount": payer_amount,
-        "payerDetails": {
-            "instrumentToken": instrument_token,
-            "paymentMethod": "wallet",
-            "provider": "ecocash",
-            "pin": "mvIkFBJqHn4YxGxx4/l1k2p+OyfrQgXJ11jQQi7C8N3+B5qZPDXggJrDAPFUFmezSo7CyUek15H+kSH4pWRT1MtuyKm9+M+2l9mpQnbSS2p7UDyHI17thhlc4ArhR1xRsEBfADLeCQSLL3mqk+de95FHJT/UlhjljhIbmm75Efhz67vcA+8E1YLMoWP6nA/VM/NMlWSD8HEofBQ8mDdDgKYlTjyZ86gpMroRb7Z9rC2SZfpVcl31aQE2nkx2m2OsZGo+Vqf2YqkIJBQ4Ae2llRf7PCPSB7tKY6OLiBWOYX+gISCQEthqr4sB5HgKHGwrP1+P9oxyQE2nrsdnMDTYng==",
-            "publicKeyAlias": "payment-links"
-        },
-        "subType": "pay-to-church",
-        "channel": "sasai-super-app",
-        "deviceInfo": {
-            "simNumber": "03d88760-d411-11f0-9694-15a487face2d",
-            "deviceId": "03d88760-d411-11f0-9694-15a487face2d",
-            "model": "realme - RMX3741",
-            "network": "unidentified",
-            "latitude": "28.4307472",
-            "longitude": "77.0647009",
-            "os": "RM6877",
-            "osVersion": "15",
-            "appVersion": "2.2.1",
-            "package": "com.sasai.sasaipay"
-        },
-        "notes": {
-            "operatorName": "FAITH MINISTRIES MABVUKU",
-            "code": "156611",
-            "transferPurpose": "Offering"
-        }
-    }
+    # Compiled template (payloads/church_payment.json) - copy-and-fill per scenario
+    context.payment_details = load_payload(
+        'church_payment',
+        fee_amount=int(fee_amount) if isinstance(fee_amount, float) and fee_amount.is_integer() else fee_amount,
+        amount=payer_amount,
+        instrument_token=instrument_token,
+        encrypted_pin=context.pin_encryptor.next_pin(config.get('church_payment.encrypted_pin'))
+    )
     
     context.base_test.logger.info(f"⛪ Set church payment details with feeAmount={payer_amount} (equal to payerAmount)")
 
@@ -327,13 +297,10 @@ def step_send_church_payment_request(context, endpoint):
     
     # Log the feeAmount specifically to debug
     context.base_test.logger.info(f"💰 feeAmount in payload: {payload.get('feeAmount')} (type: {type(payload.get('feeAmount'))})")
-    context.base_test.logger.info(f"💳 Church Payment Payload: {json.dumps(payload, indent=2)[:500]}...")
+    context.base_test.logger.info(f"💳 Church Payment Payload: {json_codec.dumps(payload, indent=2)[:500]}...")
     
     # Build headers
-    headers = {
-        'Accept': 'application/json',
-        'Content-Type': 'application/json'
-    }
+    headers = context.header_profiles.build('json_accept')
     
     # Add custom headers if set (device info)
     if hasattr(context, 'custom_headers'):
@@ -369,8 +336,8 @@ def step_send_church_payment_request(context, endpoint):
     context.base_test.logger.info(f"⏱️ Response Time: {context.response.elapsed.total_seconds() * 1000:.2f} ms")
     
     try:
-        response_json = context.response.json()
-        context.base_test.logger.info(f"📦 Response Body: {json.dumps(response_json, indent=2)[:1000]}...")
+        response_json = json_codec.parse_response(context.response)
+        context.base_test.logger.info(f"📦 Response Body: {json_codec.dumps(response_json, indent=2)[:1000]}...")
     except Exception as e:
         context.base_test.logger.warning(f"⚠️ Could not parse response as JSON: {str(e)}")
         context.base_test.logger.info(f"📦 Raw Response: {context.response.text[:500]}")
@@ -389,7 +356,7 @@ def step_send_church_payment_with_stored_token(context, endpoint):
 @then('response should contain payment confirmation')
 def step_verify_payment_confirmation(context):
     """Verify response contains payment confirmation and check payment status"""
-    response_json = context.response.json()
+    response_json = json_codec.parse_response(context.response)
     
     # Check for common payment confirmation fields
     has_confirmation = False
@@ -454,7 +421,7 @@ def step_verify_payment_confirmation(context):
 @then('payment should be successful')
 def step_verify_payment_success(context):
     """Verify payment was successful"""
-    response_json = context.response.json()
+    response_json = json_codec.parse_response(context.response)
     
     # Check for payment status
     payment_status = None
@@ -477,7 +444,7 @@ def step_verify_payment_success(context):
 @then('payment should be {expected_status}')
 def step_verify_payment_status(context, expected_status):
     """Verify payment has expected status (success, failure, pending, etc.)"""
-    response_json = context.response.json()
+    response_json = json_codec.parse_response(context.response)
     
     # Check for payment status
     payment_status = None
@@ -514,7 +481,7 @@ def step_verify_payment_status(context, expected_status):
 @then('response should have payment status')
 def step_verify_has_payment_status(context):
     """Verify response contains payment status field"""
-    response_json = context.response.json()
+    response_json = json_codec.parse_response(context.response)
     
     has_status = False
     status_value = None
@@ -533,7 +500,7 @@ def step_verify_has_payment_status(context):
 @then('response should have transaction ID')
 def step_verify_transaction_id(context):
     """Verify response contains transaction ID"""
-    response_json = context.response.json()
+    response_json = json_codec.parse_response(context.response)
     
     has_transaction_id = False
     transaction_id = None
@@ -565,7 +532,7 @@ def step_verify_transaction_id_format(context):
 @then('response should have payment structure')
 def step_verify_payment_structure(context):
     """Verify response has valid payment structure"""
-    response_json = context.response.json()
+    response_json = json_codec.parse_response(context.response)
     
     # Verify response is not empty
     assert response_json, "Response should not be empty"
@@ -577,7 +544,7 @@ def step_verify_payment_structure(context):
 @then('payment response should have required fields')
 def step_verify_payment_required_fields(context):
     """Verify payment response has required fields"""
-    response_json = context.response.json()
+    response_json = json_codec.parse_response(context.response)
     
     # Check for at least some key fields (different APIs may return different fields)
     required_field_found = False
@@ -596,7 +563,7 @@ def step_verify_payment_required_fields(context):
 @then('payment confirmation should have transaction details')
 def step_verify_payment_transaction_details(context):
     """Verify payment confirmation has transaction details"""
-    response_json = context.response.json()
+    response_json = json_codec.parse_response(context.response)
     
     # Check for transaction-related details
     has_details = False
@@ -614,7 +581,7 @@ def step_verify_payment_transaction_details(context):
 @then('payment confirmation should have amount')
 def step_verify_payment_amount_in_confirmation(context):
     """Verify payment confirmation contains amount"""
-    response_json = context.response.json()
+    response_json = json_codec.parse_response(context.response)
     
     has_amount = False
     
@@ -632,7 +599,7 @@ def step_verify_payment_amount_in_confirmation(context):
 @then('response should contain church name')
 def step_verify_church_name_in_response(context):
     """Verify response contains church name"""
-    response_json = context.response.json()
+    response_json = json_codec.parse_response(context.response)
     
     has_church_name = False
     
@@ -649,7 +616,7 @@ def step_verify_church_name_in_response(context):
 @then('response should contain church code')
 def step_verify_church_code_in_response(context):
     """Verify response contains church code"""
-    response_json = context.response.json()
+    response_json = json_codec.parse_response(context.response)
     
     has_church_code = False
     
@@ -666,7 +633,7 @@ def step_verify_church_code_in_response(context):
 @then('I extract transaction ID from payment response')
 def step_extract_transaction_id(context):
     """Extract transaction ID from payment response"""
-    response_json = context.response.json()
+    response_json = json_codec.parse_response(context.response)
     
     # Try to find transaction ID in various fields
     for field in ['transactionId', 'transaction_id', 'txnId', 'orderId', 'order_id', 'id']:
@@ -681,7 +648,7 @@ def step_extract_transaction_id(context):
 @then('I extract payment status from payment response')
 def step_extract_payment_status(context):
     """Extract payment status from payment response"""
-    response_json = context.response.json()
+    response_json = json_codec.parse_response(context.response)
     
     # Try to find status in various fields
     for field in ['status', 'paymentStatus', 'transactionStatus']:
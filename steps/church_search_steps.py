@@ -14,7 +14,9 @@ These steps are automatically shared across all feature files using Behave.
 """
 
 from behave import given, when, then
-import json
+from utils import json_codec
+from core.assertions import APIAssertions
+from core.streaming import StreamingResponse
 import requests
 import time
 
@@ -69,23 +71,34 @@ def step_send_church_search_request(context, endpoint):
         'Content-Type': 'application/json'
     }
     
+    # Large pages are streamed and checked item by item
+    streamed = params.get('pageSize', 0) > context.config_loader.get('api.streaming.page_size_threshold', 50)
+    
     try:
         context.base_test.logger.info(f"Sending GET request to {url}")
-        context.base_test.logger.info(f"Query params: {json.dumps(params, indent=2)}")
+        context.base_test.logger.info(f"Query params: {json_codec.dumps(params, indent=2)}")
         
         start_time = time.time()
         context.response = requests.get(
             url,
             params=params,
             headers=headers,
-            timeout=30
+            timeout=30,
+            stream=streamed
         )
         context.response_time = (time.time() - start_time) * 1000
         
         context.base_test.logger.info(f"Response Status: {context.response.status_code}")
         context.base_test.logger.info(f"Response Time: {context.response_time:.2f} ms")
         
-        if context.response.status_code == 200:
+        if streamed:
+            context.response = StreamingResponse(
+                context.response,
+                max_bytes=context.config_loader.get('api.streaming.max_body_bytes'),
+                chunk_size=context.config_loader.get('api.streaming.chunk_size', 65536)
+            )
+            context.base_test.logger.info(f"Response: streamed (pageSize {params['pageSize']})")
+        elif context.response.status_code == 200:
             context.base_test.logger.info(f"Response: {context.response.text[:500]}...")  # Log first 500 chars
         else:
             context.base_test.logger.warning(f"Error Response: {context.response.text}")
@@ -113,7 +126,7 @@ def step_response_has_church_list(context):
     assert context.response.status_code == 200, \
         f"Expected status 200, got {context.response.status_code}"
     
-    response_data = context.response.json()
+    response_data = json_codec.parse_response(context.response)
     
     # Check for content field containing results
     assert 'content' in response_data, \
@@ -128,7 +141,7 @@ def step_response_has_church_list(context):
 @then('response should have pagination structure')
 def step_response_has_pagination_structure(context):
     """Verify response has pagination structure"""
-    response_data = context.response.json()
+    response_data = json_codec.parse_response(context.response)
     
     # Check for common pagination fields
     pagination_fields = ['page', 'size', 'totalPages', 'totalElements', 'pageSize', 'number']
@@ -143,7 +156,7 @@ def step_response_has_pagination_structure(context):
 @then('response should have pagination info')
 def step_response_has_pagination_info(context):
     """Verify response contains pagination information"""
-    response_data = context.response.json()
+    response_data = json_codec.parse_response(context.response)
     
     # Check for pagination object or individual pagination fields
     if 'pagination' in response_data:
@@ -164,7 +177,7 @@ def step_response_has_pagination_info(context):
 @then('response should have content field')
 def step_response_has_content_field(context):
     """Verify response has content field"""
-    response_data = context.response.json()
+    response_data = json_codec.parse_response(context.response)
     
     assert 'content' in response_data, \
         f"Response missing 'content' field. Available fields: {list(response_data.keys())}"
@@ -178,7 +191,7 @@ def step_response_has_content_field(context):
 @then('response should have pagination fields')
 def step_response_has_pagination_fields(context):
     """Verify response has pagination fields"""
-    response_data = context.response.json()
+    response_data = json_codec.parse_response(context.response)
     
     # Check for pagination fields
     pagination_fields = ['page', 'size', 'totalPages', 'totalElements']
@@ -193,7 +206,7 @@ def step_response_has_pagination_fields(context):
 @then('response should have search structure')
 def step_response_has_search_structure(context):
     """Verify response has proper search result structure"""
-    response_data = context.response.json()
+    response_data = json_codec.parse_response(context.response)
     
     # Verify it's a valid JSON object
     assert isinstance(response_data, dict), \
@@ -209,7 +222,7 @@ def step_response_has_search_structure(context):
 @then('response should have empty results')
 def step_response_has_empty_results(context):
     """Verify response has empty results"""
-    response_data = context.response.json()
+    response_data = json_codec.parse_response(context.response)
     
     # Check for content field
     if 'content' in response_data:
@@ -226,24 +239,20 @@ def step_response_has_empty_results(context):
 @then('all results should be of type church')
 def step_all_results_are_churches(context):
     """Verify all search results are churches"""
-    response_data = context.response.json()
-    
-    assert 'content' in response_data, "Response missing 'content' field"
-    
-    churches = response_data['content']
-    
-    if len(churches) > 0:
-        # Check if results have type field or category field indicating church
-        for church in churches:
-            # The type might be in different fields depending on API response
-            if 'type' in church:
-                assert church['type'].upper() == 'CHURCH', \
-                    f"Found non-church result: {church.get('type')}"
-            elif 'category' in church:
-                assert 'CHURCH' in church['category'].upper(), \
-                    f"Found non-church result: {church.get('category')}"
-            
-        context.base_test.logger.info(f"✓ All {len(churches)} results are churches")
+    count = 0
+    # Check if results have type field or category field indicating church
+    for church in APIAssertions(context.response).iter_json_items('content'):
+        # The type might be in different fields depending on API response
+        if 'type' in church:
+            assert church['type'].upper() == 'CHURCH', \
+                f"Found non-church result: {church.get('type')}"
+        elif 'category' in church:
+            assert 'CHURCH' in church['category'].upper(), \
+                f"Found non-church result: {church.get('category')}"
+        count += 1
+    
+    if count > 0:
+        context.base_test.logger.info(f"✓ All {count} results are churches")
     else:
         context.base_test.logger.info("✓ No results to validate (empty list)")
 
@@ -251,28 +260,23 @@ def step_all_results_are_churches(context):
 @then('church names should contain "{search_term}"')
 def step_church_names_contain_term(context, search_term):
     """Verify church names contain the search term"""
-    response_data = context.response.json()
-    
-    assert 'content' in response_data, "Response missing 'content' field"
-    
-    churches = response_data['content']
-    
-    if len(churches) > 0:
-        search_term_lower = search_term.lower()
-        
-        for church in churches:
-            church_name = church.get('name', '').lower()
-            # The search might match partially or be in description
-            # So we check if any field contains the search term
-            found = False
-            for key, value in church.items():
-                if isinstance(value, str) and search_term_lower in value.lower():
-                    found = True
-                    break
-            
-            if not found:
-                context.base_test.logger.warning(f"Church '{church.get('name')}' doesn't contain '{search_term}' directly")
+    search_term_lower = search_term.lower()
+    count = 0
+    
+    for church in APIAssertions(context.response).iter_json_items('content'):
+        # The search might match partially or be in description
+        # So we check if any field contains the search term
+        found = False
+        for key, value in church.items():
+            if isinstance(value, str) and search_term_lower in value.lower():
+                found = True
+                break
         
+        if not found:
+            context.base_test.logger.warning(f"Church '{church.get('name')}' doesn't contain '{search_term}' directly")
+        count += 1
+    
+    if count > 0:
         context.base_test.logger.info(f"✓ Verified church names for search term '{search_term}'")
     else:
         context.base_test.logger.info("✓ No results to validate (empty list)")
@@ -281,20 +285,16 @@ def step_church_names_contain_term(context, search_term):
 @then('each church should have name field')
 def step_each_church_has_name(context):
     """Verify each church has a name field"""
-    response_data = context.response.json()
-    
-    assert 'content' in response_data, "Response missing 'content' field"
-    
-    churches = response_data['content']
-    
-    if len(churches) > 0:
-        for church in churches:
-            assert 'name' in church, \
-                f"Church missing 'name' field: {church}"
-            assert church['name'], \
-                f"Church name is empty: {church}"
-        
-        context.base_test.logger.info(f"✓ All {len(churches)} churches have name field")
+    count = 0
+    for church in APIAssertions(context.response).iter_json_items('content'):
+        assert 'name' in church, \
+            f"Church missing 'name' field: {church}"
+        assert church['name'], \
+            f"Church name is empty: {church}"
+        count += 1
+    
+    if count > 0:
+        context.base_test.logger.info(f"✓ All {count} churches have name field")
     else:
         context.base_test.logger.info("✓ No results to validate (empty list)")
 
@@ -302,20 +302,16 @@ def step_each_church_has_name(context):
 @then('each church should have code field')
 def step_each_church_has_code(context):
     """Verify each church has a code field"""
-    response_data = context.response.json()
-    
-    assert 'content' in response_data, "Response missing 'content' field"
-    
-    churches = response_data['content']
-    
-    if len(churches) > 0:
-        for church in churches:
-            # Code might be in different fields: code, merchantCode, id, etc.
-            has_code = any(key in church for key in ['code', 'merchantCode', 'id', 'merCode'])
-            assert has_code, \
-                f"Church missing code field: {church}"
-        
-        context.base_test.logger.info(f"✓ All {len(churches)} churches have code field")
+    count = 0
+    for church in APIAssertions(context.response).iter_json_items('content'):
+        # Code might be in different fields: code, merchantCode, id, etc.
+        has_code = any(key in church for key in ['code', 'merchantCode', 'id', 'merCode'])
+        assert has_code, \
+            f"Church missing code field: {church}"
+        count += 1
+    
+    if count > 0:
+        context.base_test.logger.info(f"✓ All {count} churches have code field")
     else:
         context.base_test.logger.info("✓ No results to validate (empty list)")
 
@@ -323,14 +319,10 @@ def step_each_church_has_code(context):
 @then('results should be in alphabetical order')
 def step_results_in_alphabetical_order(context):
     """Verify results are sorted in alphabetical order"""
-    response_data = context.response.json()
-    
-    assert 'content' in response_data, "Response missing 'content' field"
+    # Only the names are kept, not the church objects
+    names = [church.get('name', '') for church in APIAssertions(context.response).iter_json_items('content')]
     
-    churches = response_data['content']
-    
-    if len(churches) > 1:
-        names = [church.get('name', '') for church in churches]
+    if len(names) > 1:
         sorted_names = sorted(names)
         
         # Check if names are in alphabetical order (case-insensitive)
@@ -350,7 +342,12 @@ def step_results_in_alphabetical_order(context):
 @then('response should contain at most {max_count:d} results')
 def step_response_contains_at_most_results(context, max_count):
     """Verify response contains at most specified number of results"""
-    response_data = context.response.json()
+    if getattr(context.response, 'streamed', False):
+        # A streamed body is read once, so only the catalog's 'content' list is looked for
+        APIAssertions(context.response).assert_json_items_at_most('content', max_count, required=False)
+        return
+    
+    response_data = json_codec.parse_response(context.response)
     
     # Find results array
     results = None
@@ -4,6 +4,7 @@ Reusable step definitions shared across multiple features.
 """
 
 from behave import given, when, then
+from utils import json_codec
 
 
 @given('API is available')
@@ -140,7 +141,7 @@ def step_verify_body_contains(context, key):
 def step_verify_valid_json(context):
     """Verify response body is valid JSON."""
     try:
-        response_data = context.response.json()
+        response_data = json_codec.parse_response(context.response)
         assert isinstance(response_data, (dict, list)), "Response should be a JSON object or array"
         context.base_test.logger.info("✅ Response body is valid JSON")
     except Exception as e:
@@ -177,7 +178,7 @@ def step_verify_response_time(context, milliseconds):
 def step_store_field_from_response(context, field):
     """Store a field from response for later use."""
     try:
-        response_data = context.response.json()
+        response_data = json_codec.parse_response(context.response)
         value = response_data.get(field)
         setattr(context, field, value)
         context.base_test.logger.info(f"Stored {field}: {value[:50]}..." if len(str(value)) > 50 else f"Stored {field}: {value}")
@@ -190,11 +191,10 @@ def step_store_field_from_response(context, field):
 def step_print_response(context):
     """Print response for debugging."""
     try:
-        import json
-        response_json = context.response.json()
+        response_json = json_codec.parse_response(context.response)
         print("\n" + "="*50)
         print("RESPONSE:")
-        print(json.dumps(response_json, indent=2))
+        print(json_codec.dumps(response_json, indent=2))
         print("="*50 + "\n")
     except:
         print("\n" + "="*50)
@@ -4,6 +4,15 @@ Implements step definitions for Login Devices API scenarios.
 """
 
 from behave import given, when, then
+from utils import json_codec
+
+
+def _replace_user_token(context, token):
+    """Switch to a newly issued user token, dropping instrument details cached for the old one."""
+    previous = getattr(context, 'user_token', None)
+    if previous and previous != token and hasattr(context, 'instrument_registry'):
+        context.instrument_registry.invalidate(previous)
+    context.user_token = token
 
 
 @given('I have valid user token from PIN verification')
@@ -36,7 +45,7 @@ def step_have_user_token_from_pin_verify(context):
             )
             
             if otp_response.status_code == 200:
-                otp_data = otp_response.json()
+                otp_data = json_codec.parse_response(otp_response)
                 context.user_reference_id = otp_data.get('userReferenceId', 
                     config.get('pin_verify.default_user_reference_id'))
             else:
@@ -77,8 +86,8 @@ def step_have_user_token_from_pin_verify(context):
         )
         
         if pin_response.status_code == 200:
-            pin_data = pin_response.json()
-            context.user_token = pin_data.get('accessToken', '')
+            pin_data = json_codec.parse_response(pin_response)
+            _replace_user_token(context, pin_data.get('accessToken', ''))
             context.base_test.logger.info("User token obtained from PIN verification")
         else:
             # Use a sample user token for testing
@@ -205,7 +214,7 @@ def step_send_login_devices_with_stored_token(context, endpoint):
 @then('response should contain login devices list')
 def step_verify_login_devices_list(context):
     """Verify response contains login devices list."""
-    response_data = context.response.json()
+    response_data = json_codec.parse_response(context.response)
     
     # Response should be a list or contain a list field or be a valid dict response
     is_list = isinstance(response_data, list)
@@ -223,7 +232,7 @@ def step_verify_login_devices_list(context):
 @then('response should be a list')
 def step_verify_response_is_list(context):
     """Verify response is a list."""
-    response_data = context.response.json()
+    response_data = json_codec.parse_response(context.response)
     assert isinstance(response_data, list), \
         f"Response should be a list, got: {type(response_data)}"
     context.base_test.logger.info(f"✅ Response is a list with {len(response_data)} items")
@@ -232,7 +241,7 @@ def step_verify_response_is_list(context):
 @then('each device should have required fields')
 def step_verify_device_fields(context):
     """Verify each device in the list has required fields."""
-    response_data = context.response.json()
+    response_data = json_codec.parse_response(context.response)
     
     # Get the devices list
     if isinstance(response_data, list):
@@ -260,8 +269,8 @@ def step_verify_device_fields(context):
 @then('I store the user token from response')
 def step_store_user_token_from_response(context):
     """Store user token from PIN verify response for later use."""
-    response_data = context.response.json()
+    response_data = json_codec.parse_response(context.response)
     context.stored_user_token = response_data.get('accessToken', '')
-    context.user_token = context.stored_user_token
+    _replace_user_token(context, context.stored_user_token)
     assert context.stored_user_token, "Should have accessToken in response"
     context.base_test.logger.info("✅ User token stored from response")
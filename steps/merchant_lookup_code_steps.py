@@ -6,7 +6,7 @@ This API requires user token (accessToken) from PIN Verify API
 Query Parameters: merCode (merchant code)
 """
 
-import json
+from utils import json_codec
 import logging
 from behave import given, when, then
 from core.base_test import BaseTest
@@ -38,7 +38,7 @@ def step_extract_merchant_code_from_search(context):
     if not hasattr(context, 'response'):
         raise Exception("No previous response found. Run search first.")
     
-    response_json = context.response.json()
+    response_json = json_codec.parse_response(context.response)
     
     # Try to find merchant code in response
     if 'merchants' in response_json and len(response_json['merchants']) > 0:
@@ -117,8 +117,8 @@ def step_send_merchant_lookup_by_code(context, endpoint):
     logger.info(f"⏱️ Response Time: {context.response.elapsed.total_seconds() * 1000:.2f} ms")
     
     try:
-        response_json = context.response.json()
-        logger.info(f"📦 Response Body: {json.dumps(response_json, indent=2)}")
+        response_json = json_codec.parse_response(context.response)
+        logger.info(f"📦 Response Body: {json_codec.dumps(response_json, indent=2)}")
     except Exception as e:
         logger.warning(f"⚠️ Could not parse response as JSON: {str(e)}")
         logger.info(f"📦 Raw Response: {context.response.text[:500]}")
@@ -150,7 +150,7 @@ def step_send_multiple_merchant_lookups(context, count, endpoint):
         step_send_merchant_lookup_by_code(context, endpoint)
         context.multiple_responses.append({
             'status_code': context.response.status_code,
-            'response_data': context.response.json() if context.response.status_code == 200 else None
+            'response_data': json_codec.parse_response(context.response) if context.response.status_code == 200 else None
         })
         time.sleep(0.1)  # Small delay between requests
     
@@ -172,7 +172,7 @@ def step_send_multiple_merchant_lookups(context, count, endpoint):
 @then('response should contain merchant details by code')
 def step_verify_merchant_details(context):
     """Verify response contains merchant details"""
-    response_json = context.response.json()
+    response_json = json_codec.parse_response(context.response)
     
     # Check if response has merchant data structure
     assert response_json is not None, "Response body should not be empty"
@@ -187,7 +187,7 @@ def step_verify_merchant_details(context):
 @then('response should have merchant information')
 def step_verify_merchant_information(context):
     """Verify response has merchant information"""
-    response_json = context.response.json()
+    response_json = json_codec.parse_response(context.response)
     
     # Verify basic structure
     assert response_json is not None, "Response should not be empty"
@@ -198,7 +198,7 @@ def step_verify_merchant_information(context):
 @then('response should have merchant structure')
 def step_verify_merchant_structure(context):
     """Verify response has proper merchant structure"""
-    response_json = context.response.json()
+    response_json = json_codec.parse_response(context.response)
     
     # Verify it's a valid JSON object
     assert isinstance(response_json, (dict, list)), "Response should be a JSON object or array"
@@ -209,7 +209,7 @@ def step_verify_merchant_structure(context):
 @then('merchant response should have required fields')
 def step_verify_merchant_required_fields(context):
     """Verify merchant response contains required fields"""
-    response_json = context.response.json()
+    response_json = json_codec.parse_response(context.response)
     
     # Common merchant fields to check (adjust based on actual API response)
     required_fields = ['name', 'code', 'mobileNumber']
@@ -226,7 +226,7 @@ def step_verify_merchant_required_fields(context):
 @then('merchant response should contain name')
 def step_verify_merchant_has_name(context):
     """Verify merchant response contains name field"""
-    response_json = context.response.json()
+    response_json = json_codec.parse_response(context.response)
     
     if isinstance(response_json, dict):
         assert 'name' in response_json or 'merchantName' in response_json, \
@@ -238,7 +238,7 @@ def step_verify_merchant_has_name(context):
 @then('merchant response should contain code')
 def step_verify_merchant_has_code(context):
     """Verify merchant response contains code field"""
-    response_json = context.response.json()
+    response_json = json_codec.parse_response(context.response)
     
     if isinstance(response_json, dict):
         assert 'code' in response_json or 'merCode' in response_json or 'merchantCode' in response_json, \
@@ -250,7 +250,7 @@ def step_verify_merchant_has_code(context):
 @then('merchant response should contain mobile number')
 def step_verify_merchant_has_mobile(context):
     """Verify merchant response contains mobile number field"""
-    response_json = context.response.json()
+    response_json = json_codec.parse_response(context.response)
     
     if isinstance(response_json, dict):
         assert 'mobileNumber' in response_json or 'mobile' in response_json or 'phone' in response_json, \
@@ -262,7 +262,7 @@ def step_verify_merchant_has_mobile(context):
 @then('response merchant code should match requested code "{expected_code}"')
 def step_verify_merchant_code_match(context, expected_code):
     """Verify the merchant code in response matches the requested code"""
-    response_json = context.response.json()
+    response_json = json_codec.parse_response(context.response)
     
     if isinstance(response_json, dict):
         actual_code = response_json.get('code') or response_json.get('merCode') or response_json.get('merchantCode')
@@ -276,7 +276,7 @@ def step_verify_merchant_code_match(context, expected_code):
 @then('merchant name should not be empty')
 def step_verify_merchant_name_not_empty(context):
     """Verify merchant name is not empty"""
-    response_json = context.response.json()
+    response_json = json_codec.parse_response(context.response)
     
     if isinstance(response_json, dict):
         name = response_json.get('name') or response_json.get('merchantName')
@@ -288,7 +288,7 @@ def step_verify_merchant_name_not_empty(context):
 @then('merchant code should not be empty')
 def step_verify_merchant_code_not_empty(context):
     """Verify merchant code is not empty"""
-    response_json = context.response.json()
+    response_json = json_codec.parse_response(context.response)
     
     if isinstance(response_json, dict):
         code = response_json.get('code') or response_json.get('merCode') or response_json.get('merchantCode')
@@ -300,7 +300,7 @@ def step_verify_merchant_code_not_empty(context):
 @then('merchant should have address information')
 def step_verify_merchant_has_address(context):
     """Verify merchant has address information"""
-    response_json = context.response.json()
+    response_json = json_codec.parse_response(context.response)
     
     if isinstance(response_json, dict):
         has_address = 'address' in response_json or 'location' in response_json or 'street' in response_json
@@ -311,7 +311,7 @@ def step_verify_merchant_has_address(context):
 @then('merchant should have city information')
 def step_verify_merchant_has_city(context):
     """Verify merchant has city information"""
-    response_json = context.response.json()
+    response_json = json_codec.parse_response(context.response)
     
     if isinstance(response_json, dict):
         has_city = 'city' in response_json or 'town' in response_json
@@ -337,7 +337,7 @@ def step_response_should_have_merchant_type_field(context):
     """Verify response contains merchant type field."""
     assert context.response.status_code == 200, f"Expected 200, got {context.response.status_code}"
     
-    response_data = context.response.json()
+    response_data = json_codec.parse_response(context.response)
     
     # Check for type field
     type_fields = ['type', 'merchantType', 'merchant_type']
@@ -353,7 +353,7 @@ def step_response_merchant_code_should_match(context, expected_code):
     """Verify returned merchant code matches the requested code."""
     assert context.response.status_code == 200, f"Expected 200, got {context.response.status_code}"
     
-    response_data = context.response.json()
+    response_data = json_codec.parse_response(context.response)
     
     # Find the code field
     code_fields = ['code', 'merCode', 'merchantCode', 'merchant_code']
@@ -375,7 +375,7 @@ def step_merchant_type_should_be(context, expected_type):
     """Verify merchant type matches expected value."""
     assert context.response.status_code == 200, f"Expected 200, got {context.response.status_code}"
     
-    response_data = context.response.json()
+    response_data = json_codec.parse_response(context.response)
     
     # Find the type field
     type_fields = ['type', 'merchantType', 'merchant_type']
@@ -397,7 +397,7 @@ def step_merchant_code_should_be_numeric_string(context):
     """Verify merchant code is a numeric string."""
     assert context.response.status_code == 200, f"Expected 200, got {context.response.status_code}"
     
-    response_data = context.response.json()
+    response_data = json_codec.parse_response(context.response)
     
     # Find the code field
     code_fields = ['code', 'merCode', 'merchantCode', 'merchant_code']
@@ -425,10 +425,10 @@ def step_store_response_time(context):
 def step_response_should_match_previous_response(context):
     """Verify current response matches previously stored response (for caching tests)."""
     if not hasattr(context, 'previous_response_data'):
-        context.previous_response_data = context.response.json()
+        context.previous_response_data = json_codec.parse_response(context.response)
         context.base_test.logger.info("Stored response data for comparison")
     else:
-        current_data = context.response.json()
+        current_data = json_codec.parse_response(context.response)
         assert current_data == context.previous_response_data, "Response data doesn't match previous response"
         context.base_test.logger.info("Response matches previous response (caching working)")
 
@@ -452,7 +452,7 @@ def step_extract_merchant_name(context):
     """Extract merchant name from response."""
     assert context.response.status_code == 200, f"Expected 200, got {context.response.status_code}"
     
-    response_data = context.response.json()
+    response_data = json_codec.parse_response(context.response)
     
     # Find the name field
     name_fields = ['name', 'merchantName', 'merchant_name']
@@ -471,7 +471,7 @@ def step_extract_merchant_code(context):
     """Extract merchant code from response."""
     assert context.response.status_code == 200, f"Expected 200, got {context.response.status_code}"
     
-    response_data = context.response.json()
+    response_data = json_codec.parse_response(context.response)
     
     # Find the code field
     code_fields = ['code', 'merCode', 'merchantCode', 'merchant_code']
@@ -4,6 +4,7 @@ This module contains Behave step definitions for testing the merchant lookup end
 """
 
 from behave import given, when, then
+from utils import json_codec
 from core.base_test import BaseTest
 import logging
 
@@ -341,7 +342,7 @@ def step_verify_merchant_details(context):
     """
     Verify response contains merchant details
     """
-    response_data = context.response.json()
+    response_data = json_codec.parse_response(context.response)
     
     # Check if response has merchant data (could be object or list)
     has_merchant_data = (
@@ -358,7 +359,7 @@ def step_verify_merchant_information_fields(context):
     """
     Verify response contains merchant information structure
     """
-    response_data = context.response.json()
+    response_data = json_codec.parse_response(context.response)
     
     # Verify response has data
     assert response_data is not None, "Response should not be None"
@@ -372,7 +373,7 @@ def step_verify_merchant_required_fields(context):
     """
     Verify merchant details have required fields
     """
-    response_data = context.response.json()
+    response_data = json_codec.parse_response(context.response)
     
     # If response is a list, check first item
     if isinstance(response_data, list):
@@ -7,7 +7,7 @@ Query Parameters: merCode (merchant code)
 Response: Returns biller details including name, code, category, and payment information
 """
 
-import json
+from utils import json_codec
 from behave import given, when, then
 
 
@@ -62,8 +62,8 @@ def step_send_offline_biller_lookup_request(context, endpoint):
     context.base_test.logger.info(f"⏱️ Response Time: {context.response.elapsed.total_seconds() * 1000:.2f} ms")
     
     try:
-        response_json = context.response.json()
-        context.base_test.logger.info(f"📦 Response Body: {json.dumps(response_json, indent=2)[:1000]}...")
+        response_json = json_codec.parse_response(context.response)
+        context.base_test.logger.info(f"📦 Response Body: {json_codec.dumps(response_json, indent=2)[:1000]}...")
     except Exception as e:
         context.base_test.logger.warning(f"⚠️ Could not parse response as JSON: {str(e)}")
         context.base_test.logger.info(f"📦 Raw Response: {context.response.text[:500]}")
@@ -103,7 +103,7 @@ def step_send_offline_biller_lookup_without_merchant_code(context, endpoint):
 @then('response should contain biller details')
 def step_verify_biller_details(context):
     """Verify response contains biller details"""
-    response_json = context.response.json()
+    response_json = json_codec.parse_response(context.response)
     
     # Check for common biller detail fields
     has_biller_details = False
@@ -122,7 +122,7 @@ def step_verify_biller_details(context):
 @then('response should have merchant code')
 def step_verify_merchant_code(context):
     """Verify response contains merchant code"""
-    response_json = context.response.json()
+    response_json = json_codec.parse_response(context.response)
     
     has_merchant_code = False
     merchant_code = None
@@ -146,7 +146,7 @@ def step_verify_merchant_code(context):
 @then('response should have merchant name')
 def step_verify_merchant_name(context):
     """Verify response contains merchant name"""
-    response_json = context.response.json()
+    response_json = json_codec.parse_response(context.response)
     
     has_merchant_name = False
     merchant_name = None
@@ -170,7 +170,7 @@ def step_verify_merchant_name(context):
 @then('response should have required biller fields')
 def step_verify_required_biller_fields(context):
     """Verify response has required biller fields"""
-    response_json = context.response.json()
+    response_json = json_codec.parse_response(context.response)
     
     # Check for at least some key fields
     required_field_found = False
@@ -205,7 +205,7 @@ def step_verify_extracted_merchant_details_not_empty(context):
 @then('response should contain merchant name')
 def step_verify_contains_merchant_name(context):
     """Verify response contains merchant name field"""
-    response_json = context.response.json()
+    response_json = json_codec.parse_response(context.response)
     
     has_name = False
     name_fields = ['merchantName', 'merchant_name', 'name', 'billerName']
@@ -223,7 +223,7 @@ def step_verify_contains_merchant_name(context):
 @then('response should contain merchant code')
 def step_verify_contains_merchant_code(context):
     """Verify response contains merchant code field"""
-    response_json = context.response.json()
+    response_json = json_codec.parse_response(context.response)
     
     has_code = False
     code_fields = ['merchantCode', 'merchant_code', 'code', 'merCode']
@@ -241,7 +241,7 @@ def step_verify_contains_merchant_code(context):
 @then('response should contain category information')
 def step_verify_category_information(context):
     """Verify response contains category information"""
-    response_json = context.response.json()
+    response_json = json_codec.parse_response(context.response)
     
     has_category = False
     category_fields = ['category', 'categoryId', 'category_id', 'categoryName']
@@ -259,7 +259,7 @@ def step_verify_category_information(context):
 @then('merchant code format should be valid')
 def step_verify_merchant_code_format(context):
     """Verify merchant code has valid format"""
-    response_json = context.response.json()
+    response_json = json_codec.parse_response(context.response)
     
     # Get merchant code
     merchant_code = None
@@ -277,19 +277,19 @@ def step_verify_merchant_code_format(context):
 @then('I store biller details for payment')
 def step_store_biller_details_for_payment(context):
     """Store biller details in context for payment use"""
-    response_json = context.response.json()
+    response_json = json_codec.parse_response(context.response)
     
     # Store biller details
     context.biller_details = response_json
     
     context.base_test.logger.info("✅ Biller details stored for payment")
-    context.base_test.logger.info(f"📋 Stored details: {json.dumps(response_json, indent=2)[:500]}...")
+    context.base_test.logger.info(f"📋 Stored details: {json_codec.dumps(response_json, indent=2)[:500]}...")
 
 
 @then('biller details should be complete')
 def step_verify_biller_details_complete(context):
     """Verify biller details are complete"""
-    response_json = context.response.json()
+    response_json = json_codec.parse_response(context.response)
     
     # Check for essential fields
     essential_fields_found = 0
@@ -307,7 +307,7 @@ def step_verify_biller_details_complete(context):
 @then('biller details should have valid format')
 def step_verify_biller_details_format(context):
     """Verify biller details have valid format"""
-    response_json = context.response.json()
+    response_json = json_codec.parse_response(context.response)
     
     # Verify response is a dictionary
     assert isinstance(response_json, dict), "Response should be a dictionary"
@@ -5,6 +5,7 @@ This API retrieves payment details that were completed in the merchant flow
 """
 
 from behave import given, when, then
+from utils import json_codec
 import logging
 
 logger = logging.getLogger(__name__)
@@ -261,7 +262,7 @@ def step_response_contains_order_details(context):
     """
     Verify response contains order details
     """
-    response_data = context.response.json()
+    response_data = json_codec.parse_response(context.response)
     
     # Check if response has order-related fields
     order_fields = ['orderReference', 'orderId', 'order', 'details', 'status', 'amount']
@@ -277,7 +278,7 @@ def step_response_contains_order_status(context):
     """
     Verify response contains order status
     """
-    response_data = context.response.json()
+    response_data = json_codec.parse_response(context.response)
     
     # Check for status field
     status_fields = ['status', 'orderStatus', 'paymentStatus', 'state']
@@ -293,7 +294,7 @@ def step_response_has_order_structure(context):
     """
     Verify response has proper order structure
     """
-    response_data = context.response.json()
+    response_data = json_codec.parse_response(context.response)
     
     # Verify it's a dictionary/object
     assert isinstance(response_data, dict), f"Response is not an object: {type(response_data)}"
@@ -309,7 +310,7 @@ def step_order_response_has_required_fields(context):
     """
     Verify order response contains all required fields
     """
-    response_data = context.response.json()
+    response_data = json_codec.parse_response(context.response)
     
     # Check for common order fields (at least some should be present)
     expected_fields = ['orderReference', 'status', 'amount', 'currency', 'timestamp', 'createdAt']
@@ -325,7 +326,7 @@ def step_response_contains_payment_information(context):
     """
     Verify response contains payment information
     """
-    response_data = context.response.json()
+    response_data = json_codec.parse_response(context.response)
     
     # Check for payment-related fields
     payment_fields = ['paymentMethod', 'payment', 'paymentStatus', 'amount', 'currency', 'transactionId']
@@ -341,7 +342,7 @@ def step_response_contains_timestamp(context):
     """
     Verify response contains timestamp information
     """
-    response_data = context.response.json()
+    response_data = json_codec.parse_response(context.response)
     
     # Check for timestamp fields
     timestamp_fields = ['timestamp', 'createdAt', 'updatedAt', 'transactionDate', 'date', 'time']
@@ -357,7 +358,7 @@ def step_extract_order_reference_from_payment(context):
     """
     Extract order reference from payment response for next request
     """
-    response_data = context.response.json()
+    response_data = json_codec.parse_response(context.response)
     
     # Try different possible field names for order reference
     order_ref_fields = ['orderReference', 'orderId', 'transactionId', 'reference', 'id']
@@ -380,7 +381,7 @@ def step_order_status_matches_payment_status(context):
     """
     Verify order status in details matches the payment status
     """
-    response_data = context.response.json()
+    response_data = json_codec.parse_response(context.response)
     
     # Check if status field exists and is valid
     status_fields = ['status', 'orderStatus', 'paymentStatus']
@@ -4,6 +4,7 @@ Implements step definitions for OTP request API scenarios.
 """
 
 from behave import given, when, then
+from utils import json_codec
 
 
 @given('I am authenticated with valid app token')
@@ -28,7 +29,7 @@ def step_authenticated_with_app_token(context):
     )
     
     if auth_response.status_code == 200:
-        token_data = auth_response.json()
+        token_data = json_codec.parse_response(auth_response)
         context.access_token = token_data.get('accessToken')
         context.base_test.logger.info(f"✅ Authenticated successfully, token: {context.access_token[:50]}...")
     else:
@@ -127,7 +128,7 @@ def step_send_authenticated_post_request(context, endpoint):
 @then('OTP request should be successful')
 def step_verify_otp_success(context):
     """Verify OTP request was successful."""
-    response_data = context.response.json()
+    response_data = json_codec.parse_response(context.response)
     status = response_data.get('status')
     
     assert status is not None, "OTP response should contain 'status' field"
@@ -137,7 +138,7 @@ def step_verify_otp_success(context):
 @then('response should contain OTP reference')
 def step_verify_otp_reference(context):
     """Verify response contains OTP reference/transaction ID."""
-    response_data = context.response.json()
+    response_data = json_codec.parse_response(context.response)
     
     # Check for common OTP reference fields
     has_reference = any(key in response_data for key in ['otpRef', 'transactionId', 'referenceId', 'id'])
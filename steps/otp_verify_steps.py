@@ -4,6 +4,7 @@ Implements step definitions for OTP verification API scenarios.
 """
 
 from behave import given, when, then
+from utils import json_codec
 import uuid
 
 
@@ -35,7 +36,7 @@ def step_have_valid_otp_verification(context):
     )
     
     if otp_response.status_code == 200:
-        otp_data = otp_response.json()
+        otp_data = json_codec.parse_response(otp_response)
         context.otp_reference_id = otp_data.get('otpReferenceId', str(uuid.uuid4()))
         context.user_reference_id = otp_data.get('userReferenceId', str(uuid.uuid4()))
         context.base_test.logger.info(f"✅ OTP requested, reference ID: {context.otp_reference_id[:20]}...")
@@ -81,7 +82,7 @@ def step_have_otp_reference_from_request(context):
     )
     
     if otp_response.status_code == 200:
-        otp_data = otp_response.json()
+        otp_data = json_codec.parse_response(otp_response)
         context.otp_reference_id = otp_data.get('otpReferenceId', str(uuid.uuid4()))
         context.base_test.logger.info(f"✅ OTP reference ID obtained: {context.otp_reference_id[:20]}...")
     else:
@@ -130,7 +131,7 @@ def step_have_user_reference_id(context):
         )
         
         if otp_response.status_code == 200:
-            otp_data = otp_response.json()
+            otp_data = json_codec.parse_response(otp_response)
             context.user_reference_id = otp_data.get('userReferenceId', str(uuid.uuid4()))
         else:
             context.user_reference_id = str(uuid.uuid4())
@@ -234,7 +235,7 @@ def step_send_otp_verification_request(context, endpoint):
 @then('response should contain OTP verification status')
 def step_verify_verification_status(context):
     """Verify response contains OTP verification status."""
-    response_data = context.response.json()
+    response_data = json_codec.parse_response(context.response)
     
     # Check for common status fields - API returns 'message' field
     has_status = any(key in response_data for key in ['message', 'status', 'verified', 'success', 'isValid'])
@@ -246,7 +247,7 @@ def step_verify_verification_status(context):
 @then('OTP verification should be successful')
 def step_verify_otp_verification_success(context):
     """Verify OTP verification was successful."""
-    response_data = context.response.json()
+    response_data = json_codec.parse_response(context.response)
     
     # API returns 'message' field with success message: "Your OTP has been verified!"
     message = response_data.get('message', '')
@@ -268,7 +269,7 @@ def step_verify_otp_verification_success(context):
 @then('response should contain verification status')
 def step_verify_has_verification_status(context):
     """Verify response contains verification status field or authentication tokens."""
-    response_data = context.response.json()
+    response_data = json_codec.parse_response(context.response)
     
     assert isinstance(response_data, dict), "Response should be a JSON object"
     
@@ -11,7 +11,7 @@ Response contains beneficiary details including name, account info, status, etc.
 """
 
 from behave import given, when, then
-import json
+from utils import json_codec
 import logging
 import time
 
@@ -157,7 +157,7 @@ def step_send_account_lookup_request(context, endpoint):
     
     try:
         logger.info(f"Sending POST request to {url}")
-        logger.info(f"Request body: {json.dumps(json_data, indent=2)}")
+        logger.info(f"Request body: {json_codec.dumps(json_data, indent=2)}")
         
         start_time = time.time()
         response = context.base_test.api_client.post(
@@ -177,7 +177,7 @@ def step_send_account_lookup_request(context, endpoint):
             
             # ✨ DYNAMIC TOKEN EXTRACTION: Extract beneficiary instrument token
             try:
-                response_json = response.json()
+                response_json = json_codec.parse_response(response)
                 if 'actionDetails' in response_json and len(response_json['actionDetails']) > 0:
                     first_action = response_json['actionDetails'][0]
                     if 'beneficiaryInstrumentToken' in first_action:
@@ -208,7 +208,7 @@ def step_response_contains_account_details(context):
     assert context.response.status_code == 200, \
         f"Expected status 200, got {context.response.status_code}"
     
-    response_data = context.response.json()
+    response_data = json_codec.parse_response(context.response)
     
     # The actual API returns actionDetails array with beneficiary information
     if 'actionDetails' in response_data and len(response_data['actionDetails']) > 0:
@@ -233,7 +233,7 @@ def step_response_contains_account_details(context):
 @then('response should have beneficiary name')
 def step_response_has_beneficiary_name(context):
     """Verify response has beneficiary name"""
-    response_data = context.response.json()
+    response_data = json_codec.parse_response(context.response)
     
     # The actual API returns beneficiaryName inside actionDetails array
     if 'actionDetails' in response_data and len(response_data['actionDetails']) > 0:
@@ -270,7 +270,7 @@ def step_response_has_beneficiary_name(context):
 @then('response should have account status')
 def step_response_has_account_status(context):
     """Verify response has account status"""
-    response_data = context.response.json()
+    response_data = json_codec.parse_response(context.response)
     
     # The actual API may have status information in actionDetails
     if 'actionDetails' in response_data and len(response_data['actionDetails']) > 0:
@@ -305,7 +305,7 @@ def step_response_has_account_status(context):
 @then('response should have complete beneficiary details')
 def step_response_has_complete_beneficiary_details(context):
     """Verify response has complete beneficiary details"""
-    response_data = context.response.json()
+    response_data = json_codec.parse_response(context.response)
     
     # Store response for later use
     context.beneficiary_details = response_data
@@ -328,7 +328,7 @@ def step_response_has_complete_beneficiary_details(context):
 @then('response should have required account fields')
 def step_response_has_required_account_fields(context):
     """Verify response has required account fields"""
-    response_data = context.response.json()
+    response_data = json_codec.parse_response(context.response)
     
     # At least one identifier should be present
     identifier_fields = ['accountNumber', 'accountId', 'customerId', 'phone', 'phoneNumber']
@@ -348,7 +348,7 @@ def step_response_has_required_account_fields(context):
 @then('beneficiary account should be valid')
 def step_beneficiary_account_should_be_valid(context):
     """Verify beneficiary account is valid"""
-    response_data = context.response.json()
+    response_data = json_codec.parse_response(context.response)
     
     # Check if account is valid (no error status)
     if 'error' in response_data or 'errorCode' in response_data:
@@ -368,7 +368,7 @@ def step_beneficiary_account_should_be_valid(context):
 @then('I extract beneficiary name from response')
 def step_extract_beneficiary_name(context):
     """Extract beneficiary name from response"""
-    response_data = context.response.json()
+    response_data = json_codec.parse_response(context.response)
     
     # Find name field
     name_fields = ['name', 'beneficiaryName', 'accountName', 'customerName', 'fullName', 'displayName']
@@ -396,7 +396,7 @@ def step_extract_beneficiary_name(context):
 @then('I extract account identifier from response')
 def step_extract_account_identifier(context):
     """Extract account identifier from response"""
-    response_data = context.response.json()
+    response_data = json_codec.parse_response(context.response)
     
     # Find identifier field
     identifier_fields = ['accountNumber', 'accountId', 'customerId', 'phone', 'phoneNumber', 'mobileNumber']
@@ -436,7 +436,7 @@ def step_extracted_beneficiary_details_valid(context):
 @then('response should have account metadata')
 def step_response_has_account_metadata(context):
     """Verify response has account metadata"""
-    response_data = context.response.json()
+    response_data = json_codec.parse_response(context.response)
     
     # Response should have some metadata
     assert len(response_data) > 0, "Response is empty"
@@ -447,7 +447,7 @@ def step_response_has_account_metadata(context):
 @then('response should have beneficiary information')
 def step_response_has_beneficiary_information(context):
     """Verify response has beneficiary information"""
-    response_data = context.response.json()
+    response_data = json_codec.parse_response(context.response)
     
     # Should have at least name or account information
     info_fields = ['name', 'beneficiaryName', 'accountName', 'customerName', 'accountNumber', 'accountId']
@@ -467,7 +467,7 @@ def step_response_has_beneficiary_information(context):
 @then('beneficiary name should not be empty')
 def step_beneficiary_name_not_empty(context):
     """Verify beneficiary name is not empty"""
-    response_data = context.response.json()
+    response_data = json_codec.parse_response(context.response)
     
     # Find name field
     name_fields = ['name', 'beneficiaryName', 'accountName', 'customerName', 'fullName']
@@ -495,7 +495,7 @@ def step_beneficiary_name_not_empty(context):
 @then('beneficiary name should be valid string')
 def step_beneficiary_name_valid_string(context):
     """Verify beneficiary name is a valid string"""
-    response_data = context.response.json()
+    response_data = json_codec.parse_response(context.response)
     
     # Find name field
     name_fields = ['name', 'beneficiaryName', 'accountName', 'customerName', 'fullName']
@@ -523,7 +523,7 @@ def step_beneficiary_name_valid_string(context):
 @then('account identifier should be present')
 def step_account_identifier_present(context):
     """Verify account identifier is present"""
-    response_data = context.response.json()
+    response_data = json_codec.parse_response(context.response)
     
     # Find identifier field
     identifier_fields = ['accountNumber', 'accountId', 'customerId', 'phone', 'phoneNumber']
@@ -544,7 +544,7 @@ def step_account_identifier_present(context):
 @then('account identifier should match requested number')
 def step_account_identifier_matches_requested(context):
     """Verify account identifier matches requested number"""
-    response_data = context.response.json()
+    response_data = json_codec.parse_response(context.response)
     
     # Get requested account number
     requested = context.account_number
@@ -583,7 +583,7 @@ def step_account_identifier_matches_requested(context):
 @then('I store first lookup response')
 def step_store_first_lookup_response(context):
     """Store first lookup response for comparison"""
-    response_data = context.response.json()
+    response_data = json_codec.parse_response(context.response)
     context.first_lookup_response = response_data
     logger.info(f"✓ Stored first lookup response")
 
@@ -594,7 +594,7 @@ def step_second_lookup_matches_first(context):
     assert hasattr(context, 'first_lookup_response'), "First lookup response was not stored"
     
     first_response = context.first_lookup_response
-    second_response = context.response.json()
+    second_response = json_codec.parse_response(context.response)
     
     # Compare key fields
     comparison_fields = ['name', 'beneficiaryName', 'accountName', 'accountNumber', 'accountId']
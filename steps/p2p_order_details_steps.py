@@ -7,6 +7,7 @@ This API retrieves P2P payment transaction details after a payment transfer
 import time
 import logging
 from behave import given, when, then
+from utils import json_codec
 from datetime import datetime
 
 logger = logging.getLogger(__name__)
@@ -90,9 +91,7 @@ def step_send_order_details_request(context, endpoint):
         url = f"{base_url}{endpoint}"
     
     # Build headers with Authorization
-    headers = {
-        'Content-Type': 'application/json'
-    }
+    headers = context.header_profiles.build('json')
     
     # Add Authorization header if user token available
     if hasattr(context, 'user_token') and context.user_token:
@@ -130,7 +129,7 @@ def step_send_order_details_request(context, endpoint):
         
         # Try to log response body
         try:
-            logger.info(f"Response body: {response.json()}")
+            logger.info(f"Response body: {json_codec.parse_response(response)}")
         except Exception:
             logger.info(f"Response body (text): {response.text}")
             
@@ -144,7 +143,7 @@ def step_send_order_details_request(context, endpoint):
 @then('response should contain P2P order details data')
 def step_verify_order_details(context):
     """Verify response contains order details"""
-    response_data = context.response.json()
+    response_data = json_codec.parse_response(context.response)
     
     # Check for common order detail fields
     order_fields = ['orderId', 'id', 'orderDetails', 'data', 'transaction']
@@ -158,7 +157,7 @@ def step_verify_order_details(context):
 @then('P2P order details should have order ID')
 def step_verify_has_order_id(context):
     """Verify response has order ID field"""
-    response_data = context.response.json()
+    response_data = json_codec.parse_response(context.response)
     
     # Check various possible order ID field names
     order_id_fields = ['orderId', 'id', 'orderNumber', 'transactionId']
@@ -183,7 +182,7 @@ def step_verify_has_order_id(context):
 @then('P2P order details should have status')
 def step_verify_has_transaction_status(context):
     """Verify response has transaction status field"""
-    response_data = context.response.json()
+    response_data = json_codec.parse_response(context.response)
     
     # Check various possible status field names
     status_fields = ['status', 'transactionStatus', 'orderStatus', 'state']
@@ -204,7 +203,7 @@ def step_verify_has_transaction_status(context):
 @then('P2P order details should have amount')
 def step_verify_has_transaction_amount(context):
     """Verify response has transaction amount field"""
-    response_data = context.response.json()
+    response_data = json_codec.parse_response(context.response)
     
     # Check various possible amount field names
     amount_fields = ['amount', 'transactionAmount', 'payerAmount', 'totalAmount']
@@ -225,7 +224,7 @@ def step_verify_has_transaction_amount(context):
 @then('P2P order details should have complete information')
 def step_verify_complete_order_info(context):
     """Verify response has complete order information"""
-    response_data = context.response.json()
+    response_data = json_codec.parse_response(context.response)
     
     # Essential fields that should be present
     essential_fields = ['orderId', 'id', 'status', 'amount']
@@ -245,7 +244,7 @@ def step_verify_complete_order_info(context):
 @then('P2P order details should have beneficiary details')
 def step_verify_has_beneficiary_details(context):
     """Verify response contains beneficiary details"""
-    response_data = context.response.json()
+    response_data = json_codec.parse_response(context.response)
     
     # Check for beneficiary information
     beneficiary_fields = ['beneficiary', 'beneficiaryDetails', 'payee', 'recipient']
@@ -269,7 +268,7 @@ def step_verify_has_beneficiary_details(context):
 @then('P2P order details should have payer details')
 def step_verify_has_payer_details(context):
     """Verify response contains payer details"""
-    response_data = context.response.json()
+    response_data = json_codec.parse_response(context.response)
     
     # Check for payer information
     payer_fields = ['payer', 'payerDetails', 'sender', 'customer']
@@ -293,7 +292,7 @@ def step_verify_has_payer_details(context):
 @then('P2P order details should have timestamps')
 def step_verify_has_timestamps(context):
     """Verify response has transaction timestamps"""
-    response_data = context.response.json()
+    response_data = json_codec.parse_response(context.response)
     
     # Check for timestamp fields
     timestamp_fields = ['createdAt', 'timestamp', 'createdDate', 'transactionDate', 'updatedAt']
@@ -312,7 +311,7 @@ def step_verify_has_timestamps(context):
 @then('I extract transaction status from order details')
 def step_extract_transaction_status(context):
     """Extract transaction status from order details response"""
-    response_data = context.response.json()
+    response_data = json_codec.parse_response(context.response)
     
     # Extract status
     status_fields = ['status', 'transactionStatus', 'orderStatus', 'state']
@@ -335,7 +334,7 @@ def step_extract_transaction_status(context):
 @then('I extract transaction amount from order details')
 def step_extract_transaction_amount(context):
     """Extract transaction amount from order details response"""
-    response_data = context.response.json()
+    response_data = json_codec.parse_response(context.response)
     
     # Extract amount
     amount_fields = ['amount', 'transactionAmount', 'payerAmount', 'totalAmount']
@@ -373,7 +372,7 @@ def step_verify_extracted_details_valid(context):
 @then('order status should be successful')
 def step_verify_order_successful(context):
     """Verify order status is successful"""
-    response_data = context.response.json()
+    response_data = json_codec.parse_response(context.response)
     
     # Extract status
     status_fields = ['status', 'transactionStatus', 'orderStatus', 'state']
@@ -402,7 +401,7 @@ def step_verify_order_successful(context):
 @then('order should have completion timestamp')
 def step_verify_completion_timestamp(context):
     """Verify order has completion timestamp"""
-    response_data = context.response.json()
+    response_data = json_codec.parse_response(context.response)
     
     # Check for completion timestamp fields
     completion_fields = ['completedAt', 'completionDate', 'completionTime', 'updatedAt']
@@ -426,7 +425,7 @@ def step_verify_completion_timestamp(context):
 @then('I extract order ID from transfer response')
 def step_extract_order_id_from_transfer(context):
     """Extract order ID from payment transfer response"""
-    response_data = context.response.json()
+    response_data = json_codec.parse_response(context.response)
     
     # Extract order ID from transfer response
     order_id_fields = ['orderId', 'id', 'orderNumber', 'transactionId']
@@ -451,7 +450,7 @@ def step_extract_order_id_from_transfer(context):
 @then('order ID in details should match transfer order ID')
 def step_verify_order_id_matches(context):
     """Verify order ID in details matches the one from transfer"""
-    response_data = context.response.json()
+    response_data = json_codec.parse_response(context.response)
     
     # Extract order ID from details response
     order_id_fields = ['orderId', 'id', 'orderNumber', 'transactionId']
@@ -481,7 +480,7 @@ def step_verify_order_id_matches(context):
 @then('order details should have order ID field')
 def step_verify_order_id_field_exists(context):
     """Verify order details has order ID field"""
-    response_data = context.response.json()
+    response_data = json_codec.parse_response(context.response)
     
     order_id_fields = ['orderId', 'id', 'orderNumber', 'transactionId']
     
@@ -498,7 +497,7 @@ def step_verify_order_id_field_exists(context):
 @then('order details should have status field')
 def step_verify_status_field_exists(context):
     """Verify order details has status field"""
-    response_data = context.response.json()
+    response_data = json_codec.parse_response(context.response)
     
     status_fields = ['status', 'transactionStatus', 'orderStatus', 'state']
     
@@ -515,7 +514,7 @@ def step_verify_status_field_exists(context):
 @then('order details should have amount field')
 def step_verify_amount_field_exists(context):
     """Verify order details has amount field"""
-    response_data = context.response.json()
+    response_data = json_codec.parse_response(context.response)
     
     amount_fields = ['amount', 'transactionAmount', 'payerAmount', 'totalAmount']
     
@@ -532,7 +531,7 @@ def step_verify_amount_field_exists(context):
 @then('order details should have currency field')
 def step_verify_currency_field_exists(context):
     """Verify order details has currency field"""
-    response_data = context.response.json()
+    response_data = json_codec.parse_response(context.response)
     
     currency_fields = ['currency', 'currencyCode', 'transactionCurrency']
     
@@ -552,7 +551,7 @@ def step_verify_currency_field_exists(context):
 @then('order details should have creation timestamp')
 def step_verify_creation_timestamp_exists(context):
     """Verify order details has creation timestamp"""
-    response_data = context.response.json()
+    response_data = json_codec.parse_response(context.response)
     
     creation_fields = ['createdAt', 'createdDate', 'timestamp', 'transactionDate']
     
@@ -569,7 +568,7 @@ def step_verify_creation_timestamp_exists(context):
 @then('order details should have update timestamp')
 def step_verify_update_timestamp_exists(context):
     """Verify order details has update timestamp"""
-    response_data = context.response.json()
+    response_data = json_codec.parse_response(context.response)
     
     update_fields = ['updatedAt', 'updatedDate', 'lastModified', 'modifiedAt']
     
@@ -589,7 +588,7 @@ def step_verify_update_timestamp_exists(context):
 @then('timestamps should be in valid format')
 def step_verify_timestamp_format(context):
     """Verify timestamps are in valid format"""
-    response_data = context.response.json()
+    response_data = json_codec.parse_response(context.response)
     
     timestamp_fields = ['createdAt', 'updatedAt', 'timestamp', 'createdDate', 'transactionDate']
     
@@ -626,7 +625,7 @@ def step_verify_timestamp_format(context):
 @then('order details should have beneficiary name')
 def step_verify_beneficiary_name_exists(context):
     """Verify order details has beneficiary name"""
-    response_data = context.response.json()
+    response_data = json_codec.parse_response(context.response)
     
     # Check for beneficiary name in various locations
     beneficiary_name = None
@@ -669,7 +668,7 @@ def step_verify_beneficiary_name_exists(context):
 @then('order details should have beneficiary account')
 def step_verify_beneficiary_account_exists(context):
     """Verify order details has beneficiary account"""
-    response_data = context.response.json()
+    response_data = json_codec.parse_response(context.response)
     
     # Check for beneficiary account in various locations
     account_fields = [
@@ -717,7 +716,7 @@ def step_verify_beneficiary_info_valid(context):
 @then('order details should have payer information')
 def step_verify_payer_information_exists(context):
     """Verify order details has payer information"""
-    response_data = context.response.json()
+    response_data = json_codec.parse_response(context.response)
     
     payer_fields = ['payer', 'payerDetails', 'sender', 'customer']
     
@@ -744,14 +743,14 @@ def step_verify_payer_info_valid(context):
 @then('I store first order details response')
 def step_store_first_order_details(context):
     """Store first order details response for comparison"""
-    context.first_order_details = context.response.json()
+    context.first_order_details = json_codec.parse_response(context.response)
     logger.info("✓ Stored first order details response")
 
 
 @then('second order details should match first')
 def step_verify_order_details_match(context):
     """Verify second order details response matches first"""
-    second_response = context.response.json()
+    second_response = json_codec.parse_response(context.response)
     first_response = context.first_order_details
     
     # Compare key fields
@@ -775,7 +774,7 @@ def step_verify_order_details_match(context):
 @then('order status should be pending or processing')
 def step_verify_order_pending_or_processing(context):
     """Verify order status is pending or processing"""
-    response_data = context.response.json()
+    response_data = json_codec.parse_response(context.response)
     
     status_fields = ['status', 'transactionStatus', 'orderStatus', 'state']
     
@@ -803,7 +802,7 @@ def step_verify_order_pending_or_processing(context):
 @then('order status should be failed or rejected')
 def step_verify_order_failed_or_rejected(context):
     """Verify order status is failed or rejected"""
-    response_data = context.response.json()
+    response_data = json_codec.parse_response(context.response)
     
     status_fields = ['status', 'transactionStatus', 'orderStatus', 'state']
     
@@ -831,7 +830,7 @@ def step_verify_order_failed_or_rejected(context):
 @then('order should have failure reason')
 def step_verify_failure_reason_exists(context):
     """Verify order has failure reason"""
-    response_data = context.response.json()
+    response_data = json_codec.parse_response(context.response)
     
     reason_fields = ['reason', 'failureReason', 'errorMessage', 'message', 'errorDescription']
     
@@ -8,7 +8,7 @@ NOTE: This API retrieves available payment options/instruments for P2P transfers
 
 from behave import given, when, then
 import logging
-import json
+from utils import json_codec
 import time
 import uuid
 
@@ -81,7 +81,7 @@ def step_send_p2p_payment_options_request(context, endpoint):
     
     try:
         logger.info(f"Sending GET request to {url}")
-        logger.info(f"Query parameters: {json.dumps(params, indent=2)}")
+        logger.info(f"Query parameters: {json_codec.dumps(params, indent=2)}")
         logger.info(f"Request ID: {headers.get('requestId')}")
         
         start_time = time.time()
@@ -102,7 +102,7 @@ def step_send_p2p_payment_options_request(context, endpoint):
             
             # ✨ DYNAMIC TOKEN EXTRACTION: Extract payer instrument token
             try:
-                response_json = response.json()
+                response_json = json_codec.parse_response(response)
                 if 'items' in response_json:
                     for item in response_json['items']:
                         # Check for instruments at item level (not provider level!)
@@ -153,7 +153,7 @@ def step_response_contains_payment_options(context):
     assert context.response.status_code == 200, \
         f"Expected status 200, got {context.response.status_code}"
     
-    response_data = context.response.json()
+    response_data = json_codec.parse_response(context.response)
     
     # Check for common payment options fields (including 'items' which is used by this API)
     payment_option_fields = ['items', 'paymentOptions', 'options', 'instruments', 'paymentMethods', 'data']
@@ -172,7 +172,7 @@ def step_response_contains_payment_options(context):
 @then('P2P payment options should not be empty')
 def step_payment_options_not_empty(context):
     """Verify payment options are not empty"""
-    response_data = context.response.json()
+    response_data = json_codec.parse_response(context.response)
     
     # Find payment options in response (including 'items' field)
     payment_options = None
@@ -200,7 +200,7 @@ def step_payment_options_not_empty(context):
 @then('response should have P2P payment options list')
 def step_response_has_payment_options_list(context):
     """Verify response has payment options list structure"""
-    response_data = context.response.json()
+    response_data = json_codec.parse_response(context.response)
     
     # Check if response has list structure
     has_list = False
@@ -222,7 +222,7 @@ def step_response_has_payment_options_list(context):
 @then('each P2P payment option should have required fields')
 def step_each_option_has_required_fields(context):
     """Verify each payment option has required fields"""
-    response_data = context.response.json()
+    response_data = json_codec.parse_response(context.response)
     
     # Find payment options
     payment_options = None
@@ -256,7 +256,7 @@ def step_each_option_has_required_fields(context):
 @then('P2P payment options should have valid structure')
 def step_payment_options_valid_structure(context):
     """Verify payment options have valid structure"""
-    response_data = context.response.json()
+    response_data = json_codec.parse_response(context.response)
     
     # Find payment options
     payment_options = None
@@ -286,7 +286,7 @@ def step_payment_options_valid_structure(context):
 @then('I extract first P2P payment option')
 def step_extract_first_payment_option(context):
     """Extract first payment option from response"""
-    response_data = context.response.json()
+    response_data = json_codec.parse_response(context.response)
     
     # Find payment options
     payment_options = None
@@ -326,7 +326,7 @@ def step_extracted_option_valid(context):
 @then('P2P payment options should contain instrument information')
 def step_options_contain_instrument_info(context):
     """Verify payment options contain instrument information"""
-    response_data = context.response.json()
+    response_data = json_codec.parse_response(context.response)
     
     # Find payment options
     payment_options = None
@@ -359,7 +359,7 @@ def step_options_contain_instrument_info(context):
 @then('each P2P instrument should have valid details')
 def step_each_instrument_valid(context):
     """Verify each instrument has valid details"""
-    response_data = context.response.json()
+    response_data = json_codec.parse_response(context.response)
     
     # Find payment options
     payment_options = None
@@ -387,7 +387,7 @@ def step_each_instrument_valid(context):
 @then('P2P payment options should have provider details')
 def step_options_have_provider_details(context):
     """Verify payment options have provider details"""
-    response_data = context.response.json()
+    response_data = json_codec.parse_response(context.response)
     
     # Find payment options
     payment_options = None
@@ -418,7 +418,7 @@ def step_options_have_provider_details(context):
 @then('P2P provider names should be valid')
 def step_provider_names_valid(context):
     """Verify provider names are valid strings"""
-    response_data = context.response.json()
+    response_data = json_codec.parse_response(context.response)
     
     # Find payment options
     payment_options = None
@@ -448,7 +448,7 @@ def step_provider_names_valid(context):
 @then('I store first P2P payment options response')
 def step_store_first_options_response(context):
     """Store first payment options response for comparison"""
-    context.first_options_response = context.response.json()
+    context.first_options_response = json_codec.parse_response(context.response)
     logger.info(f"✓ Stored first payment options response")
 
 
@@ -457,7 +457,7 @@ def step_second_options_match_first(context):
     """Verify second payment options response matches first"""
     assert hasattr(context, 'first_options_response'), "No first response stored"
     
-    second_response = context.response.json()
+    second_response = json_codec.parse_response(context.response)
     
     # Compare structure (not exact match as some fields may change)
     # Just verify we got similar data structure
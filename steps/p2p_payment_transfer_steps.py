@@ -3,11 +3,11 @@ Step definitions for P2P Payment Transfer API
 Endpoint: POST /bff/v2/order/transfer/payment
 """
 
-import json
+from utils import json_codec
 import time
-import uuid
 import logging
 from behave import given, when, then
+from utils.helpers import load_payload
 
 # Initialize logger
 logger = logging.getLogger(__name__)
@@ -33,7 +33,7 @@ def step_payment_transfer_details(context):
         transfer_details[field] = value
     
     context.transfer_details = transfer_details
-    logger.info(f"Payment transfer details set: {json.dumps(transfer_details, indent=2)}")
+    logger.info(f"Payment transfer details set: {json_codec.dumps(transfer_details, indent=2)}")
 
 
 @given('I have complete payment transfer payload')
@@ -46,10 +46,11 @@ def step_complete_payment_transfer_payload(context):
     payer_amount = config.get('p2p_payment_transfer.payer_amount', 3)
     payee_amount = config.get('p2p_payment_transfer.payee_amount', 3)
     
-    # 🔐 PIN Priority: 1) Fresh from Payment Instruments API, 2) Config
-    encrypted_pin = getattr(context, 'fresh_encrypted_pin', None) or \
-                   config.get('p2p_payment_transfer.encrypted_pin', 
-                             config.get('pin_verify.sample_encrypted_pin', ''))
+    # 🔐 PIN Priority: 1) Encrypted locally (pin_encryption), 2) Fresh from Payment Instruments API, 3) Config
+    encrypted_pin = context.pin_encryptor.next_pin(
+        getattr(context, 'fresh_encrypted_pin', None) or
+        config.get('p2p_payment_transfer.encrypted_pin', config.get('pin_verify.sample_encrypted_pin', ''))
+    )
     
     # ✨ USE STATIC TOKENS FROM WORKING POSTMAN (same authentication session as PIN)
     # Priority: STATIC from config (working Postman) → Dynamic from APIs (may fail due to session mismatch)
@@ -82,7 +83,9 @@ def step_complete_payment_transfer_payload(context):
     logger.info(f"🔐 Encrypted PIN (first 50 chars): {encrypted_pin[:50] if encrypted_pin else 'MISSING'}...")
     
     # Enhanced PIN source logging
-    if hasattr(context, 'fresh_encrypted_pin'):
+    if context.pin_encryptor.enabled and context.pin_encryptor.pin:
+        logger.info(f"🔐 PIN Source: LOCAL ({context.pin_encryptor.alias} public key) ✅")
+    elif hasattr(context, 'fresh_encrypted_pin'):
         logger.info(f"🔐 PIN Source: FRESH (from Payment Instruments API) ✅")
     elif config.get('p2p_payment_transfer.encrypted_pin'):
         logger.info(f"🔐 PIN Source: CONFIG (p2p_payment_transfer) ⚠️")
@@ -114,48 +117,22 @@ def step_complete_payment_transfer_payload(context):
     device_os = config.get('p2p_payment_transfer.device_os', 'Android')
     device_os_version = config.get('p2p_payment_transfer.device_os_version', '13')
     
-    # Payload structure matching working Postman request
-    payload = {
-        "feeAmount": fee_amount,  # 0.5 from working Postman
-        "currency": currency,  # ZWG from working Postman
-        "payerAmount": payer_amount,  # 2 from working Postman
-        "beneficiaryDetails": {
-            "payeeAmount": payee_amount,  # 2 from working Postman
-            "paymentMethod": "wallet",
-            "instrumentId": instrument_id,  # Dynamic or config
-            "beneficiaryInstrumentToken": beneficiary_instrument_token,  # Dynamic from API
-            "name": "Ropafadzo Nyagwaya",  # Exact name from working Postman
-            "provider": "ecocash",
-            "customerId": customer_id  # Dynamic or config
-        },
-        "payerDetails": {
-            "instrumentToken": payer_instrument_token,  # Fresh from Payment Instruments API or dynamic
-            "paymentMethod": "wallet",
-            "provider": "ecocash",
-            "pin": encrypted_pin,  # Original PIN from config (working Postman)
-            "publicKeyAlias": "payment-links"
-        },
-        "deviceInfo": {
-            "ip": "192.0.0.2",
-            "model": device_model,
-            "network": "unidentified",
-            "latitude": "unidentified",
-            "longitude": "unidentified",
-            "os": device_os,
-            "osVersion": device_os_version,
-            "appVersion": "1.4.1",
-            "package": "com.sasai.sasaipay",
-            "simNumber": "71ff20d0-83ff-11f0-969e-4b09cf763135",
-            "deviceId": "71ff20d0-83ff-11f0-969e-4b09cf763135"
-        },
-        "notes": {
-            "message": "P2P Test Transaction",  # Added back - present in working Postman
-            "beneficiaryInstrumentId": instrument_id,
-            "beneficiaryMobileNumber": "+263789124669"
-        },
-        "subType": "p2p-pay",
-        "channel": "sasai-super-app"
-    }
+    # Payload structure matching working Postman request (payloads/p2p_payment_transfer.json)
+    payload = load_payload(
+        'p2p_payment_transfer',
+        fee_amount=fee_amount,
+        currency=currency,
+        payer_amount=payer_amount,
+        payee_amount=payee_amount,
+        instrument_id=instrument_id,
+        beneficiary_instrument_token=beneficiary_instrument_token,
+        customer_id=customer_id,
+        payer_instrument_token=payer_instrument_token,
+        encrypted_pin=encrypted_pin,
+        device_model=device_model,
+        device_os=device_os,
+        device_os_version=device_os_version
+    )
     
     context.payment_transfer_payload = payload
     logger.info("✅ Complete payment transfer payload prepared matching Postman working request")
@@ -280,31 +257,9 @@ def step_fetch_payment_instrument_details(context):
     # Build URL
     url = f"{context.config_loader.get('api.base_url')}/bff/v1/payment/instruments/{payer_instrument_id}"
     
-    # Build headers similar to the curl command
-    import platform
-    headers = {
-        'Content-Type': 'application/json; charset=utf-8',
-        'os': platform.system(),  # Will be 'Darwin' on Mac, 'Linux', 'Windows', etc.
-        'deviceType': 'ios',
-        'currentVersion': '2.2.4',
-        'Accept-Encoding': 'gzip',
-        'Connection': 'keep-alive',
-        'requestId': str(uuid.uuid4()),
-        'appChannel': 'sasai-super-app',
-        'simNumber': '71ff20d0-83ff-11f0-969e-4b09cf763135',
-        'deviceId': '71ff20d0-83ff-11f0-969e-4b09cf763135',
-        'model': 'iPhone',
-        'network': 'unidentified',
-        'latitude': '28.504298881044864',
-        'longitude': '77.03564191467765',
-        'osVersion': platform.version(),
-        'appVersion': '2.2.4',
-        'package': 'com.sasai.superAppDev'
-    }
-    
-    # Add Authorization header if user token available
-    if hasattr(context, 'user_token') and context.user_token:
-        headers['Authorization'] = f"Bearer {context.user_token}"
+    # Headers similar to the curl command (precompiled 'payment_instrument' profile)
+    user_token = getattr(context, 'user_token', None) or None
+    headers = context.header_profiles.build('payment_instrument', token=user_token, request_id=True)
     
     try:
         logger.info("="*80)
@@ -313,20 +268,21 @@ def step_fetch_payment_instrument_details(context):
         logger.info(f"🔑 Instrument ID: {payer_instrument_id}")
         logger.info(f"🌐 URL: {url}")
         
+        # Shared registry: repeated lookups for the same token/instrument skip the round-trip
         start_time = time.time()
-        response = context.base_test.api_client.get(
-            f"/bff/v1/payment/instruments/{payer_instrument_id}",
+        response_data = context.instrument_registry.get(
+            context.base_test.api_client,
+            payer_instrument_id,
+            token=user_token,
             headers=headers
         )
         response_time = (time.time() - start_time) * 1000
         
-        logger.info(f"📊 Status Code: {response.status_code}")
-        logger.info(f"⏱️  Response Time: {response_time:.2f} ms")
+        logger.info(f"⏱️  Lookup Time: {response_time:.2f} ms")
         
-        if response.status_code == 200:
-            response_data = response.json()
+        if response_data is not None:
             logger.info(f"✅ Payment Instrument Details Retrieved")
-            logger.info(f"📦 Response: {json.dumps(response_data, indent=2)[:500]}...")
+            logger.info(f"📦 Response: {json_codec.dumps(response_data, indent=2)[:500]}...")
             
             # Extract encrypted PIN if available
             if 'encryptedPin' in response_data:
@@ -343,9 +299,6 @@ def step_fetch_payment_instrument_details(context):
             logger.info("="*80)
             
         else:
-            response_text = response.text if hasattr(response, 'text') else str(response.content)
-            logger.warning(f"⚠️  Failed to fetch payment instrument: Status {response.status_code}")
-            logger.warning(f"Response: {response_text}")
             logger.info("="*80)
             
     except Exception as e:
@@ -393,15 +346,8 @@ def step_send_payment_transfer_request(context, endpoint):
     url = f"{context.config_loader.get('api.base_url')}{endpoint}"
     
     # Build headers
-    headers = {
-        'Content-Type': 'application/json'
-    }
-    
-    # Add Authorization header if user token available
-    if hasattr(context, 'user_token') and context.user_token:
-        headers['Authorization'] = f"Bearer {context.user_token}"
-    elif hasattr(context, 'app_token') and context.app_token:
-        headers['Authorization'] = f"Bearer {context.app_token}"
+    token = getattr(context, 'user_token', None) or getattr(context, 'app_token', None) or None
+    headers = context.header_profiles.build('json', token=token)
     
     # Override headers if specific conditions are set
     if hasattr(context, 'no_auth_header') and context.no_auth_header:
@@ -415,8 +361,8 @@ def step_send_payment_transfer_request(context, endpoint):
         logger.info("🔍 DEBUG MODE: Sending Payment Transfer Request")
         logger.info("="*80)
         logger.info(f"🌐 URL: {url}")
-        logger.info(f"� Headers: {json.dumps({k: (v[:50] + '...' if k == 'Authorization' and len(v) > 50 else v) for k, v in headers.items()}, indent=2)}")
-        logger.info(f"�📦 COMPLETE PAYLOAD:\n{json.dumps(payload, indent=2)}")
+        logger.info(f"� Headers: {json_codec.dumps({k: (v[:50] + '...' if k == 'Authorization' and len(v) > 50 else v) for k, v in headers.items()}, indent=2)}")
+        logger.info(f"�📦 COMPLETE PAYLOAD:\n{json_codec.dumps(payload, indent=2)}")
         logger.info(f"🔍 DEBUG - Field Type Analysis:")
         logger.info(f"  - feeAmount: {payload.get('feeAmount')} (type: {type(payload.get('feeAmount'))})")
         logger.info(f"  - currency: {payload.get('currency')} (type: {type(payload.get('currency'))})")
@@ -449,8 +395,8 @@ def step_send_payment_transfer_request(context, endpoint):
             response_text = response.text if hasattr(response, 'text') else str(response.content)
             logger.error(f"❌ ERROR Response: {response_text}")
             try:
-                error_json = response.json()
-                logger.error(f"🔍 Parsed Error: {json.dumps(error_json, indent=2)}")
+                error_json = json_codec.parse_response(response)
+                logger.error(f"🔍 Parsed Error: {json_codec.dumps(error_json, indent=2)}")
             except:
                 pass
         logger.info("="*80)
@@ -480,7 +426,7 @@ def step_response_contains_transaction_details(context):
     assert context.response.status_code in [200, 201], \
         f"Expected status 200/201, got {context.response.status_code}"
     
-    response_data = context.response.json()
+    response_data = json_codec.parse_response(context.response)
     
     # Check for common transaction fields
     transaction_fields = ['orderId', 'transactionId', 'id', 'status', 'data', 'transaction']
@@ -495,7 +441,7 @@ def step_response_contains_transaction_details(context):
 @then('response should have P2P order ID')
 def step_response_has_order_id(context):
     """Verify response has order ID"""
-    response_data = context.response.json()
+    response_data = json_codec.parse_response(context.response)
     
     # Check for order ID in various possible locations
     order_id = None
@@ -527,7 +473,7 @@ def step_order_id_not_empty(context):
 @then('P2P transaction status should be valid')
 def step_transaction_status_valid(context):
     """Verify transaction status is valid"""
-    response_data = context.response.json()
+    response_data = json_codec.parse_response(context.response)
     
     # Find status in response
     status = None
@@ -551,7 +497,7 @@ def step_transaction_status_valid(context):
 @then('response should have complete P2P transaction details')
 def step_response_has_complete_transaction_details(context):
     """Verify response has complete transaction details"""
-    response_data = context.response.json()
+    response_data = json_codec.parse_response(context.response)
     
     # Check for essential fields in transaction response
     essential_fields = ['orderId', 'id', 'status', 'data', 'transaction']
@@ -566,7 +512,7 @@ def step_response_has_complete_transaction_details(context):
 @then('response should have P2P transaction ID')
 def step_response_has_transaction_id(context):
     """Verify response has transaction ID"""
-    response_data = context.response.json()
+    response_data = json_codec.parse_response(context.response)
     
     # Check for transaction ID
     transaction_id = None
@@ -586,7 +532,7 @@ def step_response_has_transaction_id(context):
 @then('response should have P2P transaction timestamp')
 def step_response_has_transaction_timestamp(context):
     """Verify response has transaction timestamp"""
-    response_data = context.response.json()
+    response_data = json_codec.parse_response(context.response)
     
     # Check for timestamp fields
     timestamp_fields = ['timestamp', 'createdAt', 'created', 'date', 'transactionTime']
@@ -605,7 +551,7 @@ def step_response_has_transaction_timestamp(context):
 @then('response should have P2P transaction status')
 def step_response_has_transaction_status(context):
     """Verify response has transaction status"""
-    response_data = context.response.json()
+    response_data = json_codec.parse_response(context.response)
     
     status = None
     if 'status' in response_data:
@@ -622,7 +568,7 @@ def step_response_has_transaction_status(context):
 @then('P2P response transaction amount should be {amount:d} ZWG')
 def step_response_transaction_amount_matches(context, amount):
     """Verify transaction amount in response matches expected amount"""
-    response_data = context.response.json()
+    response_data = json_codec.parse_response(context.response)
     
     # Find amount in response
     response_amount = None
@@ -646,7 +592,7 @@ def step_response_transaction_amount_matches(context, amount):
 @then('response should contain P2P beneficiary information')
 def step_response_contains_beneficiary_info(context):
     """Verify response contains beneficiary information"""
-    response_data = context.response.json()
+    response_data = json_codec.parse_response(context.response)
     
     # Check for beneficiary fields
     beneficiary_fields = ['beneficiary', 'beneficiaryDetails', 'payee', 'recipient']
@@ -666,7 +612,7 @@ def step_response_contains_beneficiary_info(context):
 @then('P2P beneficiary name should match request')
 def step_beneficiary_name_matches_request(context):
     """Verify beneficiary name in response matches request"""
-    response_data = context.response.json()
+    response_data = json_codec.parse_response(context.response)
     request_name = context.payment_transfer_payload['beneficiaryDetails']['name']
     
     # Try to find beneficiary name in response
@@ -690,19 +636,19 @@ def step_beneficiary_name_matches_request(context):
 @then('I store first P2P transfer response')
 def step_store_first_transfer_response(context):
     """Store first transfer response for comparison"""
-    context.first_transfer_response = context.response.json()
+    context.first_transfer_response = json_codec.parse_response(context.response)
     logger.info("✓ First transfer response stored")
 
 
 @then('response should indicate duplicate P2P transaction')
 def step_response_indicates_duplicate(context):
     """Verify response indicates duplicate transaction"""
-    response_data = context.response.json()
+    response_data = json_codec.parse_response(context.response)
     
     # Check for duplicate transaction indicators
     duplicate_indicators = ['duplicate', 'already exists', 'transaction already processed', 'idempotent']
     
-    response_text = json.dumps(response_data).lower()
+    response_text = json_codec.dumps(response_data).lower()
     is_duplicate = any(indicator in response_text for indicator in duplicate_indicators)
     
     # Or check for specific error codes
@@ -14,7 +14,7 @@ Response contains list of matching contacts with their details.
 """
 
 from behave import given, when, then
-import json
+from utils import json_codec
 import logging
 import time
 
@@ -102,7 +102,7 @@ def step_send_contact_search_request(context, endpoint):
     
     try:
         logger.info(f"Sending GET request to {url}")
-        logger.info(f"Query params: {json.dumps(params, indent=2)}")
+        logger.info(f"Query params: {json_codec.dumps(params, indent=2)}")
         
         start_time = time.time()
         response = context.base_test.api_client.get(
@@ -138,7 +138,7 @@ def step_response_has_contacts_list(context):
     assert context.response.status_code == 200, \
         f"Expected status 200, got {context.response.status_code}"
     
-    response_data = context.response.json()
+    response_data = json_codec.parse_response(context.response)
     
     # Try to find contacts in various structures
     contacts = None
@@ -169,7 +169,7 @@ def step_response_has_contacts_list(context):
 @then('search results should not be empty')
 def step_search_results_not_empty(context):
     """Verify search results are not empty"""
-    response_data = context.response.json()
+    response_data = json_codec.parse_response(context.response)
     
     # Check if we have contacts stored
     if hasattr(context, 'search_contacts'):
@@ -199,7 +199,7 @@ def step_search_results_empty_or_valid(context):
     assert context.response.status_code == 200, \
         f"Expected status 200, got {context.response.status_code}"
     
-    response_data = context.response.json()
+    response_data = json_codec.parse_response(context.response)
     
     # Response should be valid JSON
     assert response_data is not None, "Response data is None"
@@ -210,7 +210,7 @@ def step_search_results_empty_or_valid(context):
 @then('response should have contact details structure')
 def step_response_has_contact_details_structure(context):
     """Verify response has proper contact details structure"""
-    response_data = context.response.json()
+    response_data = json_codec.parse_response(context.response)
     
     # Extract contacts
     if isinstance(response_data, list):
@@ -241,7 +241,7 @@ def step_response_has_contact_details_structure(context):
 @then('each contact should have required fields')
 def step_each_contact_has_required_fields(context):
     """Verify each contact has required fields"""
-    response_data = context.response.json()
+    response_data = json_codec.parse_response(context.response)
     
     # Extract contacts
     if isinstance(response_data, list):
@@ -272,7 +272,7 @@ def step_each_contact_has_required_fields(context):
 @then('response should respect page count limit')
 def step_response_respects_page_count(context):
     """Verify response respects the page count limit"""
-    response_data = context.response.json()
+    response_data = json_codec.parse_response(context.response)
     
     # Extract contacts
     if isinstance(response_data, list):
@@ -298,7 +298,7 @@ def step_response_respects_page_count(context):
 @then('I extract first contact from search results')
 def step_extract_first_contact(context):
     """Extract first contact from search results"""
-    response_data = context.response.json()
+    response_data = json_codec.parse_response(context.response)
     
     # Extract contacts
     if isinstance(response_data, list):
@@ -320,13 +320,13 @@ def step_extract_first_contact(context):
     for collection in contacts:
         if 'document' in collection and isinstance(collection['document'], list) and len(collection['document']) > 0:
             first_contact = collection['document'][0]
-            logger.info(f"✓ Extracted first contact from document array: {json.dumps(first_contact, indent=2)}")
+            logger.info(f"✓ Extracted first contact from document array: {json_codec.dumps(first_contact, indent=2)}")
             break
     
     # If no document structure found, use first item as is
     if not first_contact:
         first_contact = contacts[0]
-        logger.info(f"✓ Extracted first contact: {json.dumps(first_contact, indent=2)}")
+        logger.info(f"✓ Extracted first contact: {json_codec.dumps(first_contact, indent=2)}")
     
     context.extracted_contact = first_contact
 
@@ -351,7 +351,7 @@ def step_extracted_contact_has_valid_details(context):
 @then('response should have search metadata')
 def step_response_has_search_metadata(context):
     """Verify response has search metadata"""
-    response_data = context.response.json()
+    response_data = json_codec.parse_response(context.response)
     
     # Check for metadata fields
     metadata_fields = ['total', 'totalElements', 'page', 'pageCount', 'totalPages', 'query', 'searchQuery']
@@ -370,7 +370,7 @@ def step_response_has_search_metadata(context):
 @then('each contact should have name field')
 def step_each_contact_has_name_field(context):
     """Verify each contact has name field"""
-    response_data = context.response.json()
+    response_data = json_codec.parse_response(context.response)
     
     # Extract contacts
     if isinstance(response_data, list):
@@ -401,7 +401,7 @@ def step_each_contact_has_name_field(context):
 @then('each contact should have identifier field')
 def step_each_contact_has_identifier_field(context):
     """Verify each contact has identifier field"""
-    response_data = context.response.json()
+    response_data = json_codec.parse_response(context.response)
     
     # Extract contacts
     if isinstance(response_data, list):
@@ -5,6 +5,7 @@ This API verifies available payment methods for merchant payments
 """
 
 from behave import given, when, then
+from utils import json_codec
 import logging
 
 logger = logging.getLogger(__name__)
@@ -162,7 +163,7 @@ def step_verify_payment_options(context):
     """
     Verify response contains payment options data
     """
-    response_data = context.response.json()
+    response_data = json_codec.parse_response(context.response)
     
     # Check if response has payment options data (could be object or list)
     has_payment_options = (
@@ -174,8 +175,7 @@ def step_verify_payment_options(context):
     logger.info("✅ Response contains payment options")
     
     # Log the full response structure for debugging
-    import json
-    logger.info(f"📋 Payment Options Full Response:\n{json.dumps(response_data, indent=2)}")
+    logger.info(f"📋 Payment Options Full Response:\n{json_codec.dumps(response_data, indent=2)}")
     
     # Extract and store instrument token for use in utility payment
     instrument_token = None
@@ -216,7 +216,7 @@ def step_verify_payment_methods(context):
     """
     Verify response contains payment methods information
     """
-    response_data = context.response.json()
+    response_data = json_codec.parse_response(context.response)
     
     # Check for payment methods in response
     has_payment_methods = False
@@ -252,7 +252,7 @@ def step_verify_payment_options(context):
     Verify response contains payment options
     This is a simplified check compared to 'response should have payment options structure'
     """
-    response_data = context.response.json()
+    response_data = json_codec.parse_response(context.response)
     
     # Verify response has data
     assert response_data is not None, "Response should not be None"
@@ -280,7 +280,7 @@ def step_verify_payment_options_structure(context):
     """
     Verify response has proper payment options structure
     """
-    response_data = context.response.json()
+    response_data = json_codec.parse_response(context.response)
     
     # Verify response has data
     assert response_data is not None, "Response should not be None"
@@ -294,7 +294,7 @@ def step_verify_payment_options_required_fields(context):
     """
     Verify payment options have required fields
     """
-    response_data = context.response.json()
+    response_data = json_codec.parse_response(context.response)
     
     # If response is a list, check first item
     if isinstance(response_data, list):
@@ -320,7 +320,7 @@ def step_verify_at_least_one_payment_method(context):
     """
     Verify response contains at least one payment method
     """
-    response_data = context.response.json()
+    response_data = json_codec.parse_response(context.response)
     
     method_count = 0
     
@@ -350,7 +350,7 @@ def step_verify_at_least_one_payment_method(context):
 @then('response should contain payment instruments')
 def step_verify_payment_instruments(context):
     """Verify response contains payment instruments"""
-    response_json = context.response.json()
+    response_json = json_codec.parse_response(context.response)
     
     # Check for payment instruments in various possible fields
     has_instruments = False
@@ -393,7 +393,7 @@ def step_verify_payment_instruments(context):
 @then('response should have instrument token')
 def step_verify_instrument_token(context):
     """Verify response has instrument token"""
-    response_json = context.response.json()
+    response_json = json_codec.parse_response(context.response)
     
     # Check for instrument token in response
     token_found = False
@@ -4,6 +4,7 @@ Implements step definitions for PIN verification API scenarios.
 """
 
 from behave import given, when, then
+from utils import json_codec
 import uuid
 
 
@@ -39,7 +40,7 @@ def step_have_valid_pin_verification(context):
             )
             
             if otp_response.status_code == 200:
-                otp_data = otp_response.json()
+                otp_data = json_codec.parse_response(otp_response)
                 context.user_reference_id = otp_data.get('userReferenceId', 
                     config.get('pin_verify.default_user_reference_id'))
             else:
@@ -290,7 +291,7 @@ def step_send_pin_verification_without_model(context, endpoint):
 @then('response should contain PIN verification status')
 def step_verify_pin_verification_status(context):
     """Verify response contains PIN verification status or authentication tokens."""
-    response_data = context.response.json()
+    response_data = json_codec.parse_response(context.response)
     
     # PIN Verify API returns authentication tokens (like App Token API)
     # Check for status fields OR authentication tokens
@@ -303,7 +304,7 @@ def step_verify_pin_verification_status(context):
 @then('PIN verification should be successful')
 def step_verify_pin_verification_success(context):
     """Verify PIN verification was successful."""
-    response_data = context.response.json()
+    response_data = json_codec.parse_response(context.response)
     
     # PIN Verify API returns accessToken when PIN is verified successfully (like App Token API)
     # Check for success indicators OR authentication tokens
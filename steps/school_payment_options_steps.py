@@ -11,7 +11,7 @@ NOTE: The following steps are shared with payment_options_steps.py:
 These steps are automatically available for school payment options.
 """
 
-import json
+from utils import json_codec
 import uuid
 from behave import given, when, then
 
@@ -47,24 +47,12 @@ def step_set_all_device_headers(context):
     if not hasattr(context, 'custom_headers'):
         context.custom_headers = {}
     
-    context.custom_headers.update({
-        'os': 'RM6877',
-        'deviceType': 'android',
-        'currentVersion': '2.2.1',
-        'Accept-Encoding': 'gzip',
-        'Connection': 'keep-alive',
-        'requestId': str(uuid.uuid4()),
-        'appChannel': 'sasai-super-app',
-        'simNumber': str(uuid.uuid4()),
-        'deviceId': str(uuid.uuid4()),
-        'model': 'realme - RMX3741',
-        'network': 'unidentified',
-        'latitude': '28.508632',
-        'longitude': '77.092242',
-        'osVersion': '15',
-        'appVersion': '2.2.1',
-        'package': 'com.sasai.sasaipay'
-    })
+    # Device identifiers stay random per call, as before
+    context.custom_headers.update(context.header_profiles.build(
+        'android_device',
+        request_id=True,
+        overlay={'simNumber': str(uuid.uuid4()), 'deviceId': str(uuid.uuid4())}
+    ))
     context.base_test.logger.info("📱 Set all required device headers")
 
 
@@ -186,8 +174,8 @@ def step_send_school_payment_options_request(context, endpoint):
     context.base_test.logger.info(f"⏱️ Response Time: {context.response.elapsed.total_seconds() * 1000:.2f} ms")
     
     try:
-        response_json = context.response.json()
-        context.base_test.logger.info(f"📦 Response Body: {json.dumps(response_json, indent=2)[:1000]}...")
+        response_json = json_codec.parse_response(context.response)
+        context.base_test.logger.info(f"📦 Response Body: {json_codec.dumps(response_json, indent=2)[:1000]}...")
     except Exception as e:
         context.base_test.logger.warning(f"⚠️ Could not parse response as JSON: {str(e)}")
         context.base_test.logger.info(f"📦 Raw Response: {context.response.text[:500]}")
@@ -213,7 +201,7 @@ def step_send_school_payment_options_with_stored_token(context, endpoint):
 @then('response should have payment instruments')
 def step_verify_payment_instruments(context):
     """Verify response contains payment instruments"""
-    response_json = context.response.json()
+    response_json = json_codec.parse_response(context.response)
     
     # Check for payment instruments
     has_instruments = False
@@ -235,7 +223,7 @@ def step_verify_payment_instruments(context):
 @then('response should contain wallet payment option')
 def step_verify_wallet_payment_option(context):
     """Verify response contains wallet payment option"""
-    response_json = context.response.json()
+    response_json = json_codec.parse_response(context.response)
     
     has_wallet = False
     
@@ -252,7 +240,7 @@ def step_verify_wallet_payment_option(context):
 @then('payment options response should have items')
 def step_verify_payment_options_has_items(context):
     """Verify payment options response has items"""
-    response_json = context.response.json()
+    response_json = json_codec.parse_response(context.response)
     
     assert 'items' in response_json, "Response should contain 'items' field"
     assert isinstance(response_json['items'], list), "'items' should be a list"
@@ -264,7 +252,7 @@ def step_verify_payment_options_has_items(context):
 @then('payment options response should have instruments')
 def step_verify_payment_options_has_instruments(context):
     """Verify payment options has instruments"""
-    response_json = context.response.json()
+    response_json = json_codec.parse_response(context.response)
     
     instruments_found = False
     
@@ -281,7 +269,7 @@ def step_verify_payment_options_has_instruments(context):
 @then('payment instruments should have instrument tokens')
 def step_verify_instruments_have_tokens(context):
     """Verify payment instruments have instrument tokens"""
-    response_json = context.response.json()
+    response_json = json_codec.parse_response(context.response)
     
     tokens_found = False
     
@@ -303,7 +291,7 @@ def step_verify_instruments_have_tokens(context):
 @then('payment instruments should have provider information')
 def step_verify_instruments_have_providers(context):
     """Verify payment instruments have provider information"""
-    response_json = context.response.json()
+    response_json = json_codec.parse_response(context.response)
     
     providers_found = False
     
@@ -320,7 +308,7 @@ def step_verify_instruments_have_providers(context):
 @then('all instrument tokens should not be empty')
 def step_verify_instrument_tokens_not_empty(context):
     """Verify all instrument tokens are not empty"""
-    response_json = context.response.json()
+    response_json = json_codec.parse_response(context.response)
     
     token_count = 0
     
@@ -341,7 +329,7 @@ def step_verify_instrument_tokens_not_empty(context):
 @then('payment options should contain provider "{provider_code}"')
 def step_verify_payment_options_has_provider(context, provider_code):
     """Verify payment options contain specific provider"""
-    response_json = context.response.json()
+    response_json = json_codec.parse_response(context.response)
     
     provider_found = False
     
@@ -363,7 +351,7 @@ def step_verify_payment_options_has_provider(context, provider_code):
 @then('payment instruments should have currency information')
 def step_verify_instruments_have_currency(context):
     """Verify payment instruments have currency information"""
-    response_json = context.response.json()
+    response_json = json_codec.parse_response(context.response)
     
     currency_found = False
     
@@ -385,7 +373,7 @@ def step_verify_instruments_have_currency(context):
 @then('response should have default payment instrument')
 def step_verify_default_instrument(context):
     """Verify response has a default payment instrument"""
-    response_json = context.response.json()
+    response_json = json_codec.parse_response(context.response)
     
     default_found = False
     
@@ -407,7 +395,7 @@ def step_verify_default_instrument(context):
 @then('response should have payment menu')
 def step_verify_payment_menu(context):
     """Verify response contains payment menu"""
-    response_json = context.response.json()
+    response_json = json_codec.parse_response(context.response)
     
     assert 'paymentMenu' in response_json, "Response should contain payment menu"
     context.base_test.logger.info("✅ Response has payment menu")
@@ -416,7 +404,7 @@ def step_verify_payment_menu(context):
 @then('payment options should have providers list')
 def step_verify_providers_list(context):
     """Verify payment options have providers list"""
-    response_json = context.response.json()
+    response_json = json_codec.parse_response(context.response)
     
     providers_found = False
     
@@ -433,7 +421,7 @@ def step_verify_providers_list(context):
 @then('providers should have health check status')
 def step_verify_providers_health_check(context):
     """Verify providers have health check status"""
-    response_json = context.response.json()
+    response_json = json_codec.parse_response(context.response)
     
     health_check_found = False
     
@@ -455,7 +443,7 @@ def step_verify_providers_health_check(context):
 @then('payment providers should support balance enquiry')
 def step_verify_balance_enquiry_support(context):
     """Verify payment providers support balance enquiry"""
-    response_json = context.response.json()
+    response_json = json_codec.parse_response(context.response)
     
     balance_enquiry_found = False
     
@@ -477,7 +465,7 @@ def step_verify_balance_enquiry_support(context):
 @then('payment options should contain wallet details')
 def step_verify_wallet_details(context):
     """Verify payment options contain wallet details"""
-    response_json = context.response.json()
+    response_json = json_codec.parse_response(context.response)
     
     wallet_details_found = False
     
@@ -499,7 +487,7 @@ def step_verify_wallet_details(context):
 @then('wallet details should have masked account number')
 def step_verify_masked_account_number(context):
     """Verify wallet details have masked account number"""
-    response_json = context.response.json()
+    response_json = json_codec.parse_response(context.response)
     
     masked_account_found = False
     
@@ -527,7 +515,7 @@ def step_verify_masked_account_number(context):
 @then('I extract instrument token from response')
 def step_extract_instrument_token(context):
     """Extract instrument token from payment options response"""
-    response_json = context.response.json()
+    response_json = json_codec.parse_response(context.response)
     
     token_extracted = False
     
@@ -5,7 +5,7 @@ This is part of the "Pay to School" flow
 """
 
 from behave import given, when, then
-import json
+from utils import json_codec
 import requests
 
 import time
@@ -47,7 +47,7 @@ def step_have_school_payment_details(context):
             "instrumentToken": context.instrument_token,
             "paymentMethod": config.get('school_payment.payment_method', 'wallet'),
             "provider": config.get('school_payment.provider', 'ecocash'),
-            "pin": config.get('school_payment.encrypted_pin'),
+            "pin": context.pin_encryptor.next_pin(config.get('school_payment.encrypted_pin')),
             "publicKeyAlias": config.get('school_payment.public_key_alias', 'payment-links')
         },
         "subType": config.get('school_payment.subtype', 'pay-to-school'),
@@ -284,7 +284,7 @@ def step_have_payment_with_extracted_token_and_code(context):
 def step_extract_instrument_token_from_response(context):
     """Extract instrument token from payment options response"""
     if hasattr(context, 'response') and context.response.status_code == 200:
-        response_data = context.response.json()
+        response_data = json_codec.parse_response(context.response)
         if 'walletOptions' in response_data:
             wallet_options = response_data['walletOptions']
             if isinstance(wallet_options, list) and len(wallet_options) > 0:
@@ -310,43 +310,23 @@ def step_send_school_payment_request(context, endpoint):
     config = context.config_loader
     url = f"{config.get('api.base_url')}{endpoint}"
     
-    # Build headers from config
-    headers = {
-        'Content-Type': 'application/json',
-        'Authorization': f"Bearer {context.user_token}",
-        'os': config.get('school_payment.device_os', 'RM6877'),
-        'deviceType': 'android',
-        'currentVersion': config.get('school_payment.app_version', '2.2.1'),
-        'Accept-Encoding': 'gzip',
-        'Connection': 'keep-alive',
-        'appChannel': config.get('school_payment.channel', 'sasai-super-app'),
-        'simNumber': config.get('school_payment.sim_number'),
-        'deviceId': config.get('school_payment.device_id'),
-        'model': config.get('school_payment.device_model'),
-        'network': config.get('school_payment.device_network'),
-        'latitude': config.get('school_payment.device_latitude'),
-        'longitude': config.get('school_payment.device_longitude'),
-        'osVersion': config.get('school_payment.device_os_version'),
-        'appVersion': config.get('school_payment.app_version'),
-        'package': config.get('school_payment.app_package')
-    }
-    
-    # Add request ID if available
-    if hasattr(context, 'unique_request_id'):
-        headers['requestId'] = context.unique_request_id
-    else:
-        import uuid
-        headers['requestId'] = str(uuid.uuid4())
+    # Device headers come from the precompiled 'school_payment_device' profile;
+    # reuse the scenario's request ID if available
+    headers = context.header_profiles.build(
+        'school_payment_device',
+        token=context.user_token,
+        request_id=getattr(context, 'unique_request_id', True)
+    )
     
     try:
         context.base_test.logger.info(f"Sending POST request to {url}")
-        context.base_test.logger.info(f"Headers: {json.dumps({k: v for k, v in headers.items() if k != 'Authorization'}, indent=2)}")
-        context.base_test.logger.info(f"Body: {json.dumps(context.payment_details, indent=2)}")
+        context.base_test.logger.info(f"Headers: {json_codec.dumps({k: v for k, v in headers.items() if k != 'Authorization'}, indent=2)}")
+        context.base_test.logger.info(f"Body: {json_codec.dumps(context.payment_details, indent=2)}")
         
         start_time = time.time()
         context.response = requests.post(
             url,
-            json=context.payment_details,
+            data=json_codec.dumps_bytes(context.payment_details),
             headers=headers,
             timeout=30
         )
@@ -387,7 +367,7 @@ def step_send_same_payment_request_again(context):
 @then('response should have transaction reference')
 def step_response_has_transaction_reference(context):
     """Verify response has transaction reference"""
-    response_data = context.response.json()
+    response_data = json_codec.parse_response(context.response)
     
     reference_fields = ['referenceNumber', 'transactionId', 'reference', 'txnRef']
     has_reference = any(field in response_data for field in reference_fields)
@@ -401,7 +381,7 @@ def step_response_has_transaction_reference(context):
 @then('payment response should have status')
 def step_payment_response_has_status(context):
     """Verify payment response has status field"""
-    response_data = context.response.json()
+    response_data = json_codec.parse_response(context.response)
     
     assert 'status' in response_data, \
         f"Response missing 'status' field. Response: {response_data}"
@@ -412,7 +392,7 @@ def step_payment_response_has_status(context):
 @then('payment response should have reference number')
 def step_payment_response_has_reference_number(context):
     """Verify payment response has reference number"""
-    response_data = context.response.json()
+    response_data = json_codec.parse_response(context.response)
     
     reference_fields = ['referenceNumber', 'reference', 'refNumber']
     has_reference = any(field in response_data for field in reference_fields)
@@ -426,7 +406,7 @@ def step_payment_response_has_reference_number(context):
 @then('payment response should have transaction ID')
 def step_payment_response_has_transaction_id(context):
     """Verify payment response has transaction ID"""
-    response_data = context.response.json()
+    response_data = json_codec.parse_response(context.response)
     
     transaction_id_fields = ['transactionId', 'txnId', 'id']
     has_transaction_id = any(field in response_data for field in transaction_id_fields)
@@ -440,7 +420,7 @@ def step_payment_response_has_transaction_id(context):
 @then('payment status should be success or pending')
 def step_payment_status_is_success_or_pending(context):
     """Verify payment status is success or pending"""
-    response_data = context.response.json()
+    response_data = json_codec.parse_response(context.response)
     
     assert 'status' in response_data, "Response missing 'status' field"
     
@@ -456,7 +436,7 @@ def step_payment_status_is_success_or_pending(context):
 @then('payment response should contain amount {amount:f}')
 def step_payment_response_contains_amount(context, amount):
     """Verify payment response contains specified amount"""
-    response_data = context.response.json()
+    response_data = json_codec.parse_response(context.response)
     
     amount_fields = ['amount', 'payerAmount', 'totalAmount']
     found_amount = None
@@ -478,7 +458,7 @@ def step_payment_response_contains_amount(context, amount):
 @then('response should contain school details')
 def step_response_contains_school_details(context):
     """Verify response contains school details"""
-    response_data = context.response.json()
+    response_data = json_codec.parse_response(context.response)
     
     # Check for school-related fields
     school_fields = ['operatorName', 'merchantName', 'billerName', 'schoolName']
@@ -497,7 +477,7 @@ def step_response_contains_school_details(context):
 @then('I store the transaction reference')
 def step_store_transaction_reference(context):
     """Store transaction reference for later use"""
-    response_data = context.response.json()
+    response_data = json_codec.parse_response(context.response)
     
     reference_fields = ['referenceNumber', 'transactionId', 'reference', 'txnRef']
     
@@ -513,7 +493,7 @@ def step_store_transaction_reference(context):
 @then('response should have receipt information')
 def step_response_has_receipt_information(context):
     """Verify response has receipt information"""
-    response_data = context.response.json()
+    response_data = json_codec.parse_response(context.response)
     
     receipt_fields = ['receipt', 'receiptNumber', 'receiptData', 'transactionReceipt']
     has_receipt = any(field in response_data for field in receipt_fields)
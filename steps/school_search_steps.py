@@ -6,10 +6,12 @@ This API requires user token (accessToken) from PIN Verify API
 Query Parameters: type, page, pageSize, nameQuery
 """
 
-import json
+from utils import json_codec
 import logging
 from behave import given, when, then
 from core.base_test import BaseTest
+from core.assertions import APIAssertions
+from core.pagination import Paginator
 
 logger = logging.getLogger(__name__)
 
@@ -93,10 +95,7 @@ def step_send_school_search_request(context, endpoint):
     logger.info(f"🔍 School Search Query Parameters: {params}")
     
     # Build headers
-    headers = {
-        'Content-Type': 'application/json',
-        'Accept': 'application/json'
-    }
+    headers = context.header_profiles.build('json_accept')
     
     # Add Authorization header if token exists
     if hasattr(context, 'no_auth') and context.no_auth:
@@ -109,6 +108,10 @@ def step_send_school_search_request(context, endpoint):
     else:
         logger.warning("⚠️ No user token available for Authorization header")
     
+    # Large pages are streamed and checked item by item
+    stream_threshold = context.config_loader.get('api.streaming.page_size_threshold', 50)
+    streamed = params.get('pageSize', 0) > stream_threshold
+    
     # Make the GET request
     logger.info(f"🚀 Sending GET request to: {endpoint}")
     logger.info(f"📋 Headers: {headers}")
@@ -116,16 +119,21 @@ def step_send_school_search_request(context, endpoint):
     context.response = api_client.get(
         endpoint=endpoint,
         params=params,
-        headers=headers
+        headers=headers,
+        stream=streamed
     )
     
     # Log response details
     logger.info(f"📥 Response Status: {context.response.status_code}")
     logger.info(f"⏱️ Response Time: {context.response.elapsed.total_seconds() * 1000:.2f} ms")
     
+    if streamed:
+        logger.info(f"📦 Response Body: streamed (pageSize {params['pageSize']} > {stream_threshold})")
+        return
+    
     try:
-        response_json = context.response.json()
-        logger.info(f"📦 Response Body: {json.dumps(response_json, indent=2)}")
+        response_json = json_codec.parse_response(context.response)
+        logger.info(f"📦 Response Body: {json_codec.dumps(response_json, indent=2)}")
     except Exception as e:
         logger.warning(f"⚠️ Could not parse response as JSON: {str(e)}")
         logger.info(f"📦 Raw Response: {context.response.text[:500]}")
@@ -139,6 +147,52 @@ def step_send_school_search_with_stored_token(context, endpoint):
     step_send_school_search_request(context, endpoint)
 
 
+def _catalog_paginator(context, endpoint):
+    """Build a paginator over all catalog pages for the current search parameters"""
+    search_config = context.config_loader.get('school_search', {})
+    params = {}
+    if getattr(context, 'search_type', None) is not None:
+        params['type'] = context.search_type
+    if hasattr(context, 'name_query'):
+        params['nameQuery'] = context.name_query
+    
+    # The paginator walks valid pages only: out-of-range sizes from negative scenarios are clamped
+    max_page_size = search_config.get('max_page_size', 100)
+    page_size = min(max(getattr(context, 'page_size', max_page_size), 1), max_page_size)
+    
+    headers = context.header_profiles.build('json_accept', token=getattr(context, 'user_token', None) or None)
+    return Paginator(
+        context.base_test.api_client,
+        endpoint,
+        params=params,
+        headers=headers,
+        page_size=page_size,
+        prefetch=search_config.get('prefetch_pages', 4),
+        first_page=search_config.get('default_page', 0)
+    )
+
+
+@when('I search all catalog pages for code "{code}" at "{endpoint}"')
+def step_search_catalog_pages_for_code(context, code, endpoint):
+    """Walk catalog pages (prefetching ahead) until an item with the given code is found"""
+    paginator = _catalog_paginator(context, endpoint)
+    context.catalog_item = paginator.find(
+        lambda item: code in (item.get('code'), item.get('merchantCode'), item.get('merCode'))
+    )
+    context.catalog_pages_fetched = paginator.pages_fetched
+    logger.info(f"🔍 Code '{code}' {'found' if context.catalog_item else 'not found'} "
+                f"after {paginator.pages_fetched} pages ({paginator.requests_sent} requests)")
+
+
+@when('I read all catalog pages at "{endpoint}"')
+def step_read_all_catalog_pages(context, endpoint):
+    """Walk every catalog page and count the items"""
+    paginator = _catalog_paginator(context, endpoint)
+    context.catalog_item_count = sum(1 for _ in paginator)
+    context.catalog_pages_fetched = paginator.pages_fetched
+    logger.info(f"📚 Read {context.catalog_item_count} catalog items from {paginator.pages_fetched} pages")
+
+
 # Note: The following @when steps are already defined in common_steps.py:
 # - I send POST request to "{endpoint}"
 # - I send GET request to "{endpoint}"
@@ -152,7 +206,7 @@ def step_send_school_search_with_stored_token(context, endpoint):
 @then('response should contain search results')
 def step_verify_search_results(context):
     """Verify response contains search results"""
-    response_json = context.response.json()
+    response_json = json_codec.parse_response(context.response)
     
     # Check if response has results structure
     # Adjust based on actual API response structure
@@ -164,7 +218,12 @@ def step_verify_search_results(context):
 @then('response should have at most {max_results:d} results')
 def step_verify_max_results(context, max_results):
     """Verify response has at most specified number of results"""
-    response_json = context.response.json()
+    if getattr(context.response, 'streamed', False):
+        # A streamed body is read once, so only the catalog's 'content' list is looked for
+        APIAssertions(context.response).assert_json_items_at_most('content', max_results, required=False)
+        return
+    
+    response_json = json_codec.parse_response(context.response)
     
     # Find results array (adjust based on actual API response structure)
     results = None
@@ -185,10 +244,29 @@ def step_verify_max_results(context, max_results):
         logger.warning("⚠️ Could not find results array in response")
 
 
+@then('the catalog item should be found')
+def step_verify_catalog_item_found(context):
+    """Verify the paginated code search found an item"""
+    assert getattr(context, 'catalog_item', None), \
+        f"Item not found in {getattr(context, 'catalog_pages_fetched', 0)} catalog pages"
+    
+    logger.info(f"✅ Catalog item found: {context.catalog_item.get('name', context.catalog_item)}")
+
+
+@then('at least {count:d} catalog items should be read')
+def step_verify_catalog_item_count(context, count):
+    """Verify the number of items read across all catalog pages"""
+    actual = getattr(context, 'catalog_item_count', 0)
+    assert actual >= count, \
+        f"Expected at least {count} catalog items, read {actual} from {context.catalog_pages_fetched} pages"
+    
+    logger.info(f"✅ Read {actual} catalog items (min: {count})")
+
+
 @then('search response should have required fields')
 def step_verify_required_fields(context):
     """Verify search response contains required fields"""
-    response_json = context.response.json()
+    response_json = json_codec.parse_response(context.response)
     
     # Common fields to check (adjust based on actual API response)
     # This is a flexible check - we verify structure exists
@@ -6,7 +6,7 @@ This API processes utility payments for merchant transactions
 
 from behave import given, when, then
 import logging
-import json
+from utils import json_codec
 
 logger = logging.getLogger(__name__)
 
@@ -45,7 +45,7 @@ def step_have_utility_payment_body(context):
             "instrumentToken": instrument_token,  # Use dynamic token here
             "paymentMethod": config.get('utility_payment.payment_method', 'wallet'),
             "provider": config.get('utility_payment.provider', 'ecocash'),
-            "pin": config.get('utility_payment.encrypted_pin'),
+            "pin": context.pin_encryptor.next_pin(config.get('utility_payment.encrypted_pin')),
             "publicKeyAlias": config.get('utility_payment.public_key_alias', 'payment-links')
         },
         "subType": config.get('utility_payment.subtype', 'merchant-pay'),
@@ -66,7 +66,7 @@ def step_have_utility_payment_body(context):
         "notes": {}
     }
     
-    logger.info(f"Utility payment request body prepared: {json.dumps(context.utility_payment_body, indent=2)}")
+    logger.info(f"Utility payment request body prepared: {json_codec.dumps(context.utility_payment_body, indent=2)}")
 
 
 @given('I have fee amount {fee_amount:d}')
@@ -134,7 +134,7 @@ def step_have_payer_details(context):
         "instrumentToken": config.get('utility_payment.instrument_token'),
         "paymentMethod": "wallet",
         "provider": "ecocash",
-        "pin": config.get('utility_payment.encrypted_pin'),
+        "pin": context.pin_encryptor.next_pin(config.get('utility_payment.encrypted_pin')),
         "publicKeyAlias": "payment-links"
     }
     
@@ -321,7 +321,7 @@ def step_send_utility_payment_request(context, endpoint):
     
     # Log the request body being sent
     logger.info(f"📤 Sending utility payment request to {endpoint}")
-    logger.info(f"📦 Request Body: {json.dumps(body, indent=2)}")
+    logger.info(f"📦 Request Body: {json_codec.dumps(body, indent=2)}")
     
     # Handle malformed JSON case
     if hasattr(context, 'is_malformed_json') and context.is_malformed_json:
@@ -388,7 +388,7 @@ def step_verify_transaction_id(context):
     """
     Verify response contains transaction ID
     """
-    response_data = context.response.json()
+    response_data = json_codec.parse_response(context.response)
     
     # Check for transaction ID
     has_transaction_id = False
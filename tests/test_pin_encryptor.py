@@ -0,0 +1,94 @@
+"""
+Tests for the local RSA PIN encryptor in core/pin_encryptor.py, against a
+locally generated key pair.
+"""
+
+import base64
+import time
+
+import pytest
+
+pytest.importorskip('cryptography')
+
+from cryptography.hazmat.primitives import hashes, serialization
+from cryptography.hazmat.primitives.asymmetric import padding, rsa
+
+from core.logger import Logger
+from core.pin_encryptor import PinEncryptor
+
+PIN = '1234'
+STATIC_PIN = 'static-ciphertext'
+
+
+@pytest.fixture(scope='module', autouse=True)
+def _logging():
+    """Drain the log queue while pytest's captured stdout is still open."""
+    yield
+    Logger.shutdown()
+
+
+@pytest.fixture(scope='module')
+def private_key():
+    return rsa.generate_private_key(public_exponent=65537, key_size=2048)
+
+
+def _public_pem(private_key) -> str:
+    return private_key.public_key().public_bytes(
+        serialization.Encoding.PEM, serialization.PublicFormat.SubjectPublicKeyInfo
+    ).decode('ascii')
+
+
+def _public_base64_der(private_key) -> str:
+    der = private_key.public_key().public_bytes(
+        serialization.Encoding.DER, serialization.PublicFormat.SubjectPublicKeyInfo
+    )
+    return base64.b64encode(der).decode('ascii')
+
+
+def _decrypt(private_key, ciphertext: str, padding_name: str) -> str:
+    if padding_name == 'pkcs1v15':
+        scheme = padding.PKCS1v15()
+    else:
+        algorithm = hashes.SHA1() if padding_name == 'oaep-sha1' else hashes.SHA256()
+        scheme = padding.OAEP(mgf=padding.MGF1(algorithm=algorithm), algorithm=algorithm, label=None)
+    return private_key.decrypt(base64.b64decode(ciphertext), scheme).decode('utf-8')
+
+
+@pytest.mark.parametrize('padding_name', PinEncryptor.PADDINGS)
+def test_encrypt_decrypts_to_pin(private_key, padding_name):
+    encryptor = PinEncryptor({'enabled': True, 'public_key': _public_pem(private_key), 'padding': padding_name})
+    first, second = encryptor.encrypt(PIN), encryptor.encrypt(PIN)
+    assert first != second
+    assert _decrypt(private_key, first, padding_name) == PIN
+    assert _decrypt(private_key, second, padding_name) == PIN
+
+
+def test_bare_base64_key(private_key):
+    encryptor = PinEncryptor({'enabled': True, 'public_key': _public_base64_der(private_key)})
+    assert _decrypt(private_key, encryptor.next_pin(STATIC_PIN, pin=PIN), 'pkcs1v15') == PIN
+
+
+def test_disabled_returns_fallback(private_key, monkeypatch):
+    monkeypatch.setenv('PAYMENT_PIN', PIN)
+    assert PinEncryptor({'enabled': False, 'public_key': _public_pem(private_key)}).next_pin(STATIC_PIN) == STATIC_PIN
+    # Enabled without a key: static PINs keep working
+    assert PinEncryptor({'enabled': True}).next_pin(STATIC_PIN) == STATIC_PIN
+
+
+def test_next_pin_takes_pooled_ciphertexts(private_key, monkeypatch):
+    monkeypatch.setenv('PAYMENT_PIN', PIN)
+    encryptor = PinEncryptor({'enabled': True, 'public_key': _public_pem(private_key), 'pool_size': 4})
+    pool = encryptor._pools[PIN]
+    deadline = time.monotonic() + 10
+    while not pool.full() and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert pool.full()
+
+    # With the refill thread stopped, every PIN must come from the pool
+    encryptor.stop()
+    time.sleep(0.6)
+    pooled = pool.qsize()
+    monkeypatch.setattr(encryptor, 'encrypt', lambda pin: pytest.fail('PIN encrypted inline'))
+    pins = [encryptor.next_pin(STATIC_PIN) for _ in range(pooled)]
+    assert len(set(pins)) == pooled
+    assert all(_decrypt(private_key, pin, 'pkcs1v15') == PIN for pin in pins)
@@ -0,0 +1,108 @@
+"""
+Tests for the incremental JSON array reader and StreamingResponse in core/streaming.py.
+"""
+
+import io
+import json
+
+import pytest
+import requests
+
+from core.assertions import APIAssertions
+from core.logger import Logger
+from core.streaming import StreamingResponse, iter_json_array
+
+PAGE = {
+    'meta': {'page': 1, 'total': 3.5e2, 'next': None},
+    'data': {
+        'items': [
+            {'code': '156611', 'name': 'FAITH MINISTRIES “MABVUKU”', 'amount': 1.5, 'active': True},
+            {'code': '2', 'name': 'St. Mary\'s', 'amount': -12.25e-1, 'tags': [], 'rank': 10},
+            1.5, 1e5, -0.0, 123456789, True, False, None, 'plain', [1, [2.75]], {}
+        ]
+    }
+}
+
+
+@pytest.fixture(scope='module', autouse=True)
+def _logging():
+    """Drain the log queue while pytest's captured stdout is still open."""
+    yield
+    Logger.shutdown()
+
+
+def _split(data: bytes, *offsets: int):
+    """Cut a body into chunks at the given byte offsets."""
+    bounds = [0, *offsets, len(data)]
+    return [data[start:stop] for start, stop in zip(bounds, bounds[1:])]
+
+
+@pytest.mark.parametrize('separators', [(',', ':'), (', ', ': ')])
+def test_every_chunk_boundary(separators):
+    body = json.dumps(PAGE, separators=separators, ensure_ascii=False).encode('utf-8')
+    expected = PAGE['data']['items']
+    for offset in range(len(body) + 1):
+        assert list(iter_json_array(_split(body, offset), path='data.items')) == expected, offset
+
+
+def test_single_byte_chunks():
+    body = json.dumps(PAGE['data']['items']).encode('utf-8')
+    assert list(iter_json_array(body[i:i + 1] for i in range(len(body)))) == PAGE['data']['items']
+
+
+@pytest.mark.parametrize('chunks', [
+    [b'[1.', b'5, 3]'],
+    [b'[1e', b'5, 3]'],
+    [b'[1', b'.5, 3]'],
+    [b'[1.5', b'e1, 3]'],
+    [b'[-', b'1.5, 3]'],
+])
+def test_number_split_inside_token(chunks):
+    assert list(iter_json_array(chunks)) == json.loads(b''.join(chunks))
+
+
+def test_number_at_end_of_stream():
+    assert list(iter_json_array([b'[1, 2', b'5]'])) == [1, 25]
+
+
+def test_invalid_json_still_raises():
+    with pytest.raises(json.JSONDecodeError):
+        list(iter_json_array([b'[1x', b', 2]']))
+
+
+def _streamed(body: bytes, status: int = 200, chunk_size: int = 64) -> StreamingResponse:
+    """Wrap a body in a StreamingResponse as if it came from the network."""
+    response = requests.Response()
+    response.status_code = status
+    response.raw = io.BytesIO(body)
+    return StreamingResponse(response, chunk_size=chunk_size)
+
+
+def test_iter_items_keeps_no_body():
+    items = [{'code': str(i), 'name': 'x' * 50} for i in range(500)]
+    response = _streamed(json.dumps({'content': items}).encode('utf-8'))
+    assert sum(1 for _ in response.iter_items('content')) == len(items)
+    assert response._content is None
+    with pytest.raises(requests.exceptions.StreamConsumedError):
+        response.content
+
+
+def test_content_read_first_can_still_be_iterated():
+    response = _streamed(json.dumps({'content': [1, 2, 3]}).encode('utf-8'))
+    assert response.json() == {'content': [1, 2, 3]}
+    assert list(response.iter_items('content')) == [1, 2, 3]
+
+
+def test_assert_json_items_at_most_streamed():
+    body = json.dumps({'content': list(range(10))}).encode('utf-8')
+    APIAssertions(_streamed(body)).assert_json_items_at_most('content', 10)
+    with pytest.raises(AssertionError, match='at most 9 items'):
+        APIAssertions(_streamed(body)).assert_json_items_at_most('content', 9)
+
+
+def test_assert_json_items_at_most_missing_list():
+    body = json.dumps({'results': [1]}).encode('utf-8')
+    with pytest.raises(AssertionError, match="'content' not found"):
+        APIAssertions(_streamed(body)).assert_json_items_at_most('content', 5)
+    # Not required: same outcome as a buffered response without the list
+    APIAssertions(_streamed(body)).assert_json_items_at_most('content', 5, required=False)
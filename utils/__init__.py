@@ -2,8 +2,22 @@
 Initialize utils package.
 """
 
-from utils.config_loader import ConfigLoader
-from utils.data_generator import DataGenerator
+
+def __getattr__(name):
+    """
+    Import DataGenerator (and Faker, slow to import) only when it is used.
+
+    ConfigLoader is resolved lazily too: it imports core.logger, whose log
+    formatters use utils.json_codec, so an eager import would be circular.
+    """
+    if name == 'ConfigLoader':
+        from utils.config_loader import ConfigLoader
+        return ConfigLoader
+    if name == 'DataGenerator':
+        from utils.data_generator import DataGenerator
+        return DataGenerator
+    raise AttributeError(f"module 'utils' has no attribute '{name}'")
+
 
 __all__ = [
     'ConfigLoader',
@@ -2,53 +2,142 @@
 Configuration Loader Module
 Loads environment-specific configuration from YAML files.
 Supports multiple environments: dev, qa, uat, prod.
+
+Each ConfigLoader is scoped to one environment and layers its sources:
+config/base.yaml (optional) -> config/<env>.yaml -> environment variables ->
+explicit overrides (e.g. behave -D userdata).
 """
 
+import copy
+import hashlib
+import pickle
+import threading
 import yaml
 import os
 from pathlib import Path
-from typing import Any, Dict
+from typing import Any, Dict, Mapping, Optional
 from core.logger import Logger
 
 
+class FrozenDict(dict):
+    """
+    Read-only dict returned for configuration sections.
+    
+    Still a dict (JSON/requests accept it as-is); ``copy.copy`` and
+    ``copy.deepcopy`` return plain, mutable copies.
+    """
+    
+    def _readonly(self, *args, **kwargs):
+        raise TypeError("Configuration is read-only; use copy.deepcopy() for a mutable copy")
+    
+    __setitem__ = __delitem__ = __ior__ = _readonly
+    clear = pop = popitem = setdefault = update = _readonly
+    
+    def __copy__(self) -> Dict:
+        return dict(self)
+    
+    def __deepcopy__(self, memo) -> Dict:
+        return {key: copy.deepcopy(value, memo) for key, value in self.items()}
+    
+    def __reduce__(self):
+        return FrozenDict, (dict(self),)
+
+
+class FrozenList(list):
+    """Read-only list returned for configuration sequences (copies are plain lists)."""
+    
+    def _readonly(self, *args, **kwargs):
+        raise TypeError("Configuration is read-only; use copy.deepcopy() for a mutable copy")
+    
+    __setitem__ = __delitem__ = __iadd__ = __imul__ = _readonly
+    append = clear = extend = insert = pop = remove = reverse = sort = _readonly
+    
+    def __copy__(self) -> list:
+        return list(self)
+    
+    def __deepcopy__(self, memo) -> list:
+        return [copy.deepcopy(value, memo) for value in self]
+    
+    def __reduce__(self):
+        return FrozenList, (list(self),)
+
+
+# libyaml's C loader is several times faster than the pure-Python one
+_YAML_LOADER = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+
+# Compiled snapshots of parsed config files (CONFIG_CACHE=0 disables them)
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+SNAPSHOT_DIR = Path(os.getenv('CONFIG_CACHE_DIR', PROJECT_ROOT / '.cache' / 'config'))
+SNAPSHOT_VERSION = 1
+
+# CONFIG__API__TIMEOUT=60 overrides api.timeout in every environment,
+# CONFIG_QA__API__TIMEOUT=60 only in qa
+ENV_PREFIX = 'CONFIG'
+
+
+def _merge(base: Dict, override: Mapping) -> Dict:
+    """Deep-merge override into a (mutable) base dict; sections merge, other values replace."""
+    for key, value in override.items():
+        if isinstance(value, Mapping) and isinstance(base.get(key), dict):
+            _merge(base[key], value)
+        else:
+            base[key] = copy.deepcopy(value)
+    return base
+
+
+def _set_dotted(config: Dict, key: str, value: Any) -> None:
+    """Set a dotted key in a (mutable) config dict, creating sections as needed."""
+    *sections, leaf = key.split('.')
+    for section in sections:
+        if not isinstance(config.get(section), dict):
+            config[section] = {}
+        config = config[section]
+    config[leaf] = value
+
+
+def _freeze(value: Any) -> Any:
+    """Recursively convert parsed YAML into read-only containers."""
+    if isinstance(value, dict):
+        return FrozenDict((key, _freeze(item)) for key, item in value.items())
+    if isinstance(value, list):
+        return FrozenList(_freeze(item) for item in value)
+    return value
+
+
 class ConfigLoader:
     """
     Configuration loader for environment-specific settings.
-    Implements singleton pattern to ensure single config instance.
+    
+    Instances are independent, so one process can hold qa and uat
+    configurations side by side. ``get_instance`` returns a shared
+    instance per environment.
     """
     
-    _instance = None
-    _config = None
-    _environment = None
+    _instances = {}
+    _instances_lock = threading.Lock()
     
-    def __new__(cls, environment: str = 'qa'):
-        """
-        Singleton implementation.
-        
-        Args:
-            environment: Environment name (dev, qa, uat, prod)
-        """
-        if cls._instance is None:
-            cls._instance = super(ConfigLoader, cls).__new__(cls)
-        return cls._instance
+    _TRUE = ('true', 'yes', 'on', '1')
+    _FALSE = ('false', 'no', 'off', '0')
     
-    def __init__(self, environment: str = 'qa'):
+    def __init__(self, environment: str = 'qa', overrides: Optional[Mapping[str, Any]] = None):
         """
         Initialize configuration loader.
         
         Args:
             environment: Environment name (dev, qa, uat, prod)
+            overrides: Dotted keys overriding file and environment variable values
         """
-        if self._config is None or self._environment != environment:
-            self._environment = environment
-            self._load_config()
+        self._environment = environment
+        self._overrides = dict(overrides or {})
+        self._config = None
+        self._index = None
+        self._load_config()
     
     def _load_config(self) -> None:
-        """Load configuration from YAML file."""
-        # Determine config directory
-        current_dir = Path(__file__).resolve().parent.parent
-        config_dir = current_dir / 'config'
+        """Load configuration layers: base file, environment file, env vars, overrides."""
+        config_dir = PROJECT_ROOT / 'config'
         config_file = config_dir / f'{self._environment}.yaml'
+        base_file = config_dir / 'base.yaml'
         
         if not config_file.exists():
             raise FileNotFoundError(
@@ -56,12 +145,158 @@ class ConfigLoader:
                 f"Available environments: dev, qa, uat"
             )
         
-        with open(config_file, 'r') as f:
-            self._config = yaml.safe_load(f)
+        config, index = self._load_file(config_file)
+        overrides = {**self._env_overrides(), **self._overrides}
+        
+        # Layers are only merged when there is more than the environment file
+        if base_file.exists() or overrides:
+            merged = {}
+            if base_file.exists():
+                _merge(merged, self._load_file(base_file)[0])
+            _merge(merged, config)
+            for key, value in overrides.items():
+                _set_dotted(merged, key, value)
+            config = _freeze(merged)
+            index = self._build_index(config)
+        
+        # Swap both at once so concurrent readers never see a half-built index
+        self._config, self._index = config, index
         
         logger = Logger.get_logger(__name__)
         logger.info(f"Configuration loaded for environment: {self._environment}")
         logger.debug(f"Config file: {config_file}")
+        if overrides:
+            logger.debug(f"Config overrides: {sorted(overrides)}")
+    
+    def _env_overrides(self) -> Dict[str, Any]:
+        """
+        Collect overrides from CONFIG__* and CONFIG_<ENV>__* environment variables.
+        
+        Returns:
+            Dictionary of dotted key to YAML-typed value
+        """
+        shared_prefix = f'{ENV_PREFIX}__'
+        env_prefix = f'{ENV_PREFIX}_{self._environment.upper()}__'
+        shared, scoped = {}, {}
+        for name, raw in os.environ.items():
+            for prefix, target in ((shared_prefix, shared), (env_prefix, scoped)):
+                if name.startswith(prefix):
+                    key = name[len(prefix):].lower().replace('__', '.')
+                    target[key] = self.parse_value(raw)
+        return {**shared, **scoped}
+    
+    @staticmethod
+    def parse_value(raw: str) -> Any:
+        """
+        Type a string override the way YAML would ("60" -> 60, "true" -> True).
+        
+        Args:
+            raw: Override value from an environment variable or the command line
+            
+        Returns:
+            Typed value (the string itself if it is not a YAML scalar)
+        """
+        if not raw.strip():
+            return raw
+        try:
+            value = yaml.load(raw, Loader=_YAML_LOADER)
+        except yaml.YAMLError:
+            return raw
+        return raw if isinstance(value, (dict, list)) else value
+    
+    def _load_file(self, config_file: Path) -> tuple:
+        """
+        Parse one YAML file, reusing its compiled snapshot when current.
+        
+        Args:
+            config_file: YAML config file
+            
+        Returns:
+            Tuple of (frozen config tree, key index)
+        """
+        raw = config_file.read_bytes()
+        digest = hashlib.sha256(raw).hexdigest()
+        mtime = config_file.stat().st_mtime_ns
+        snapshot = self._read_snapshot(config_file, mtime, digest)
+        
+        if snapshot is None:
+            config = _freeze(yaml.load(raw, Loader=_YAML_LOADER) or {})
+            snapshot = (config, self._build_index(config))
+            self._write_snapshot(config_file, mtime, digest, snapshot)
+        return snapshot
+    
+    @staticmethod
+    def _snapshot_path(config_file: Path) -> Path:
+        """Snapshot file for a config file (keyed by its absolute path)."""
+        key = hashlib.sha256(str(config_file.resolve()).encode('utf-8')).hexdigest()[:16]
+        return SNAPSHOT_DIR / f'{config_file.stem}_{key}.pickle'
+    
+    @classmethod
+    def _read_snapshot(cls, config_file: Path, mtime: int, digest: str) -> Optional[tuple]:
+        """
+        Load the compiled snapshot of a config file if it is still current.
+        
+        Args:
+            config_file: YAML config file
+            mtime: File modification time (ns)
+            digest: SHA-256 of the file content
+            
+        Returns:
+            Tuple of (config tree, key index), or None if missing/stale
+        """
+        if os.getenv('CONFIG_CACHE', '1') == '0':
+            return None
+        try:
+            with open(cls._snapshot_path(config_file), 'rb') as f:
+                version, cached_mtime, cached_digest, snapshot = pickle.load(f)
+        except Exception:
+            return None
+        if version != SNAPSHOT_VERSION or cached_digest != digest:
+            return None
+        if cached_mtime != mtime:
+            # Touched but unchanged (e.g. fresh checkout): still valid
+            Logger.get_logger(__name__).debug(f"Config snapshot reused despite new mtime: {config_file}")
+        return snapshot
+    
+    @classmethod
+    def _write_snapshot(cls, config_file: Path, mtime: int, digest: str, snapshot: tuple) -> None:
+        """Store a compiled snapshot (best effort, written atomically)."""
+        if os.getenv('CONFIG_CACHE', '1') == '0':
+            return
+        path = cls._snapshot_path(config_file)
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            partial = path.with_name(f'{path.name}.{os.getpid()}.tmp')
+            with open(partial, 'wb') as f:
+                pickle.dump((SNAPSHOT_VERSION, mtime, digest, snapshot), f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(partial, path)
+        except OSError as e:
+            Logger.get_logger(__name__).debug(f"Config snapshot not written: {e}")
+    
+    @staticmethod
+    def _build_index(config: Dict) -> Dict[str, Any]:
+        """
+        Flatten the configuration into a dotted-key index.
+        
+        Every section is indexed too, so ``get('api')`` and
+        ``get('api.base_url')`` are both single dict lookups.
+        
+        Args:
+            config: Frozen configuration tree
+            
+        Returns:
+            Dictionary of dotted key to (read-only) value
+        """
+        index = {}
+        pending = [('', config)]
+        while pending:
+            prefix, section = pending.pop()
+            for key, value in section.items():
+                dotted = f"{prefix}{key}"
+                index[dotted] = value
+                if isinstance(value, dict):
+                    pending.append((f"{dotted}.", value))
+        return index
     
     def get(self, key: str, default: Any = None) -> Any:
         """
@@ -72,31 +307,73 @@ class ConfigLoader:
             default: Default value if key not found
             
         Returns:
-            Configuration value
+            Configuration value (sections and lists are read-only)
             
         Example:
             config.get('api.base_url')
             config.get('endpoints.payments.create')
         """
-        keys = key.split('.')
-        value = self._config
-        
-        for k in keys:
-            if isinstance(value, dict) and k in value:
-                value = value[k]
-            else:
-                return default
-        
-        return value
+        return self._index.get(key, default)
+    
+    def _typed(self, key: str, default: Any, convert) -> Any:
+        """Get a value converted with convert (default is returned unconverted)."""
+        value = self._index.get(key)
+        if value is None:
+            return default
+        try:
+            return convert(value)
+        except (TypeError, ValueError) as e:
+            raise ValueError(f"Configuration '{key}' has invalid value {value!r}: {e}") from None
+    
+    def get_str(self, key: str, default: Optional[str] = None) -> Optional[str]:
+        """Get a value as string."""
+        return self._typed(key, default, str)
+    
+    def get_int(self, key: str, default: Optional[int] = None) -> Optional[int]:
+        """Get a value as integer."""
+        return self._typed(key, default, int)
+    
+    def get_float(self, key: str, default: Optional[float] = None) -> Optional[float]:
+        """Get a value as float."""
+        return self._typed(key, default, float)
+    
+    def get_bool(self, key: str, default: Optional[bool] = None) -> Optional[bool]:
+        """Get a value as boolean (accepts true/false, yes/no, on/off, 1/0)."""
+        def convert(value):
+            if isinstance(value, bool):
+                return value
+            text = str(value).strip().lower()
+            if text in self._TRUE:
+                return True
+            if text in self._FALSE:
+                return False
+            raise ValueError("not a boolean")
+        return self._typed(key, default, convert)
+    
+    def get_list(self, key: str, default: Optional[list] = None) -> Optional[list]:
+        """Get a sequence value (read-only list)."""
+        def convert(value):
+            if not isinstance(value, list):
+                raise TypeError("not a list")
+            return value
+        return self._typed(key, default, convert)
+    
+    def get_dict(self, key: str, default: Optional[Dict] = None) -> Optional[Dict]:
+        """Get a section (read-only dict)."""
+        def convert(value):
+            if not isinstance(value, dict):
+                raise TypeError("not a section")
+            return value
+        return self._typed(key, default, convert)
     
     def get_all(self) -> Dict:
         """
         Get all configuration.
         
         Returns:
-            Complete configuration dictionary
+            Complete configuration dictionary (a mutable deep copy)
         """
-        return self._config.copy()
+        return copy.deepcopy(self._config)
     
     def get_environment(self) -> str:
         """
@@ -114,12 +391,32 @@ class ConfigLoader:
     @classmethod
     def get_instance(cls, environment: str = 'qa') -> 'ConfigLoader':
         """
-        Get ConfigLoader instance.
+        Get the shared ConfigLoader of an environment.
         
         Args:
             environment: Environment name
             
         Returns:
-            ConfigLoader instance
+            ConfigLoader instance (created on first use)
+        """
+        with cls._instances_lock:
+            if environment not in cls._instances:
+                cls._instances[environment] = cls(environment)
+            return cls._instances[environment]
+    
+    @staticmethod
+    def userdata_overrides(userdata: Mapping[str, str]) -> Dict[str, Any]:
+        """
+        Extract config overrides from behave userdata (-D api.timeout=60).
+        
+        Only dotted keys are treated as config keys, so plain userdata such
+        as ``env`` is left alone.
+        
+        Args:
+            userdata: behave ``context.config.userdata``
+            
+        Returns:
+            Dictionary of dotted key to typed value
         """
-        return cls(environment)
+        return {key: ConfigLoader.parse_value(value) if isinstance(value, str) else value
+                for key, value in userdata.items() if '.' in key}
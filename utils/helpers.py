@@ -4,7 +4,8 @@ Helper functions for common operations.
 
 import json
 from typing import Any, Dict, List
-from pathlib import Path
+from utils import json_codec
+from utils.payload_templates import PayloadTemplate
 
 
 def load_json_file(file_path: str) -> Dict:
@@ -17,8 +18,8 @@ def load_json_file(file_path: str) -> Dict:
     Returns:
         Dictionary from JSON file
     """
-    with open(file_path, 'r') as f:
-        return json.load(f)
+    with open(file_path, 'rb') as f:
+        return json_codec.loads(f.read())
 
 
 def save_json_file(data: Dict, file_path: str) -> None:
@@ -29,8 +30,8 @@ def save_json_file(data: Dict, file_path: str) -> None:
         data: Dictionary to save
         file_path: Path to save file
     """
-    with open(file_path, 'w') as f:
-        json.dump(data, f, indent=2)
+    with open(file_path, 'w', encoding='utf-8') as f:
+        f.write(json_codec.dumps(data, indent=2))
 
 
 def replace_placeholders(template: str, values: Dict[str, Any]) -> str:
@@ -55,6 +56,9 @@ def load_payload(payload_name: str, **replacements) -> Dict:
     """
     Load payload from payloads directory and replace placeholders.
     
+    The template is read and compiled once (see PayloadTemplate); each call
+    only copies it and fills the placeholder slots.
+    
     Args:
         payload_name: Name of payload file (without .json)
         **replacements: Values to replace in payload
@@ -62,20 +66,7 @@ def load_payload(payload_name: str, **replacements) -> Dict:
     Returns:
         Payload dictionary with replaced values
     """
-    payload_dir = Path(__file__).resolve().parent.parent / 'payloads'
-    payload_file = payload_dir / f'{payload_name}.json'
-    
-    if not payload_file.exists():
-        raise FileNotFoundError(f"Payload file not found: {payload_file}")
-    
-    with open(payload_file, 'r') as f:
-        template = f.read()
-    
-    # Replace placeholders if any
-    if replacements:
-        template = replace_placeholders(template, replacements)
-    
-    return json.loads(template)
+    return PayloadTemplate.load(payload_name).render(**replacements)
 
 
 def flatten_dict(d: Dict, parent_key: str = '', sep: str = '.') -> Dict:
@@ -196,7 +187,7 @@ def is_valid_json(text: str) -> bool:
         True if valid JSON
     """
     try:
-        json.loads(text)
+        json_codec.loads(text)
         return True
     except (ValueError, TypeError):
         return False
@@ -0,0 +1,181 @@
+"""
+JSON Codec Module
+Pluggable JSON encoder/decoder used for request bodies, response parsing and
+logging. Uses orjson or msgspec when installed and falls back to the standard
+library otherwise. Set ``JSON_CODEC=orjson|msgspec|stdlib`` to force a backend.
+"""
+
+import json
+import os
+from typing import Any, Callable, Dict, Optional, Union
+
+# orjson.JSONDecodeError already subclasses this; other backends are wrapped
+JSONDecodeError = json.JSONDecodeError
+
+
+def _stdlib_backend() -> Dict[str, Callable]:
+    """Standard library backend (always available)."""
+    def dumps_bytes(obj: Any, default: Optional[Callable] = None) -> bytes:
+        return json.dumps(obj, separators=(',', ':'), ensure_ascii=False, allow_nan=False,
+                          default=default).encode('utf-8')
+
+    def dumps_indent(obj: Any) -> str:
+        return json.dumps(obj, indent=2, ensure_ascii=False)
+
+    return {'dumps_bytes': dumps_bytes, 'dumps_indent': dumps_indent, 'loads': json.loads}
+
+
+def _orjson_backend() -> Dict[str, Callable]:
+    """orjson backend (Rust, returns bytes)."""
+    import orjson
+
+    def dumps_bytes(obj: Any, default: Optional[Callable] = None) -> bytes:
+        return orjson.dumps(obj, default=default)
+
+    def dumps_indent(obj: Any) -> str:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode('utf-8')
+
+    return {'dumps_bytes': dumps_bytes, 'dumps_indent': dumps_indent, 'loads': orjson.loads}
+
+
+def _msgspec_backend() -> Dict[str, Callable]:
+    """msgspec backend (C, returns bytes)."""
+    import msgspec
+
+    encoder = msgspec.json.Encoder()
+    decoder = msgspec.json.Decoder()
+
+    def dumps_bytes(obj: Any, default: Optional[Callable] = None) -> bytes:
+        if default is None:
+            return encoder.encode(obj)
+        return msgspec.json.encode(obj, enc_hook=default)
+
+    def dumps_indent(obj: Any) -> str:
+        return msgspec.json.format(encoder.encode(obj), indent=2).decode('utf-8')
+
+    def loads(data: Union[bytes, str]) -> Any:
+        try:
+            return decoder.decode(data)
+        except msgspec.DecodeError as e:
+            doc = data.decode('utf-8', 'replace') if isinstance(data, bytes) else data
+            raise JSONDecodeError(str(e), doc, 0) from None
+
+    return {'dumps_bytes': dumps_bytes, 'dumps_indent': dumps_indent, 'loads': loads}
+
+
+_BACKENDS = {
+    'orjson': _orjson_backend,
+    'msgspec': _msgspec_backend,
+    'stdlib': _stdlib_backend,
+}
+
+_stdlib = _stdlib_backend()
+_active: Dict[str, Callable] = _stdlib
+_active_name = 'stdlib'
+
+
+def set_backend(name: Optional[str] = None) -> str:
+    """
+    Select the JSON backend.
+
+    Args:
+        name: 'orjson', 'msgspec' or 'stdlib'; None picks the fastest installed
+
+    Returns:
+        Name of the backend in use
+    """
+    global _active, _active_name
+
+    candidates = [name] if name else ['orjson', 'msgspec', 'stdlib']
+    for candidate in candidates:
+        if candidate not in _BACKENDS:
+            raise ValueError(f"Unknown JSON codec '{candidate}'. Available: {list(_BACKENDS)}")
+        try:
+            _active = _BACKENDS[candidate]()
+            _active_name = candidate
+            return _active_name
+        except ImportError:
+            if name:
+                raise
+    return _active_name
+
+
+def backend() -> str:
+    """Name of the active backend."""
+    return _active_name
+
+
+def dumps_bytes(obj: Any, default: Optional[Callable] = None) -> bytes:
+    """
+    Serialize to compact UTF-8 JSON, e.g. for a request body.
+
+    Args:
+        obj: Object to serialize
+        default: Called with objects the backend cannot serialize; returns a serializable value
+
+    Returns:
+        Encoded JSON
+    """
+    try:
+        return _active['dumps_bytes'](obj, default)
+    except TypeError:
+        # Non-string keys, Decimal, subclasses etc. - let stdlib try (or raise)
+        return _stdlib['dumps_bytes'](obj, default)
+
+
+def dumps(obj: Any, indent: Optional[int] = None, default: Optional[Callable] = None) -> str:
+    """
+    Serialize to a JSON string.
+
+    Args:
+        obj: Object to serialize
+        indent: Pretty-print indentation (fast backends support 2)
+        default: Called with objects the backend cannot serialize; returns a serializable value
+
+    Returns:
+        JSON string
+    """
+    try:
+        if indent is None:
+            return _active['dumps_bytes'](obj, default).decode('utf-8')
+        if indent == 2:
+            return _active['dumps_indent'](obj)
+    except (TypeError, ValueError):
+        # Unsupported types, or NaN/Infinity rejected by the compact stdlib encoder
+        pass
+    return json.dumps(obj, indent=indent, ensure_ascii=False, default=default or str)
+
+
+def loads(data: Union[bytes, bytearray, str]) -> Any:
+    """
+    Parse JSON.
+
+    Args:
+        data: JSON document as bytes or str
+
+    Returns:
+        Parsed object
+
+    Raises:
+        JSONDecodeError: If the document is not valid JSON
+    """
+    return _active['loads'](data)
+
+
+def parse_response(response) -> Any:
+    """
+    Parse a requests.Response body with the active backend.
+
+    Args:
+        response: requests.Response object
+
+    Returns:
+        Parsed body
+
+    Raises:
+        JSONDecodeError: If the body is not valid JSON
+    """
+    return _active['loads'](response.content)
+
+
+set_backend(os.getenv('JSON_CODEC') or None)
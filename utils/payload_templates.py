@@ -0,0 +1,218 @@
+"""
+Payload Templates Module
+Compiles JSON payload templates from the payloads directory once and renders
+them through a fast copy-and-fill, either as fresh dictionaries for steps or
+as pre-serialized bytes for load tests.
+"""
+
+import json
+import re
+import threading
+from json.encoder import encode_basestring
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Tuple, Union
+
+from utils import json_codec
+
+PAYLOAD_DIR = Path(__file__).resolve().parent.parent / 'payloads'
+
+# "{{name}}" or "{{name:type}}"
+_PLACEHOLDER = re.compile(r'\{\{\s*(\w+)(?::(\w+))?\s*\}\}')
+
+
+def _keep_none(convert: Callable[[Any], Any]) -> Callable[[Any], Any]:
+    """Let None through a converter, so a missing value renders as JSON null."""
+    return lambda v: v if v is None else convert(v)
+
+
+_CONVERTERS: Dict[str, Callable[[Any], Any]] = {
+    'str': _keep_none(str),
+    'int': _keep_none(int),
+    'float': _keep_none(float),
+    'bool': _keep_none(lambda v: v if isinstance(v, bool) else str(v).lower() in ('1', 'true', 'yes')),
+    'any': lambda v: v,
+}
+
+
+def _encode_value(value: Any) -> str:
+    """Serialize a slot value, skipping json.dumps for the common scalar types."""
+    if isinstance(value, str):
+        return encode_basestring(value)
+    if isinstance(value, bool) or value is None:
+        return 'true' if value is True else 'false' if value is False else 'null'
+    if isinstance(value, int):
+        return int.__repr__(value)
+    if isinstance(value, float) and value == value and value not in (float('inf'), float('-inf')):
+        return float.__repr__(value)
+    return json_codec.dumps(value)
+
+
+class PayloadTemplate:
+    """
+    Precompiled JSON payload template with placeholder slots.
+
+    A string value that consists of a single placeholder is a typed slot:
+    ``"{{amount:float}}"`` is replaced by ``float(amount)`` and an untyped
+    ``"{{amount}}"`` keeps the value exactly as passed. Placeholders embedded in
+    longer strings (``"Order {{order_id}}"``) are interpolated as text.
+    Placeholders without a value are left unchanged.
+
+    Example:
+        template = PayloadTemplate.load('church_payment')
+        payload = template.render(amount=2.0, instrument_token=token)
+        body = template.render_bytes(amount=2.0, instrument_token=token)
+    """
+
+    _cache: Dict[str, 'PayloadTemplate'] = {}
+    _cache_lock = threading.Lock()
+
+    def __init__(self, template: Union[Dict, List], name: str = '<inline>'):
+        """
+        Compile a parsed JSON template.
+
+        Args:
+            template: Parsed template (dict or list)
+            name: Template name used in error messages
+        """
+        self.name = name
+        self.slots: Dict[str, str] = {}
+        self._build = self._compile(template)
+        self._chunks = self._compile_serialized(template)
+
+    @classmethod
+    def load(cls, payload_name: str) -> 'PayloadTemplate':
+        """
+        Load and compile a template from the payloads directory (cached).
+
+        Args:
+            payload_name: Name of payload file (without .json)
+
+        Returns:
+            Compiled PayloadTemplate
+        """
+        template = cls._cache.get(payload_name)
+        if template is not None:
+            return template
+
+        payload_file = PAYLOAD_DIR / f'{payload_name}.json'
+        if not payload_file.exists():
+            raise FileNotFoundError(f"Payload file not found: {payload_file}")
+
+        with open(payload_file, 'rb') as f:
+            template = cls(json_codec.loads(f.read()), payload_name)
+
+        with cls._cache_lock:
+            return cls._cache.setdefault(payload_name, template)
+
+    @staticmethod
+    def _convert(name: str, type_name: str, values: Dict[str, Any]) -> Any:
+        """Apply the slot's type conversion to a provided value."""
+        return _CONVERTERS[type_name](values[name])
+
+    def _register(self, name: str, type_name: str) -> str:
+        """Record a slot and validate its type."""
+        type_name = type_name or 'any'
+        if type_name not in _CONVERTERS:
+            raise ValueError(f"Unknown placeholder type '{type_name}' for '{name}' in {self.name}")
+        self.slots.setdefault(name, type_name)
+        return type_name
+
+    def _compile(self, node: Any) -> Callable[[Dict[str, Any]], Any]:
+        """Compile a template node into a builder function."""
+        if isinstance(node, dict):
+            items = [(key, self._compile(value)) for key, value in node.items()]
+            return lambda values: {key: build(values) for key, build in items}
+
+        if isinstance(node, list):
+            builders = [self._compile(value) for value in node]
+            return lambda values: [build(values) for build in builders]
+
+        if isinstance(node, str) and '{{' in node:
+            match = _PLACEHOLDER.fullmatch(node)
+            if match:
+                name = match.group(1)
+                type_name = self._register(name, match.group(2))
+                return lambda values: self._convert(name, type_name, values) if name in values else node
+
+            for match in _PLACEHOLDER.finditer(node):
+                self._register(match.group(1), match.group(2))
+
+            def interpolate(values, text=node):
+                return _PLACEHOLDER.sub(
+                    lambda m: str(values[m.group(1)]) if m.group(1) in values else m.group(0), text
+                )
+            return interpolate
+
+        return lambda values: node
+
+    def _compile_serialized(self, template: Any) -> List[Union[str, Tuple]]:
+        """
+        Pre-serialize the template into literal chunks and slot markers.
+
+        Slot markers are ``(name, type, quoted, original)`` tuples: quoted slots
+        replace a whole JSON string, unquoted ones are inside a string literal.
+        """
+        markers: List[Tuple[str, str, bool, str]] = []
+
+        def mark(node):
+            if isinstance(node, dict):
+                return {key: mark(value) for key, value in node.items()}
+            if isinstance(node, list):
+                return [mark(value) for value in node]
+            if isinstance(node, str) and '{{' in node:
+                quoted = _PLACEHOLDER.fullmatch(node) is not None
+
+                def sentinel(match):
+                    markers.append((match.group(1), match.group(2) or 'any', quoted, match.group(0)))
+                    return f'\x00{len(markers) - 1}\x00'
+                return _PLACEHOLDER.sub(sentinel, node)
+            return node
+
+        text = json.dumps(mark(template), separators=(',', ':'), ensure_ascii=False)
+        chunks: List[Union[str, Tuple]] = []
+        position = 0
+        for match in re.finditer(r'\\u0000(\d+)\\u0000', text):
+            marker = markers[int(match.group(1))]
+            quoted = marker[2]
+            # Whole-string slots replace the surrounding quotes as well
+            chunks.append(text[position:match.start() - 1 if quoted else match.start()])
+            chunks.append(marker)
+            position = match.end() + 1 if quoted else match.end()
+        chunks.append(text[position:])
+        return [chunk for chunk in chunks if chunk != '']
+
+    def render(self, **values) -> Union[Dict, List]:
+        """
+        Produce a fresh payload with placeholder slots filled.
+
+        Args:
+            **values: Placeholder values
+
+        Returns:
+            New payload (safe to mutate)
+        """
+        return self._build(values)
+
+    def render_bytes(self, **values) -> bytes:
+        """
+        Produce the compact JSON body directly, without building a dict.
+
+        Args:
+            **values: Placeholder values
+
+        Returns:
+            UTF-8 encoded JSON body
+        """
+        parts = []
+        for chunk in self._chunks:
+            if isinstance(chunk, str):
+                parts.append(chunk)
+                continue
+            name, type_name, quoted, original = chunk
+            if quoted:
+                value = self._convert(name, type_name, values) if name in values else original
+                parts.append(_encode_value(value))
+            else:
+                text = str(values[name]) if name in values else original
+                parts.append(encode_basestring(text)[1:-1])
+        return ''.join(parts).encode('utf-8')
@@ -3,11 +3,10 @@ Schema Validator Utility
 Loads and validates JSON schemas for contract testing.
 """
 
-import json
 from pathlib import Path
 from typing import Dict
-from jsonschema import validate, ValidationError
 from core.logger import Logger
+from utils import json_codec
 
 
 class SchemaValidator:
@@ -31,8 +30,8 @@ class SchemaValidator:
         
         for schema_file in schema_dir.glob('*.json'):
             schema_name = schema_file.stem
-            with open(schema_file, 'r') as f:
-                self.schemas[schema_name] = json.load(f)
+            with open(schema_file, 'rb') as f:
+                self.schemas[schema_name] = json_codec.loads(f.read())
             self.logger.debug(f"Loaded schema: {schema_name}")
     
     def validate(self, data: Dict, schema_name: str) -> bool:
@@ -59,6 +58,9 @@ class SchemaValidator:
         
         schema = self.schemas[schema_name]
         
+        # Imported on first use - jsonschema is slow to import
+        from jsonschema import validate, ValidationError
+        
         try:
             validate(instance=data, schema=schema)
             self.logger.info(f"✅ Schema validation passed: {schema_name}")